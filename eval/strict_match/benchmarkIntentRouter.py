@@ -0,0 +1,135 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import statistics
+import time
+from pathlib import Path
+
+import fire
+from tabulate import tabulate
+
+from jira_agent.common.intent_router import (
+    IntentRouter,
+    TfidfClassifier,
+    load_dataset,
+    training_examples,
+)
+
+DEFAULT_DATASET = Path(__file__).resolve().parent / "strict_match_dataset.yaml"
+SUPERVISOR = "jira_supervisor"
+
+
+def expected_route(agents):
+    # Requests needing several agents have to go through the supervisor
+    return agents[0] if len(agents) == 1 else SUPERVISOR
+
+
+def leave_one_out_router(texts, labels, prompt, threshold):
+    """Train the classifier without `prompt`, so it is not scored on its own training data."""
+    kept = [(text, label) for text, label in zip(texts, labels) if text != prompt]
+    classifier = TfidfClassifier().fit([text for text, _ in kept], [label for _, label in kept])
+    return IntentRouter(threshold, classifier)
+
+
+def measure_supervisor_hop(prompts):
+    """Time one supervisor LLM call per prompt, i.e. the hop a routed request saves."""
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from langgraph_supervisor.handoff import create_handoff_tool
+
+    from jira_agent.agents.supervisor_agent.prompt import prompt as supervisor_prompt
+    from jira_agent.common.llm import get_llm
+
+    tools = [create_handoff_tool(agent_name=name) for name in ("jira_projects_agent", "jira_issues_agent")]
+    model = get_llm().bind_tools(tools)
+    system_message = SystemMessage(content=supervisor_prompt.format(additional_context=""))
+    timings = []
+    for prompt in prompts:
+        start = time.perf_counter()
+        model.invoke([system_message, HumanMessage(content=prompt)])
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(timings)
+
+
+def benchmark(dataset=str(DEFAULT_DATASET), threshold=0.85, measure_supervisor=False, supervisor_hop_ms=None):
+    """
+    Report the routing accuracy of the intent router on the strict match dataset and the latency it saves.
+
+    A routed request saves one supervisor LLM call; a misrouted one still costs the sub-agent turn.
+    `hybrid` is the shipped classifier, trained on the seed prompts only, so the dataset is unseen data.
+    `hybrid+dataset` also trains on the dataset (as `JIRA_AGENT_INTENT_ROUTING_DATASET` does),
+    leaving each prompt out of its own training set.
+
+    Args:
+        dataset: The strict match dataset.
+        threshold: The routing confidence threshold.
+        measure_supervisor: Time a supervisor LLM call per prompt (needs the LLM settings).
+        supervisor_hop_ms: Supervisor LLM latency to assume instead of measuring it.
+    """
+    examples = load_dataset(dataset)
+    if not examples:
+        print(f"No prompts found in {dataset}")
+        return
+    seed_router = IntentRouter(threshold, TfidfClassifier().fit(*training_examples()))
+    texts, labels = training_examples(Path(dataset))
+    routers = {
+        "rules": lambda prompt: IntentRouter(threshold),
+        "hybrid": lambda prompt: seed_router,
+        "hybrid+dataset": lambda prompt: leave_one_out_router(texts, labels, prompt, threshold),
+    }
+
+    hop_ms = supervisor_hop_ms
+    if measure_supervisor:
+        hop_ms = measure_supervisor_hop([prompt for prompt, _ in examples])
+
+    rows, details = [], []
+    for mode, build_router in routers.items():
+        routed = correct = misrouted = 0
+        timings = []
+        for prompt, agents in examples:
+            router = build_router(prompt)
+            start = time.perf_counter()
+            agent, source = router.decide(prompt)
+            timings.append((time.perf_counter() - start) * 1e6)
+            expected = expected_route(agents)
+            if agent is not None:
+                routed += 1
+                correct += agent == expected
+                misrouted += agent != expected
+            details.append([mode, prompt[:80], expected, agent or SUPERVISOR, source])
+        total = len(examples)
+        saved = f"{routed * hop_ms / total:.0f}" if hop_ms is not None else "n/a"
+        rows.append([
+            mode,
+            f"{routed / total:.0%}",
+            f"{correct / routed:.0%}" if routed else "n/a",
+            misrouted,
+            f"{statistics.mean(timings):.0f}",
+            saved,
+        ])
+
+    print(tabulate(details, headers=["Mode", "Prompt", "Expected", "Routed to", "Decided by"], tablefmt="github"))
+    print()
+    print(tabulate(rows, headers=[
+        "Mode", "Routed without supervisor", "Routing accuracy", "Misrouted", "Decision (us)", "Saved per request (ms)",
+    ], tablefmt="github"))
+    if hop_ms is not None:
+        print(f"\nSupervisor LLM hop: {hop_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    # python eval/strict_match/benchmarkIntentRouter.py --supervisor_hop_ms 1200
+    fire.Fire(benchmark)
@@ -4,9 +4,16 @@ import yaml
 from collections import defaultdict
 from dotenv import load_dotenv
 import json
+import os
 
 def main(config_file, **kwargs):
         load_dotenv()
+        # Reference trajectories send every request through the supervisor
+        os.environ["JIRA_AGENT_INTENT_ROUTING"] = "none"
+        # and end with a final supervisor turn
+        os.environ["JIRA_AGENT_SUPERVISOR_ROUTING"] = "supervisor"
+        # with sub-agent answers built by generate_structured_response
+        os.environ["JIRA_AGENT_RESPONSE_FINALIZATION"] = "llm"
         graph = JiraGraph()
         config = yaml.safe_load(open(config_file))
         filename = config['FILEPATH']
@@ -40,6 +40,14 @@ import fire
 
 # load environment variables from .env file
 load_dotenv()
+# The reference trajectories send every request through the supervisor
+os.environ["JIRA_AGENT_INTENT_ROUTING"] = "none"
+# and end with a final supervisor turn
+os.environ["JIRA_AGENT_SUPERVISOR_ROUTING"] = "supervisor"
+# with sub-agent answers built by generate_structured_response
+os.environ["JIRA_AGENT_RESPONSE_FINALIZATION"] = "llm"
+# Trajectories are read back from the thread's checkpoint history
+os.environ["JIRA_AGENT_CHECKPOINTER"] = "memory"
 
 
 def verify_llm_settings_for_strict_eval():
@@ -14,9 +14,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from langgraph.prebuilt import create_react_agent
-
-from jira_agent.common.llm import get_llm
+from jira_agent.common.react_agent import create_jira_react_agent
 
 from .models import LLMResponseOutput
 from .tools import TOOLS
@@ -29,9 +27,8 @@ class IssuesAgent:
     self.prompt = prompt.format(additional_context="")
 
   def agent(self):
-    agent = create_react_agent(
+    agent = create_jira_react_agent(
       name=self.name,
-      model=get_llm(),
       tools=self.tools,
       prompt=self.prompt,
       response_format=LLMResponseOutput
@@ -24,6 +24,7 @@ Only use the tools available.
 1. You can only handle Jira issues
 2. **Issues**: An issue is a single unit of work within a project. Issues can be of different types such as bug, task, etc.
 3. Projects and epics are not issues. They are higher-level containers for issues.
+4. When the same operation applies to several issues, use the bulk tools once instead of calling a single-issue tool per issue.
 Given the following context, provide a concise and actionable response.
 {additional_context}
 """
@@ -14,7 +14,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Callable, List
+from typing import List
+
+from langchain_core.tools import BaseTool, StructuredTool
 
 from .issues import (
   create_jira_issue,
@@ -22,31 +24,57 @@ from .issues import (
   update_issue_reporter,
   add_new_label_to_issue,
   get_jira_issue_details,
+  acreate_jira_issue,
+  aassign_jira,
+  aupdate_issue_reporter,
+  aadd_new_label_to_issue,
+  aget_jira_issue_details,
   _get_account_id_from_email,
-  _create_jira_urlified_list,
 )
 
 from .transitions import (
   perform_jira_transition,
-  get_jira_transitions
+  get_jira_transitions,
+  aperform_jira_transition,
+  aget_jira_transitions,
 )
 
 from .search import (
-  search_jira_issues_using_jql
+  search_jira_issues_using_jql,
+  asearch_jira_issues_using_jql,
 )
 
-TOOLS: List[Callable[..., Any]] = [
-  create_jira_issue,
-  assign_jira,
-  update_issue_reporter,
-  add_new_label_to_issue,
-  get_jira_issue_details,
-  perform_jira_transition,
-  get_jira_transitions,
-  search_jira_issues_using_jql
+from .bulk import (
+  bulk_create_jira_issues,
+  bulk_add_label_to_issues,
+  bulk_assign_jira_issues,
+  bulk_transition_jira_issues,
+  abulk_create_jira_issues,
+  abulk_add_label_to_issues,
+  abulk_assign_jira_issues,
+  abulk_transition_jira_issues,
+  update_jira_issues_field,
+  aupdate_jira_issues_field,
+)
+
+# Each tool carries a sync and an async implementation; the react agent uses the
+# coroutine when the graph is run with `ainvoke`/`astream`.
+TOOLS: List[BaseTool] = [
+  StructuredTool.from_function(func=create_jira_issue, coroutine=acreate_jira_issue),
+  StructuredTool.from_function(func=assign_jira, coroutine=aassign_jira),
+  StructuredTool.from_function(func=update_issue_reporter, coroutine=aupdate_issue_reporter),
+  StructuredTool.from_function(func=add_new_label_to_issue, coroutine=aadd_new_label_to_issue),
+  StructuredTool.from_function(func=get_jira_issue_details, coroutine=aget_jira_issue_details),
+  StructuredTool.from_function(func=perform_jira_transition, coroutine=aperform_jira_transition),
+  StructuredTool.from_function(func=get_jira_transitions, coroutine=aget_jira_transitions),
+  StructuredTool.from_function(func=search_jira_issues_using_jql, coroutine=asearch_jira_issues_using_jql),
+  StructuredTool.from_function(func=bulk_create_jira_issues, coroutine=abulk_create_jira_issues),
+  StructuredTool.from_function(func=bulk_add_label_to_issues, coroutine=abulk_add_label_to_issues),
+  StructuredTool.from_function(func=bulk_assign_jira_issues, coroutine=abulk_assign_jira_issues),
+  StructuredTool.from_function(func=bulk_transition_jira_issues, coroutine=abulk_transition_jira_issues),
+  StructuredTool.from_function(func=update_jira_issues_field, coroutine=aupdate_jira_issues_field),
 ]
 
 __all__ = [
   "_get_account_id_from_email",
-  "_create_jira_urlified_list",
 ]
\ No newline at end of file
@@ -0,0 +1,426 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, List, Optional
+
+from jira_agent.agents.issues_agent.models import CreateJiraIssueInput, LLMResponseOutput
+from jira_agent.common.config import INTERNAL_ERROR_MESSAGE
+from jira_agent.utils.concurrency import CallResult, amap_calls, map_calls
+from jira_agent.utils.dryrun_utils import dryrun_response
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.codec import decode_response
+from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.tool_output import encode_tool_output
+
+from .dryrun.mock_responses import (
+  MOCK_ASSIGN_JIRA_RESPONSE,
+  MOCK_BULK_CREATE_JIRA_ISSUES_RESPONSE,
+  MOCK_UPDATE_ISSUE_FIELD_RESPONSE,
+)
+from .field_updates import (
+  WATCHERS,
+  _aupdate_issue_field,
+  _aupdate_issue_watchers,
+  _check_field,
+  _raise_unless_no_content,
+  _update_issue_field,
+  _update_issue_watchers,
+)
+from .issues import (
+  _aadd_new_label_to_issue,
+  _add_new_label_to_issue,
+  _aget_account_id_from_email,
+  _alookup_create_inputs,
+  _build_issue_fields,
+  _get_account_id_from_email,
+  _lookup_create_inputs,
+  _urlify_jira_issue_id,
+)
+from .transitions import _aperform_jira_transition, _perform_jira_transition
+
+# Jira accepts at most 50 issues per bulk create request
+BULK_CREATE_CHUNK_SIZE = 50
+
+
+def _bulk_concurrency() -> int:
+  """Return how many per-issue requests a bulk operation may run at once."""
+  if os.getenv("DRYRUN") == "true":
+    return 1
+  JiraRESTClient.get_auth_instance()
+  return JiraRESTClient._config.JIRA_BULK_MAX_CONCURRENCY
+
+def _outcome(item: str, ok: bool, detail: str) -> dict:
+  return {'item': item, 'ok': ok, 'result' if ok else 'error': detail}
+
+def _fan_out(func: Callable[[str], Any], items: List[str]) -> List[dict]:
+  """Run `func` on every item concurrently, collecting one outcome per item."""
+  results = map_calls(func, items, max_workers=_bulk_concurrency())
+  return [_result_outcome(item, result) for item, result in zip(items, results)]
+
+async def _afan_out(func: Callable[[str], Awaitable[Any]], items: List[str]) -> List[dict]:
+  """Async variant of `_fan_out`."""
+  results = await amap_calls(func, items, limit=_bulk_concurrency())
+  return [_result_outcome(item, result) for item, result in zip(items, results)]
+
+def _result_outcome(item: str, result: CallResult) -> dict:
+  return _outcome(item, True, str(result.value)) if result.ok else _outcome(item, False, str(result.error))
+
+def _bulk_response(operation: str, outcomes: List[dict]) -> LLMResponseOutput:
+  """Aggregate per-item outcomes into a single tool response."""
+  succeeded = sum(1 for outcome in outcomes if outcome['ok'])
+  summary = f"{operation}: {succeeded} of {len(outcomes)} succeeded"
+  logging.info(summary)
+  return LLMResponseOutput(response=encode_tool_output(
+    "bulk_jira_issues", outcomes, prefix=summary,
+    baseline=json.dumps({'summary': summary, 'results': outcomes}, indent=2),
+  ))
+
+def _bulk_create_payload(chunk: List[tuple[int, dict]]) -> dict:
+  return {'issueUpdates': [{'fields': fields} for _, fields in chunk]}
+
+def _apply_bulk_create_response(
+        issues: List[CreateJiraIssueInput],
+        chunk: List[tuple[int, dict]],
+        response,
+        outcomes: List[dict | None]
+):
+  """
+  Record the outcome of every issue of a bulk create request.
+
+  Jira lists created issues in request order and reports failures by their
+  position in the request, so both are mapped back to the caller's items.
+  A body that is not JSON (e.g. a proxy error page) fails the whole chunk
+  with its status and text, without losing the outcomes of earlier chunks.
+  """
+  try:
+    body = decode_response(response) or {}
+  except ValueError:
+    body = {}
+  failed = {error['failedElementNumber']: error for error in body.get('errors', [])}
+  created = iter(body.get('issues', []))
+  for position, (index, _) in enumerate(chunk):
+    item = issues[index].summary
+    if position in failed:
+      outcomes[index] = _outcome(item, False, json.dumps(failed[position].get('elementErrors', {})))
+      continue
+    issue = next(created, None)
+    if issue is None:
+      outcomes[index] = _outcome(item, False, f"Status code: {response.status_code}, Response: {response.text}")
+    else:
+      outcomes[index] = _outcome(item, True, _urlify_jira_issue_id(issue['key']))
+
+def _validated_issue_type(input_data: CreateJiraIssueInput, supported_issue_types: list[str]):
+  if input_data.issue_type not in supported_issue_types:
+    raise ValueError(f"Unsupported issue type: {input_data.issue_type}. Supported issue types are: {supported_issue_types}")
+
+def _prepare_bulk_issue(input_data: CreateJiraIssueInput) -> dict:
+  supported_issue_types, assignee_id = _lookup_create_inputs(input_data)
+  _validated_issue_type(input_data, supported_issue_types)
+  return _build_issue_fields(input_data, assignee_id)
+
+async def _aprepare_bulk_issue(input_data: CreateJiraIssueInput) -> dict:
+  supported_issue_types, assignee_id = await _alookup_create_inputs(input_data)
+  _validated_issue_type(input_data, supported_issue_types)
+  return _build_issue_fields(input_data, assignee_id)
+
+def _collect_prepared(
+        issues: List[CreateJiraIssueInput],
+        prepared: List[CallResult],
+        outcomes: List[dict | None]
+) -> List[tuple[int, dict]]:
+  """Record the issues that failed preparation and return the (index, fields) of the others."""
+  pending = []
+  for index, (input_data, result) in enumerate(zip(issues, prepared)):
+    if result.ok:
+      pending.append((index, result.value))
+    else:
+      outcomes[index] = _outcome(input_data.summary, False, str(result.error))
+  return pending
+
+@dryrun_response(MOCK_BULK_CREATE_JIRA_ISSUES_RESPONSE)
+def _bulk_create_jira_issues(issues: List[CreateJiraIssueInput]) -> List[dict]:
+  """
+  Create several Jira issues with the bulk create endpoint.
+
+  Issue types are checked and assignees resolved up front (both cached and
+  looked up concurrently), so an invalid item fails on its own without being
+  sent to Jira.
+
+  Args:
+      issues (List[CreateJiraIssueInput]): The issues to create.
+
+  Returns:
+      List[dict]: One outcome per issue, in the order given.
+  """
+  outcomes: List[dict | None] = [None] * len(issues)
+  prepared = map_calls(_prepare_bulk_issue, issues, max_workers=_bulk_concurrency())
+  pending = _collect_prepared(issues, prepared, outcomes)
+
+  for start in range(0, len(pending), BULK_CREATE_CHUNK_SIZE):
+    chunk = pending[start:start + BULK_CREATE_CHUNK_SIZE]
+    response = JiraRESTClient.request("POST", '/rest/api/2/issue/bulk', _bulk_create_payload(chunk))
+    _apply_bulk_create_response(issues, chunk, response, outcomes)
+  return outcomes
+
+@dryrun_response(MOCK_BULK_CREATE_JIRA_ISSUES_RESPONSE)
+async def _abulk_create_jira_issues(issues: List[CreateJiraIssueInput]) -> List[dict]:
+  """Async variant of `_bulk_create_jira_issues`."""
+  outcomes: List[dict | None] = [None] * len(issues)
+  prepared = await amap_calls(_aprepare_bulk_issue, issues, limit=_bulk_concurrency())
+  pending = _collect_prepared(issues, prepared, outcomes)
+
+  for start in range(0, len(pending), BULK_CREATE_CHUNK_SIZE):
+    chunk = pending[start:start + BULK_CREATE_CHUNK_SIZE]
+    response = await AsyncJiraRESTClient.request("POST", '/rest/api/2/issue/bulk', _bulk_create_payload(chunk))
+    _apply_bulk_create_response(issues, chunk, response, outcomes)
+  return outcomes
+
+@dryrun_response(MOCK_ASSIGN_JIRA_RESPONSE)
+def _assign_account(issue_key: str, account_id: str) -> str:
+  response = JiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}/assignee', {'accountId': account_id})
+  _raise_unless_no_content(issue_key, "assign", response)
+  return f"Jira ticket assigned successfully {_urlify_jira_issue_id(issue_key)}."
+
+@dryrun_response(MOCK_ASSIGN_JIRA_RESPONSE)
+async def _aassign_account(issue_key: str, account_id: str) -> str:
+  response = await AsyncJiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}/assignee', {'accountId': account_id})
+  _raise_unless_no_content(issue_key, "assign", response)
+  return f"Jira ticket assigned successfully {_urlify_jira_issue_id(issue_key)}."
+
+def _account_ids(emails: List[str], results: List[CallResult]) -> List[str]:
+  account_ids = [result.unwrap() for result in results]
+  missing = [email for email, account_id in zip(emails, account_ids) if not account_id]
+  if missing:
+    raise ValueError(f"Could not find a Jira user for {', '.join(missing)}.")
+  return account_ids
+
+def _resolve_watchers(emails: Optional[List[str]]) -> List[str]:
+  emails = emails or []
+  return _account_ids(emails, map_calls(_get_account_id_from_email, emails))
+
+async def _aresolve_watchers(emails: Optional[List[str]]) -> List[str]:
+  emails = emails or []
+  return _account_ids(emails, await amap_calls(_aget_account_id_from_email, emails))
+
+@dryrun_response(MOCK_UPDATE_ISSUE_FIELD_RESPONSE)
+def _update_field_values(issue_key: str, field: str, add: Optional[List[str]], remove: Optional[List[str]]) -> str:
+  if field == WATCHERS:
+    _update_issue_watchers(issue_key, add, remove)
+  else:
+    _update_issue_field(issue_key, field, add, remove)
+  return f"Updated {field} successfully on Jira {_urlify_jira_issue_id(issue_key)}."
+
+@dryrun_response(MOCK_UPDATE_ISSUE_FIELD_RESPONSE)
+async def _aupdate_field_values(issue_key: str, field: str, add: Optional[List[str]], remove: Optional[List[str]]) -> str:
+  if field == WATCHERS:
+    await _aupdate_issue_watchers(issue_key, add, remove)
+  else:
+    await _aupdate_issue_field(issue_key, field, add, remove)
+  return f"Updated {field} successfully on Jira {_urlify_jira_issue_id(issue_key)}."
+
+def bulk_create_jira_issues(issues: List[CreateJiraIssueInput]) -> LLMResponseOutput:
+  """
+  Create several Jira issues in one call. Use this instead of calling create_jira_issue repeatedly.
+
+  Args:
+      issues (List[CreateJiraIssueInput]): The issues to create.
+
+  Returns:
+      LLMResponseOutput: A summary and the result (issue URL or error) of every issue.
+  """
+  try:
+    return _bulk_response("Create issues", _bulk_create_jira_issues(issues))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def abulk_create_jira_issues(issues: List[CreateJiraIssueInput]) -> LLMResponseOutput:
+  """
+  Create several Jira issues in one call. Use this instead of calling create_jira_issue repeatedly.
+
+  Args:
+      issues (List[CreateJiraIssueInput]): The issues to create.
+
+  Returns:
+      LLMResponseOutput: A summary and the result (issue URL or error) of every issue.
+  """
+  try:
+    return _bulk_response("Create issues", await _abulk_create_jira_issues(issues))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+def bulk_add_label_to_issues(issue_keys: List[str], label: str) -> LLMResponseOutput:
+  """
+  Add the same label to several Jira issues in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      label (str): The label to add.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    return _bulk_response(f"Add label '{label}'", _fan_out(lambda issue_key: _add_new_label_to_issue(issue_key, label), issue_keys))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def abulk_add_label_to_issues(issue_keys: List[str], label: str) -> LLMResponseOutput:
+  """
+  Add the same label to several Jira issues in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      label (str): The label to add.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    return _bulk_response(f"Add label '{label}'", await _afan_out(lambda issue_key: _aadd_new_label_to_issue(issue_key, label), issue_keys))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+def bulk_assign_jira_issues(issue_keys: List[str], assignee_email: str) -> LLMResponseOutput:
+  """
+  Assign several Jira issues to the same user in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      assignee_email (str): The email of the user to assign the issues to.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    account_id = _get_account_id_from_email(assignee_email)
+    if not account_id:
+      return LLMResponseOutput(response=f"Could not find a Jira user for {assignee_email}.")
+    return _bulk_response(f"Assign to {assignee_email}", _fan_out(lambda issue_key: _assign_account(issue_key, account_id), issue_keys))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def abulk_assign_jira_issues(issue_keys: List[str], assignee_email: str) -> LLMResponseOutput:
+  """
+  Assign several Jira issues to the same user in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      assignee_email (str): The email of the user to assign the issues to.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    account_id = await _aget_account_id_from_email(assignee_email)
+    if not account_id:
+      return LLMResponseOutput(response=f"Could not find a Jira user for {assignee_email}.")
+    return _bulk_response(f"Assign to {assignee_email}", await _afan_out(lambda issue_key: _aassign_account(issue_key, account_id), issue_keys))
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+def bulk_transition_jira_issues(issue_keys: List[str], transition_name: str, resolution_id: str = "") -> LLMResponseOutput:
+  """
+  Transition several Jira issues with the same transition in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      transition_name (str): The name of the transition to perform.
+      resolution_id (str, optional): The ID of the resolution to set when the transition requires one.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    outcomes = _fan_out(lambda issue_key: _perform_jira_transition(issue_key, resolution_id, transition_name), issue_keys)
+    return _bulk_response(f"Transition to {transition_name}", outcomes)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def abulk_transition_jira_issues(issue_keys: List[str], transition_name: str, resolution_id: str = "") -> LLMResponseOutput:
+  """
+  Transition several Jira issues with the same transition in one call.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      transition_name (str): The name of the transition to perform.
+      resolution_id (str, optional): The ID of the resolution to set when the transition requires one.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    outcomes = await _afan_out(lambda issue_key: _aperform_jira_transition(issue_key, resolution_id, transition_name), issue_keys)
+    return _bulk_response(f"Transition to {transition_name}", outcomes)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+def update_jira_issues_field(
+        issue_keys: List[str],
+        field: str,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None
+) -> LLMResponseOutput:
+  """
+  Add and remove values of a multi-value field (labels, components, fixVersions, versions or watchers) on one or more Jira issues.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      field (str): The field to update: labels, components, fixVersions, versions or watchers.
+      add (Optional[List[str]]): Values to add. Component and version names, or user emails for watchers.
+      remove (Optional[List[str]]): Values to remove. Component and version names, or user emails for watchers.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    _check_field(field)
+    if field == WATCHERS:
+      add, remove = _resolve_watchers(add), _resolve_watchers(remove)
+    outcomes = _fan_out(lambda issue_key: _update_field_values(issue_key, field, add, remove), issue_keys)
+    return _bulk_response(f"Update {field}", outcomes)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def aupdate_jira_issues_field(
+        issue_keys: List[str],
+        field: str,
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None
+) -> LLMResponseOutput:
+  """
+  Add and remove values of a multi-value field (labels, components, fixVersions, versions or watchers) on one or more Jira issues.
+
+  Args:
+      issue_keys (List[str]): The keys of the Jira issues.
+      field (str): The field to update: labels, components, fixVersions, versions or watchers.
+      add (Optional[List[str]]): Values to add. Component and version names, or user emails for watchers.
+      remove (Optional[List[str]]): Values to remove. Component and version names, or user emails for watchers.
+
+  Returns:
+      LLMResponseOutput: A summary and the result of every issue.
+  """
+  try:
+    _check_field(field)
+    if field == WATCHERS:
+      add, remove = await _aresolve_watchers(add), await _aresolve_watchers(remove)
+    outcomes = await _afan_out(lambda issue_key: _aupdate_field_values(issue_key, field, add, remove), issue_keys)
+    return _bulk_response(f"Update {field}", outcomes)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
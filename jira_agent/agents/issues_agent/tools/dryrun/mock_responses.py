@@ -18,6 +18,10 @@ MOCK_CREATE_JIRA_ISSUE_RESPONSE = "http://mock.jira.instance.test/browse/TEST-12
 MOCK_ASSIGN_JIRA_RESPONSE = "JIRA ticket assigned successfully http://mock.jira.instance.test/browse/TEST-123."
 MOCK_UPDATE_ISSUE_REPORTER_RESPONSE = "Reporter updated successfully on Jira http://mock.jira.instance.test/browse/TEST-123."
 MOCK_ADD_NEW_LABEL_TO_ISSUE_RESPONSE = "Label added successfully on Jira http://mock.jira.instance.test/browse/TEST-123."
+MOCK_UPDATE_ISSUE_FIELD_RESPONSE = "Updated successfully on Jira http://mock.jira.instance.test/browse/TEST-123."
+MOCK_BULK_CREATE_JIRA_ISSUES_RESPONSE = [
+  {"item": "Mock issue summary", "ok": True, "result": "http://mock.jira.instance.test/browse/TEST-123"}
+]
 MOCK_GET_JIRA_ISSUE_DETAILS_RESPONSE = {
   "key": "TEST-123",
   "summary": "Mock issue summary",
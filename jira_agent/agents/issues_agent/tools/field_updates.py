@@ -0,0 +1,111 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+import logging
+from typing import Callable, Dict, List, Optional
+
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.issue_fetch import IssueFetcher
+from jira_agent.utils.jira_client.rest import JiraRESTClient
+
+# Multi-value fields edited with Jira's atomic `update` verbs, and how each value is sent
+FIELD_VALUE_BUILDERS: Dict[str, Callable[[str], object]] = {
+  'labels': lambda value: value,
+  'components': lambda value: {'name': value},
+  'fixVersions': lambda value: {'name': value},
+  'versions': lambda value: {'name': value},
+}
+# Watchers are not an editable field; they have their own endpoint and take account IDs
+WATCHERS = 'watchers'
+SUPPORTED_FIELDS = (*FIELD_VALUE_BUILDERS, WATCHERS)
+
+
+def _check_field(field: str):
+  if field not in SUPPORTED_FIELDS:
+    raise ValueError(f"Unsupported field: {field}. Supported fields are: {list(SUPPORTED_FIELDS)}")
+
+def _raise_unless_no_content(issue_key: str, action: str, response):
+  if response.status_code != 204:
+    raise Exception(f"Failed to {action} Jira ticket {issue_key}. Status code: {response.status_code}, Response: {response.text}")
+
+def _field_update_payload(field: str, add: Optional[List[str]] = None, remove: Optional[List[str]] = None) -> dict:
+  """
+  Build an issue edit body that adds and removes values with `update` verbs.
+
+  Unlike setting `fields`, the verbs are applied by Jira to the current value,
+  so no read is needed and concurrent edits do not overwrite each other.
+  """
+  build = FIELD_VALUE_BUILDERS[field]
+  operations = [{'add': build(value)} for value in add or []]
+  operations += [{'remove': build(value)} for value in remove or []]
+  return {'update': {field: operations}}
+
+def _update_issue_field(issue_key: str, field: str, add: Optional[List[str]] = None, remove: Optional[List[str]] = None):
+  """
+  Add and remove values of a multi-value field of a Jira issue in a single request.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      field (str): One of `FIELD_VALUE_BUILDERS`.
+      add (Optional[List[str]]): Values to add (names for components and versions).
+      remove (Optional[List[str]]): Values to remove (names for components and versions).
+
+  Raises:
+      Exception: If Jira rejects the update.
+  """
+  logging.info(f"Updating {field} of ticket {issue_key}: add={add}, remove={remove}")
+  response = JiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}', _field_update_payload(field, add, remove))
+  _raise_unless_no_content(issue_key, f"update {field} of", response)
+  IssueFetcher.invalidate(issue_key)
+
+async def _aupdate_issue_field(issue_key: str, field: str, add: Optional[List[str]] = None, remove: Optional[List[str]] = None):
+  """Async variant of `_update_issue_field`."""
+  logging.info(f"Updating {field} of ticket {issue_key}: add={add}, remove={remove}")
+  response = await AsyncJiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}', _field_update_payload(field, add, remove))
+  _raise_unless_no_content(issue_key, f"update {field} of", response)
+  IssueFetcher.invalidate(issue_key)
+
+def _update_issue_watchers(issue_key: str, add: Optional[List[str]] = None, remove: Optional[List[str]] = None):
+  """
+  Add and remove watchers of a Jira issue, one request per account.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      add (Optional[List[str]]): Account IDs of the watchers to add.
+      remove (Optional[List[str]]): Account IDs of the watchers to remove.
+
+  Raises:
+      Exception: If Jira rejects any of the changes.
+  """
+  logging.info(f"Updating watchers of ticket {issue_key}: add={add}, remove={remove}")
+  for account_id in add or []:
+    response = JiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/watchers', json.dumps(account_id))
+    _raise_unless_no_content(issue_key, "add watcher to", response)
+  for account_id in remove or []:
+    response = JiraRESTClient.request("DELETE", f'/rest/api/3/issue/{issue_key}/watchers', params={'accountId': account_id})
+    _raise_unless_no_content(issue_key, "remove watcher from", response)
+
+async def _aupdate_issue_watchers(issue_key: str, add: Optional[List[str]] = None, remove: Optional[List[str]] = None):
+  """Async variant of `_update_issue_watchers`."""
+  logging.info(f"Updating watchers of ticket {issue_key}: add={add}, remove={remove}")
+  for account_id in add or []:
+    response = await AsyncJiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/watchers', json.dumps(account_id))
+    _raise_unless_no_content(issue_key, "add watcher to", response)
+  for account_id in remove or []:
+    response = await AsyncJiraRESTClient.request("DELETE", f'/rest/api/3/issue/{issue_key}/watchers', params={'accountId': account_id})
+    _raise_unless_no_content(issue_key, "remove watcher from", response)
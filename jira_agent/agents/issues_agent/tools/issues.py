@@ -14,12 +14,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 import logging
 import os
-import requests
 
 from jira_agent.common.config import INTERNAL_ERROR_MESSAGE
+from .field_updates import _aupdate_issue_field, _update_issue_field
 from .dryrun.mock_responses import (
   MOCK_ADD_NEW_LABEL_TO_ISSUE_RESPONSE,
   MOCK_ASSIGN_JIRA_RESPONSE,
@@ -30,9 +29,18 @@ from .dryrun.mock_responses import (
   MOCK_UPDATE_ISSUE_REPORTER_RESPONSE,
 )
 from jira_agent.agents.issues_agent.models import CreateJiraIssueInput, LLMResponseOutput
-from jira_agent.utils.jira_client.client import JiraClient
 from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.codec import decode_response
+from jira_agent.utils.jira_client.identity import IdentityCache
+from jira_agent.utils.jira_client.issue_fetch import IssueFetcher
+from jira_agent.utils.jira_client.project_metadata import ProjectMetadataCache
+from jira_agent.utils.concurrency import agather_calls, gather_calls
 from jira_agent.utils.dryrun_utils import dryrun_response
+from jira_agent.utils.tool_output import encode_tool_output
+
+# Fields read by `_ticket_details_from_raw`; everything else is left out of the response
+ISSUE_DETAIL_FIELDS = ("summary", "description", "status", "priority", "reporter", "assignee", "created", "updated")
 
 @dryrun_response(MOCK_CREATE_JIRA_ISSUE_RESPONSE)
 def _create_jira_issue(input_data: CreateJiraIssueInput) -> str:
@@ -48,27 +56,100 @@ def _create_jira_issue(input_data: CreateJiraIssueInput) -> str:
   logging.info(f"Creating a new Jira issue in project: {input_data.project_key}")
 
   try:
-    supported_issue_types = _get_supported_issue_types(input_data.project_key)
+    supported_issue_types, assignee_id = _lookup_create_inputs(input_data)
+    if input_data.issue_type not in supported_issue_types:
+      # The cached metadata may predate a newly added issue type
+      supported_issue_types = _get_supported_issue_types(input_data.project_key, refresh=True)
     if input_data.issue_type not in supported_issue_types:
       raise ValueError(f"Unsupported issue type: {input_data.issue_type}. Supported issue types are: {supported_issue_types}")
 
-    issue_dict = {
-      'project': {'key': input_data.project_key},
-      'summary': input_data.summary,
-      'description': input_data.description,
-      'issuetype': {'name': input_data.issue_type},
-    }
+    issue_dict = _build_issue_fields(input_data, assignee_id)
+
+    response = JiraRESTClient.request("POST", "/rest/api/2/issue", {'fields': issue_dict})
+    response.raise_for_status()
+    return _urlify_jira_issue_id(decode_response(response)['key'])
+
+  except Exception as e:
+    raise ValueError(e)
+
+@dryrun_response(MOCK_CREATE_JIRA_ISSUE_RESPONSE)
+async def _acreate_jira_issue(input_data: CreateJiraIssueInput) -> str:
+  """
+  Create a new Jira issue without blocking the event loop.
+
+  Args:
+      input_data (CreateJiraIssueInput): The input model containing the details for creating the issue.
+
+  Returns:
+      str: The URL of the created Jira issue.
+  """
+  logging.info(f"Creating a new Jira issue in project: {input_data.project_key}")
+
+  try:
+    supported_issue_types, assignee_id = await _alookup_create_inputs(input_data)
+    if input_data.issue_type not in supported_issue_types:
+      # The cached metadata may predate a newly added issue type
+      supported_issue_types = await _aget_supported_issue_types(input_data.project_key, refresh=True)
+    if input_data.issue_type not in supported_issue_types:
+      raise ValueError(f"Unsupported issue type: {input_data.issue_type}. Supported issue types are: {supported_issue_types}")
 
-    if input_data.assignee_email:
-      issue_dict['assignee'] = {'id': _get_account_id_from_email(input_data.assignee_email)}
+    issue_dict = _build_issue_fields(input_data, assignee_id)
 
-    jira_api = JiraClient.get_jira_instance()
-    new_issue = jira_api.create_issue(fields=issue_dict)
-    return _urlify_jira_issue_id(new_issue.key)
+    response = await AsyncJiraRESTClient.request("POST", "/rest/api/2/issue", {'fields': issue_dict})
+    response.raise_for_status()
+    return _urlify_jira_issue_id(decode_response(response)['key'])
 
   except Exception as e:
     raise ValueError(e)
 
+def _lookup_create_inputs(input_data: CreateJiraIssueInput) -> tuple[list[str], str | None]:
+  """
+  Look up the project's issue types and the assignee's account ID concurrently.
+
+  Args:
+      input_data (CreateJiraIssueInput): The issue to be created.
+
+  Returns:
+      tuple: The supported issue types and the assignee account ID (None without an assignee).
+  """
+  issue_types, assignee = gather_calls(
+    lambda: _get_supported_issue_types(input_data.project_key),
+    lambda: _get_account_id_from_email(input_data.assignee_email) if input_data.assignee_email else None,
+  )
+  return issue_types.unwrap(), assignee.unwrap()
+
+async def _alookup_create_inputs(input_data: CreateJiraIssueInput) -> tuple[list[str], str | None]:
+  """Async variant of `_lookup_create_inputs`."""
+  async def assignee_id():
+    return await _aget_account_id_from_email(input_data.assignee_email) if input_data.assignee_email else None
+
+  issue_types, assignee = await agather_calls(
+    lambda: _aget_supported_issue_types(input_data.project_key),
+    assignee_id,
+  )
+  return issue_types.unwrap(), assignee.unwrap()
+
+def _build_issue_fields(input_data: CreateJiraIssueInput, assignee_id: str | None = None) -> dict:
+  """
+  Build the `fields` of an issue creation request.
+
+  Args:
+      input_data (CreateJiraIssueInput): The details of the issue.
+      assignee_id (str | None): The resolved account ID of the assignee, if any.
+
+  Returns:
+      dict: The issue fields.
+  """
+  issue_dict = {
+    'project': {'key': input_data.project_key},
+    'summary': input_data.summary,
+    'description': input_data.description,
+    'issuetype': {'name': input_data.issue_type},
+  }
+
+  if input_data.assignee_email:
+    issue_dict['assignee'] = {'id': assignee_id}
+  return issue_dict
 
 def create_jira_issue(input_data: CreateJiraIssueInput) -> LLMResponseOutput:
   """
@@ -88,6 +169,24 @@ def create_jira_issue(input_data: CreateJiraIssueInput) -> LLMResponseOutput:
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
+async def acreate_jira_issue(input_data: CreateJiraIssueInput) -> LLMResponseOutput:
+  """
+  Create a new Jira issue.
+
+  Args:
+      input_data (CreateJiraIssueInput): The input model containing the details for creating the issue.
+
+  Returns:
+      LLMResponseOutput: The output model containing the URL of the created Jira issue.
+  """
+  logging.info(f"Creating a new Jira issue in project: {input_data.project_key}")
+
+  try:
+    issue_url = await _acreate_jira_issue(input_data)
+    return LLMResponseOutput(response=issue_url)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
 
 @dryrun_response(MOCK_ASSIGN_JIRA_RESPONSE)
 def _assign_jira(issue_key: str, assignee_email: str) -> str:
@@ -103,14 +202,44 @@ def _assign_jira(issue_key: str, assignee_email: str) -> str:
   """
   logging.info(f"Assigning Jira ticket {issue_key} to {assignee_email}")
 
-  jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
   try:
-    assignee_url = f'{jira_server_url}/rest/api/3/issue/{issue_key}/assignee'
-    payload = json.dumps({
+    payload = {
       'accountId': _get_account_id_from_email(assignee_email)
-    })
-    response = requests.put(assignee_url, headers=headers, data=payload, auth=auth)
+    }
+    response = JiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}/assignee', payload)
     if response.status_code == 204:
+      IssueFetcher.invalidate(issue_key)
+      urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
+      logging.info(f'Jira ticket {issue_key} assigned to {assignee_email} successfully.')
+      return f"Jira ticket assigned successfully {urlify_jira_issue_id}."
+    else:
+      logging.error(f'Failed to assign Jira ticket {issue_key} to {assignee_email}. Status code: {response.status_code}, Response: {response.text}')
+      return "Failed to assign Jira ticket."
+  except Exception as e:
+    logging.error(f'Failed to assign Jira ticket {issue_key} to {assignee_email}. Error: {e}')
+    return INTERNAL_ERROR_MESSAGE + ":" + str(e)
+
+@dryrun_response(MOCK_ASSIGN_JIRA_RESPONSE)
+async def _aassign_jira(issue_key: str, assignee_email: str) -> str:
+  """
+  Assign a Jira ticket to a specified user without blocking the event loop.
+
+  Args:
+      issue_key (str): The key of the Jira issue to assign.
+      assignee_email (str): The email of the user to assign the issue to.
+
+  Returns:
+      str: A message indicating the result of the assignment.
+  """
+  logging.info(f"Assigning Jira ticket {issue_key} to {assignee_email}")
+
+  try:
+    payload = {
+      'accountId': await _aget_account_id_from_email(assignee_email)
+    }
+    response = await AsyncJiraRESTClient.request("PUT", f'/rest/api/3/issue/{issue_key}/assignee', payload)
+    if response.status_code == 204:
+      IssueFetcher.invalidate(issue_key)
       urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
       logging.info(f'Jira ticket {issue_key} assigned to {assignee_email} successfully.')
       return f"Jira ticket assigned successfully {urlify_jira_issue_id}."
@@ -141,6 +270,26 @@ def assign_jira(issue_key: str, assignee_email: str) -> LLMResponseOutput:
     logging.error(f'Failed to assign Jira ticket {issue_key} to {assignee_email}. Error: {e}')
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
+async def aassign_jira(issue_key: str, assignee_email: str) -> LLMResponseOutput:
+  """
+  Assign a Jira ticket to a specified user.
+
+  Args:
+      issue_key (str): The key of the Jira issue to assign.
+      assignee_email (str): The email of the user to assign the issue to.
+
+  Returns:
+      LLMResponseOutput: The output model containing the result of the assignment.
+  """
+  logging.info(f"Assigning Jira ticket {issue_key} to {assignee_email}")
+
+  try:
+    result = await _aassign_jira(issue_key, assignee_email)
+    return LLMResponseOutput(response=result)
+  except Exception as e:
+    logging.error(f'Failed to assign Jira ticket {issue_key} to {assignee_email}. Error: {e}')
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
 @dryrun_response(MOCK_UPDATE_ISSUE_REPORTER_RESPONSE)
 def _update_jira_reporter(issue_key: str, reporter_email: str) -> str:
   """
@@ -156,10 +305,38 @@ def _update_jira_reporter(issue_key: str, reporter_email: str) -> str:
   logging.info(f"Updating reporter of ticket: {issue_key}")
 
   try:
-    jira_api = JiraClient.get_jira_instance()
     reporter_id = _get_account_id_from_email(reporter_email)
-    issue = jira_api.issue(issue_key)
-    issue.update(reporter={'id': reporter_id})
+    payload = {'fields': {'reporter': {'id': reporter_id}}}
+    response = JiraRESTClient.request("PUT", f'/rest/api/2/issue/{issue_key}', payload)
+    response.raise_for_status()
+    IssueFetcher.invalidate(issue_key)
+    logging.info("Reporter updated successfully.")
+    urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
+    return f"Reporter updated successfully on Jira {urlify_jira_issue_id}."
+  except Exception as e:
+    logging.error(f"Error updating reporter: {e}")
+    raise ValueError(INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(MOCK_UPDATE_ISSUE_REPORTER_RESPONSE)
+async def _aupdate_jira_reporter(issue_key: str, reporter_email: str) -> str:
+  """
+  Update the reporter of a Jira issue without blocking the event loop.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      reporter_email (str): The email of the new reporter.
+
+  Returns:
+      str: A message indicating the result of the update.
+  """
+  logging.info(f"Updating reporter of ticket: {issue_key}")
+
+  try:
+    reporter_id = await _aget_account_id_from_email(reporter_email)
+    payload = {'fields': {'reporter': {'id': reporter_id}}}
+    response = await AsyncJiraRESTClient.request("PUT", f'/rest/api/2/issue/{issue_key}', payload)
+    response.raise_for_status()
+    IssueFetcher.invalidate(issue_key)
     logging.info("Reporter updated successfully.")
     urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
     return f"Reporter updated successfully on Jira {urlify_jira_issue_id}."
@@ -184,6 +361,23 @@ def update_issue_reporter(issue_key: str, reporter_email: str) -> LLMResponseOut
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
+async def aupdate_issue_reporter(issue_key: str, reporter_email: str) -> LLMResponseOutput:
+  """
+  Update the reporter of a Jira issue.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      reporter_email (str): The email of the new reporter.
+
+  Returns:
+      LLMResponseOutput: The output model containing the result of the update.
+  """
+  try:
+    result = await _aupdate_jira_reporter(issue_key, reporter_email)
+    return LLMResponseOutput(response=result)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
 def add_new_label_to_issue(issue_key: str, label: str) -> LLMResponseOutput:
   """
   Add a new label to a Jira issue.
@@ -201,6 +395,23 @@ def add_new_label_to_issue(issue_key: str, label: str) -> LLMResponseOutput:
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
+async def aadd_new_label_to_issue(issue_key: str, label: str) -> LLMResponseOutput:
+  """
+  Add a new label to a Jira issue.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      label (str): The label to add.
+
+  Returns:
+      LLMResponseOutput: The output model containing the result of the operation.
+  """
+  try:
+    issue_url = await _aadd_new_label_to_issue(issue_key, label)
+    return LLMResponseOutput(response=issue_url)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
 @dryrun_response(MOCK_GET_JIRA_ISSUE_DETAILS_RESPONSE)
 def _get_jira_issue_details(issue_key: str) -> dict:
   """
@@ -215,26 +426,61 @@ def _get_jira_issue_details(issue_key: str) -> dict:
   logging.info(f"Retrieving details for ticket: {issue_key}")
 
   try:
-    jira_api = JiraClient.get_jira_instance()
-    issue = jira_api.issue(issue_key)
-    urlify_jira_issue_id = _urlify_jira_issue_id(issue.key)
-    ticket_details = {
-      "key": urlify_jira_issue_id,
-      "summary": issue.fields.summary,
-      "description": issue.fields.description,
-      "status": issue.fields.status.name,
-      "priority": issue.fields.priority.name,
-      "reporter": issue.fields.reporter.displayName,
-      "assignee": issue.fields.assignee.displayName if issue.fields.assignee else None,
-      "created": issue.fields.created,
-      "updated": issue.fields.updated,
-    }
-    return ticket_details
+    return _ticket_details_from_raw(IssueFetcher.get(issue_key, ISSUE_DETAIL_FIELDS))
+
+  except Exception as e:
+    logging.error(f"Error retrieving Jira issue details: {e}")
+    raise ValueError(INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(MOCK_GET_JIRA_ISSUE_DETAILS_RESPONSE)
+async def _aget_jira_issue_details(issue_key: str) -> dict:
+  """
+  Retrieve the details of a Jira issue without blocking the event loop.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+
+  Returns:
+      dict: A dictionary containing the details of the issue.
+  """
+  logging.info(f"Retrieving details for ticket: {issue_key}")
+
+  try:
+    return _ticket_details_from_raw(await IssueFetcher.aget(issue_key, ISSUE_DETAIL_FIELDS))
 
   except Exception as e:
     logging.error(f"Error retrieving Jira issue details: {e}")
     raise ValueError(INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
+def _ticket_details_from_raw(raw_issue: dict) -> dict:
+  """
+  Build the ticket details returned to the LLM from a raw Jira issue payload.
+
+  Args:
+      raw_issue (dict): The issue JSON as returned by the Jira REST API.
+
+  Returns:
+      dict: A dictionary containing the details of the issue.
+  """
+  fields = raw_issue['fields']
+  return {
+    "key": _urlify_jira_issue_id(raw_issue['key']),
+    "summary": fields['summary'],
+    "description": fields['description'],
+    "status": fields['status']['name'],
+    "priority": fields['priority']['name'],
+    "reporter": fields['reporter']['displayName'],
+    "assignee": fields['assignee']['displayName'] if fields.get('assignee') else None,
+    "created": fields['created'],
+    "updated": fields['updated'],
+  }
+
+def _issue_details_response(ticket_details: dict) -> str:
+  return encode_tool_output(
+    "get_jira_issue_details", ticket_details, prefix="Jira Issue Details:",
+    baseline=f"Jira Issue Details: {ticket_details}",
+  )
+
 def get_jira_issue_details(issue_key: str) -> LLMResponseOutput:
   """
   Retrieve the details of a Jira issue.
@@ -247,7 +493,24 @@ def get_jira_issue_details(issue_key: str) -> LLMResponseOutput:
   """
   try:
     ticket_details = _get_jira_issue_details(issue_key)
-    resp_str = f"Jira Issue Details: {ticket_details}"
+    resp_str = _issue_details_response(ticket_details)
+    return LLMResponseOutput(response=resp_str)
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def aget_jira_issue_details(issue_key: str) -> LLMResponseOutput:
+  """
+  Retrieve the details of a Jira issue.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+
+  Returns:
+      LLMResponseOutput: The output model containing the details of the issue.
+  """
+  try:
+    ticket_details = await _aget_jira_issue_details(issue_key)
+    resp_str = _issue_details_response(ticket_details)
     return LLMResponseOutput(response=resp_str)
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
@@ -266,10 +529,28 @@ def _add_new_label_to_issue(issue_key: str, label: str) -> str:
   """
   logging.info(f"Adding label '{label}' to ticket: {issue_key}")
   try:
-    jira_api = JiraClient.get_jira_instance()
-    issue = jira_api.issue(issue_key)
-    issue.fields.labels.append(label)
-    issue.update(fields={"labels": issue.fields.labels})
+    _update_issue_field(issue_key, 'labels', add=[label])
+    logging.info("Label added successfully.")
+    urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
+    return f"Label added successfully on Jira {urlify_jira_issue_id}."
+  except Exception as e:
+    raise ValueError(f"Error adding label: {e}")
+
+@dryrun_response(MOCK_ADD_NEW_LABEL_TO_ISSUE_RESPONSE)
+async def _aadd_new_label_to_issue(issue_key: str, label: str) -> str:
+  """
+  Add a new label to a Jira issue without blocking the event loop.
+
+  Args:
+      issue_key (str): The key of the Jira issue.
+      label (str): The label to add.
+
+  Returns:
+      str: A message indicating the result of the operation.
+  """
+  logging.info(f"Adding label '{label}' to ticket: {issue_key}")
+  try:
+    await _aupdate_issue_field(issue_key, 'labels', add=[label])
     logging.info("Label added successfully.")
     urlify_jira_issue_id = _urlify_jira_issue_id(issue_key)
     return f"Label added successfully on Jira {urlify_jira_issue_id}."
@@ -289,24 +570,18 @@ def _urlify_jira_issue_id(issue_id: str) -> str:
   jira_server =  os.getenv("JIRA_URL") or os.getenv("JIRA_INSTANCE")
   return f"{jira_server}/browse/{issue_id}"
 
-def _create_jira_urlified_list(issues) -> list:
+def _jira_issue_markdown_link(issue_key: str, issue_summary: str) -> str:
   """
-  Create a list of Jira issues in Markdown format with clickable links.
+  Render a single Jira issue as a Markdown link.
 
   Args:
-      issues (list): A list of Jira issue objects. Each object is expected to have a 'key' attribute
-                     representing the issue key (e.g., "PROJECT-123").
+      issue_key (str): The Jira issue key (e.g., "PROJECT-123").
+      issue_summary (str): The summary of the issue.
 
   Returns:
-      list: A list of strings, where each string is a Markdown-formatted link to a Jira issue.
-            The format is "[ISSUE_KEY](ISSUE_URL)".
+      str: The link in the format "[ISSUE_KEY: SUMMARY](ISSUE_URL)".
   """
-  issues_md = []
-  for issue in issues:
-    issue_link = _urlify_jira_issue_id(issue.key)
-    issue_summary = issue.fields.summary
-    issues_md.append(f"[{issue.key}: {issue_summary}]({issue_link})")
-  return issues_md
+  return f"[{issue_key}: {issue_summary}]({_urlify_jira_issue_id(issue_key)})"
 
 @dryrun_response(MOCK_GET_ACCOUNT_ID_FROM_EMAIL_RESPONSE)
 def _get_account_id_from_email(email: str) -> str:
@@ -323,36 +598,72 @@ def _get_account_id_from_email(email: str) -> str:
       Exception: If the Jira API request fails or encounters an error.
   """
   try:
-    jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
-    search_url = f'{jira_server_url}/rest/api/3/user/search'
+    return IdentityCache.resolve(email, _search_account_id_by_email) or ""
+  except Exception as e:
+    logging.error(f'Failed to get account ID for email {email}. Error: {e}')
+    return ""
 
-    query = {
-      'query': email
-    }
+def _search_account_id_by_email(email: str) -> str:
+  """Query `/rest/api/3/user/search` for the account ID of an email, bypassing the identity cache."""
+  query = {
+    'query': email
+  }
 
-    user_search_response = requests.get(
-      search_url,
-      headers=headers,
-      params=query,
-      auth=auth
-    )
-
-    if user_search_response.status_code == 200:
-      users_data = user_search_response.json()
-      if users_data:
-        account_id = users_data[0].get('accountId')
-        logging.info(f'Account ID found for email {email}: {account_id}')
-        return account_id
-      else:
-        logging.warning(f'No users found with email {email}.')
-        return ""
-    else:
-      logging.error(f'Failed to retrieve user details for email {email}. Status code: {user_search_response.status_code}, Response: {user_search_response.text}')
-      return ""
+  user_search_response = JiraRESTClient.request("GET", '/rest/api/3/user/search', params=query)
+  return _parse_account_id_from_user_search(email, user_search_response)
+
+@dryrun_response(MOCK_GET_ACCOUNT_ID_FROM_EMAIL_RESPONSE)
+async def _aget_account_id_from_email(email: str) -> str:
+  """
+  Retrieve the account ID associated with a given email address in Jira without blocking the event loop.
+
+  Args:
+      email (str): The email address of the user whose account ID is to be retrieved.
+
+  Returns:
+      str: The account ID of the user, or an empty string if the user is not found or if an error occurs.
+  """
+  try:
+    return await IdentityCache.aresolve(email, _asearch_account_id_by_email) or ""
   except Exception as e:
     logging.error(f'Failed to get account ID for email {email}. Error: {e}')
     return ""
 
+async def _asearch_account_id_by_email(email: str) -> str:
+  """Async variant of `_search_account_id_by_email`."""
+  query = {
+    'query': email
+  }
+
+  user_search_response = await AsyncJiraRESTClient.request("GET", '/rest/api/3/user/search', params=query)
+  return _parse_account_id_from_user_search(email, user_search_response)
+
+def _parse_account_id_from_user_search(email: str, user_search_response) -> str:
+  """
+  Extract the first account ID from a `/rest/api/3/user/search` response.
+
+  Args:
+      email (str): The email address that was searched for.
+      user_search_response: The `requests` or `httpx` response of the search.
+
+  Returns:
+      str: The account ID, or an empty string if no user was found.
+
+  Raises:
+      Exception: If the search itself failed, so the failure is not cached as an unknown user.
+  """
+  if user_search_response.status_code == 200:
+    users_data = decode_response(user_search_response)
+    if users_data:
+      account_id = users_data[0].get('accountId')
+      logging.info(f'Account ID found for email {email}: {account_id}')
+      return account_id
+    else:
+      logging.warning(f'No users found with email {email}.')
+      return ""
+  else:
+    raise Exception(f'Failed to retrieve user details for email {email}. Status code: {user_search_response.status_code}, Response: {user_search_response.text}')
+
 def get_account_id_from_email(email: str) -> str:
   """
   Retrieve the account ID associated with a given email address in Jira.
@@ -369,12 +680,37 @@ def get_account_id_from_email(email: str) -> str:
   return _get_account_id_from_email(email)
 
 @dryrun_response(MOCK_GET_SUPPORTED_JIRA_ISSUE_TYPES_RESPONSE)
-def _get_supported_issue_types(project_key: str) -> list[str]:
+def _get_supported_issue_types(project_key: str, refresh: bool = False) -> list[str]:
   """
   Retrieve supported issue types for Jira issues in a specific project.
 
+  The project metadata is served from `ProjectMetadataCache`.
+
+  Args:
+      project_key (str): The key of the project to get issue metadata for.
+      refresh (bool): Drop the cached metadata and fetch it again.
+
+  Returns:
+      list[str]: A list of supported issue types.
+
+  Raises:
+      ValueError: If there is an error retrieving the metadata.
+  """
+  try:
+    if refresh:
+      ProjectMetadataCache.invalidate(project_key)
+    return ProjectMetadataCache.get(project_key, _fetch_createmeta).issue_types
+  except Exception as e:
+    raise ValueError(f"Error getting Jira issue metadata: {e}") from e
+
+@dryrun_response(MOCK_GET_SUPPORTED_JIRA_ISSUE_TYPES_RESPONSE)
+async def _aget_supported_issue_types(project_key: str, refresh: bool = False) -> list[str]:
+  """
+  Retrieve supported issue types for Jira issues in a specific project without blocking the event loop.
+
   Args:
       project_key (str): The key of the project to get issue metadata for.
+      refresh (bool): Drop the cached metadata and fetch it again.
 
   Returns:
       list[str]: A list of supported issue types.
@@ -383,13 +719,29 @@ def _get_supported_issue_types(project_key: str) -> list[str]:
       ValueError: If there is an error retrieving the metadata.
   """
   try:
-    jira_api = JiraClient.get_jira_instance()
-    issue_metadata = jira_api.createmeta(projectKeys=project_key, expand='projects.issuetypes.fields')
-    supported_issue_types = []
-    for project in issue_metadata['projects']:
-      for issue in project['issuetypes']:
-        supported_issue_types.append(issue['name'])
-
-    return supported_issue_types
+    if refresh:
+      ProjectMetadataCache.invalidate(project_key)
+    metadata = await ProjectMetadataCache.aget(project_key, _afetch_createmeta)
+    return metadata.issue_types
   except Exception as e:
-    raise ValueError(f"Error getting Jira issue metadata: {e}") from e
\ No newline at end of file
+    raise ValueError(f"Error getting Jira issue metadata: {e}") from e
+
+def _fetch_createmeta(project_key: str) -> dict:
+  """Fetch the createmeta of a project with its issue type fields, bypassing the cache."""
+  response = JiraRESTClient.request(
+    "GET",
+    '/rest/api/2/issue/createmeta',
+    params={'projectKeys': project_key, 'expand': 'projects.issuetypes.fields'},
+  )
+  response.raise_for_status()
+  return decode_response(response)
+
+async def _afetch_createmeta(project_key: str) -> dict:
+  """Async variant of `_fetch_createmeta`."""
+  response = await AsyncJiraRESTClient.request(
+    "GET",
+    '/rest/api/2/issue/createmeta',
+    params={'projectKeys': project_key, 'expand': 'projects.issuetypes.fields'},
+  )
+  response.raise_for_status()
+  return decode_response(response)
\ No newline at end of file
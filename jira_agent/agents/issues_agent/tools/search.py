@@ -16,7 +16,7 @@
 
 import json
 import logging
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 
 from jira_agent.common.config import INTERNAL_ERROR_MESSAGE
 
@@ -26,10 +26,14 @@ from .dryrun.mock_responses import (
 )
 
 from jira_agent.agents.issues_agent.models import LLMResponseOutput
-from jira_agent.agents.issues_agent.tools import _get_account_id_from_email, _create_jira_urlified_list
+from jira_agent.agents.issues_agent.tools import _get_account_id_from_email
+from .issues import _jira_issue_markdown_link
 
-from jira_agent.utils.jira_client.client import JiraClient
+from jira_agent.utils.jira_client.search import JiraIssueSearch
 from jira_agent.utils.dryrun_utils import dryrun_response
+from jira_agent.utils.tool_output import encode_tool_output
+
+OMITTED_ISSUES_NOTE_PREFIX = "... and "
 
 @dryrun_response(MOCK_RETRIEVE_MULTIPLE_JIRA_ISSUES_RESPONSE)
 def _retrieve_multiple_jira_issues(user_email: str, project: str, num_jira_issues_to_retrieve: int) -> List:
@@ -50,15 +54,13 @@ def _retrieve_multiple_jira_issues(user_email: str, project: str, num_jira_issue
     raise ValueError("Invalid email address.")
 
   try:
-    jira_api = JiraClient.get_jira_instance()
     account_id = _get_account_id_from_email(user_email)
     logging.info(f"Account ID for user {user_email}: {account_id}")
-    issues = jira_api.search_issues(
+    pages = JiraIssueSearch.iter_pages(
       f"project={project} AND (reporter='{account_id}' OR assignee='{account_id}') ORDER BY created DESC",
-      maxResults=num_jira_issues_to_retrieve,
+      limit=num_jira_issues_to_retrieve,
     )
-    issues_md_list = _create_jira_urlified_list(issues)
-    return issues_md_list
+    return list(_render_issue_links(pages, note_omitted=False))
   except Exception as e:
     raise ValueError(f"Error retrieving service desk tickets: {e}")
 
@@ -76,16 +78,80 @@ def _search_jira_issues_using_jql(jql_query: str, user_email: str) -> List:
   """
   logging.info(f"Searching tickets with JQL: {jql_query} for user: {user_email}")
   try:
-    jira_api = JiraClient.get_jira_instance()
-    issues = jira_api.search_issues(jql_query)
-    logging.info(f"Issues found: {issues}")
-    if not issues:
+    issues_md_list = list(_render_issue_links(JiraIssueSearch.iter_pages(jql_query)))
+    logging.info(f"Issues found: {len(issues_md_list)}")
+    if not issues_md_list:
+      raise ValueError("Seems like there are no tickets to display with your query.")
+    return issues_md_list
+  except Exception as e:
+    raise ValueError(f"Error searching Jira tickets: {e}")
+
+@dryrun_response(MOCK_SEARCH_JIRA_ISSUES_USING_JQL_RESPONSE)
+async def _asearch_jira_issues_using_jql(jql_query: str, user_email: str) -> List:
+  """
+  Search for Jira tickets based on a JQL query and user_email without blocking the event loop.
+
+  Args:
+    jql_query (str): The JQL query string.
+    user_email (str): The email of the user.
+
+  Returns:
+    list: List of Jira issue IDs in a markdown format.
+  """
+  logging.info(f"Searching tickets with JQL: {jql_query} for user: {user_email}")
+  try:
+    issues_md_list = [link async for link in _arender_issue_links(JiraIssueSearch.aiter_pages(jql_query))]
+    logging.info(f"Issues found: {len(issues_md_list)}")
+    if not issues_md_list:
       raise ValueError("Seems like there are no tickets to display with your query.")
-    issues_md_list = _create_jira_urlified_list(issues)
     return issues_md_list
   except Exception as e:
     raise ValueError(f"Error searching Jira tickets: {e}")
 
+def _render_issue_links(pages: Iterable[dict], note_omitted: bool = True) -> Iterator[str]:
+  """
+  Render search result pages as Markdown issue links, one page at a time.
+
+  Args:
+    pages (Iterable[dict]): Jira search pages, as yielded by `JiraIssueSearch.iter_pages`.
+    note_omitted (bool): End with a note on how many matching issues were not fetched.
+
+  Yields:
+    str: Links in the format "[ISSUE_KEY: SUMMARY](ISSUE_URL)".
+  """
+  total = shown = 0
+  for page in pages:
+    total = page.get('total', total)
+    for issue in page['issues']:
+      shown += 1
+      yield _jira_issue_markdown_link(issue['key'], issue['fields']['summary'])
+  if note_omitted and total > shown:
+    yield _omitted_issues_note(total - shown)
+
+async def _arender_issue_links(pages: AsyncIterator[dict], note_omitted: bool = True) -> AsyncIterator[str]:
+  """Async variant of `_render_issue_links`."""
+  total = shown = 0
+  async for page in pages:
+    total = page.get('total', total)
+    for issue in page['issues']:
+      shown += 1
+      yield _jira_issue_markdown_link(issue['key'], issue['fields']['summary'])
+  if note_omitted and total > shown:
+    yield _omitted_issues_note(total - shown)
+
+def _omitted_issues_note(omitted: int) -> str:
+  return f"{OMITTED_ISSUES_NOTE_PREFIX}{omitted} more issues matching this query. Refine the JQL to narrow the results."
+
+def _issue_links_response(issues_md_list: List[str]) -> LLMResponseOutput:
+  """Encode issue links one per line; the note on issues Jira did not return stays last."""
+  baseline = json.dumps(issues_md_list, indent=2)
+  footer = None
+  if issues_md_list and issues_md_list[-1].startswith(OMITTED_ISSUES_NOTE_PREFIX):
+    issues_md_list, footer = issues_md_list[:-1], issues_md_list[-1]
+  return LLMResponseOutput(
+    response=encode_tool_output("search_jira_issues_using_jql", issues_md_list, footer=footer, baseline=baseline)
+  )
+
 def search_jira_issues_using_jql(jql_query: str, user_email: str) -> LLMResponseOutput:
   """
   Search for Jira tickets based on a JQL query and user_email.
@@ -98,7 +164,22 @@ def search_jira_issues_using_jql(jql_query: str, user_email: str) -> LLMResponse
     LLMResponseOutput: List of Jira issue IDs in a markdown format.
   """
   try:
-    resp_str = _search_jira_issues_using_jql(jql_query, user_email)
-    return LLMResponseOutput(response=json.dumps(resp_str, indent=2))
+    return _issue_links_response(_search_jira_issues_using_jql(jql_query, user_email))
+  except ValueError as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+async def asearch_jira_issues_using_jql(jql_query: str, user_email: str) -> LLMResponseOutput:
+  """
+  Search for Jira tickets based on a JQL query and user_email.
+
+  Args:
+    jql_query (str): The JQL query string.
+    user_email (str): The email of the user.
+
+  Returns:
+    LLMResponseOutput: List of Jira issue IDs in a markdown format.
+  """
+  try:
+    return _issue_links_response(await _asearch_jira_issues_using_jql(jql_query, user_email))
   except ValueError as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
\ No newline at end of file
@@ -16,20 +16,25 @@
 
 from typing import Any
 
-import requests
 import json
 import logging
 
 from jira_agent.agents.issues_agent.models import LLMResponseOutput
 
 from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
 from jira_agent.utils.dryrun_utils import dryrun_response
+from jira_agent.utils.tool_output import encode_tool_output
 
 from .dryrun.mock_responses import (
   MOCK_PERFORM_JIRA_TRANSITION_RESPONSE,
   MOCK_GET_REQUIRED_FIELDS_FOR_TRANSITION_RESPONSE,
   MOCK_GET_JIRA_TRANSITIONS_RESPONSE,
 )
+from .workflow import TransitionResolver
+
+# Jira answers these when a transition is not valid from the issue's current status
+_STALE_TRANSITION_STATUS_CODES = (400, 409)
 
 @dryrun_response(MOCK_GET_REQUIRED_FIELDS_FOR_TRANSITION_RESPONSE)
 def _get_required_fields_for_transition(issue_key: str, transition_name: str) -> list[Any] | None:
@@ -44,32 +49,55 @@ def _get_required_fields_for_transition(issue_key: str, transition_name: str) ->
     list: A list of required fields for the transition.
           Returns None if an error occurs or if the transition is not found.
   """
-  jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
+  try:
+    transitions, _ = TransitionResolver.resolve(issue_key)
+    return _required_fields_for_transition(issue_key, transition_name, transitions)
+  except Exception as e:
+    logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Error: {e}')
+    return None
+
+@dryrun_response(MOCK_GET_REQUIRED_FIELDS_FOR_TRANSITION_RESPONSE)
+async def _aget_required_fields_for_transition(issue_key: str, transition_name: str) -> list[Any] | None:
+  """
+  Retrieves the required fields for a given transition in a JIRA issue without blocking the event loop.
 
+  Args:
+    issue_key (str): The key of the JIRA issue.
+    transition_name (str): The name of the transition to check.
+
+  Returns:
+    list: A list of required fields for the transition.
+          Returns None if an error occurs or if the transition is not found.
+  """
   try:
-    transition_url = f'{jira_server_url}/rest/api/3/issue/{issue_key}/transitions?expand=transitions.fields'
-    transition_response = requests.get(transition_url, headers=headers, auth=auth)
-
-    if transition_response.status_code == 200:
-      transitions_data = transition_response.json()
-      transitions = transitions_data.get('transitions', [])
-
-      for transition in transitions:
-        if transition['name'].lower().replace('-', '') == transition_name.lower().replace('-', ''):
-          fields = transition.get('fields', {})
-          required_fields = [field_name for field_name, field_data in fields.items() if field_data.get('required')]
-          logging.info(f'Required fields for transition {transition_name} on JIRA ticket {issue_key}: {required_fields}')
-          return required_fields
-
-      logging.warning(f"Transition '{transition_name}' not found for JIRA ticket {issue_key}.")
-      return None
-    else:
-      logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Status code: {transition_response.status_code}, Response: {transition_response.text}')
-      return None
+    transitions, _ = await TransitionResolver.aresolve(issue_key)
+    return _required_fields_for_transition(issue_key, transition_name, transitions)
   except Exception as e:
     logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Error: {e}')
     return None
 
+def _required_fields_for_transition(issue_key: str, transition_name: str, transitions: list) -> list[Any] | None:
+  """
+  Extracts the required fields of a named transition from expanded transitions.
+
+  Args:
+    issue_key (str): The key of the JIRA issue.
+    transition_name (str): The name of the transition to check.
+    transitions (list): The transitions of the issue, with their fields expanded.
+
+  Returns:
+    list: A list of required fields for the transition, or None if it is not found.
+  """
+  transition = _find_transition(transitions, transition_name)
+  if transition is None:
+    logging.warning(f"Transition '{transition_name}' not found for JIRA ticket {issue_key}.")
+    return None
+
+  fields = transition.get('fields', {})
+  required_fields = [field_name for field_name, field_data in fields.items() if field_data.get('required')]
+  logging.info(f'Required fields for transition {transition_name} on JIRA ticket {issue_key}: {required_fields}')
+  return required_fields
+
 @dryrun_response(MOCK_GET_JIRA_TRANSITIONS_RESPONSE)
 def _get_jira_transitions(issue_key: str) -> list:
   """
@@ -83,25 +111,65 @@ def _get_jira_transitions(issue_key: str) -> list:
           and contains the 'id' and 'name' of the transition.
           Returns None if an error occurs or if no transitions are found.
   """
-  jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
+  try:
+    transitions, _ = TransitionResolver.resolve(issue_key)
+    return _summarize_transitions(issue_key, transitions)
+  except Exception as e:
+    logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Error: {e}')
+    return None
+
+@dryrun_response(MOCK_GET_JIRA_TRANSITIONS_RESPONSE)
+async def _aget_jira_transitions(issue_key: str) -> list:
+  """
+  Retrieves available transitions for a given JIRA issue without blocking the event loop.
+
+  Args:
+    issue_key (str): The key of the JIRA issue.
 
+  Returns:
+    list: A list of dictionaries, where each dictionary represents a transition
+          and contains the 'id' and 'name' of the transition.
+          Returns None if an error occurs or if no transitions are found.
+  """
   try:
-    transition_url = f'{jira_server_url}/rest/api/3/issue/{issue_key}/transitions'
-    transition_response = requests.get(transition_url, headers=headers, auth=auth)
-
-    if transition_response.status_code == 200:
-      transitions_data = transition_response.json()
-      transitions = transitions_data.get('transitions', [])
-      transition_list = [{'id': transition['id'], 'name': transition['name']} for transition in transitions]
-      logging.info(f'Available transitions for JIRA ticket {issue_key}: {transition_list}')
-      return transition_list
-    else:
-      logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Status code: {transition_response.status_code}, Response: {transition_response.text}')
-      return None
+    transitions, _ = await TransitionResolver.aresolve(issue_key)
+    return _summarize_transitions(issue_key, transitions)
   except Exception as e:
     logging.error(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Error: {e}')
     return None
 
+def _summarize_transitions(issue_key: str, transitions: list) -> list:
+  """
+  Reduces transitions to a list of `{'id', 'name'}` dictionaries.
+
+  Args:
+    issue_key (str): The key of the JIRA issue.
+    transitions (list): The transitions of the issue.
+
+  Returns:
+    list: The available transitions.
+  """
+  transition_list = [{'id': transition['id'], 'name': transition['name']} for transition in transitions]
+  logging.info(f'Available transitions for JIRA ticket {issue_key}: {transition_list}')
+  return transition_list
+
+def _find_transition(transitions: list, transition_name: str) -> dict | None:
+  """
+  Finds a transition by name, ignoring case and hyphens.
+
+  Args:
+    transitions (list): Transition dictionaries with at least a 'name' key.
+    transition_name (str): The name of the transition to look for.
+
+  Returns:
+    dict: The matching transition, or None if there is no match.
+  """
+  normalized_name = transition_name.lower().replace('-', '')
+  for transition in transitions:
+    if transition['name'].lower().replace('-', '') == normalized_name:
+      return transition
+  return None
+
 def get_jira_transitions(issue_key: str) -> LLMResponseOutput:
   """
   Retrieves available transitions for a given JIRA issue.
@@ -115,13 +183,88 @@ def get_jira_transitions(issue_key: str) -> LLMResponseOutput:
           Returns None if an error occurs or if no transitions are found.
   """
   transition_list = _get_jira_transitions(issue_key=issue_key)
+  return _jira_transitions_response(issue_key, transition_list)
+
+async def aget_jira_transitions(issue_key: str) -> LLMResponseOutput:
+  """
+  Retrieves available transitions for a given JIRA issue.
+
+  Args:
+    issue_key (str): The key of the JIRA issue.
+
+  Returns:
+    list: A list of dictionaries, where each dictionary represents a transition
+          and contains the 'id' and 'name' of the transition.
+          Returns None if an error occurs or if no transitions are found.
+  """
+  transition_list = await _aget_jira_transitions(issue_key=issue_key)
+  return _jira_transitions_response(issue_key, transition_list)
+
+def _jira_transitions_response(issue_key: str, transition_list: list | None) -> LLMResponseOutput:
   logging.info(f'Available transitions for JIRA ticket {issue_key}: {transition_list}')
   if transition_list:
-    resp_str = f"Available transitions for JIRA ticket {issue_key}: {json.dumps(transition_list, indent=2)}"
+    prefix = f"Available transitions for JIRA ticket {issue_key}:"
+    resp_str = encode_tool_output(
+      "get_jira_transitions", transition_list, prefix=prefix,
+      baseline=f"{prefix} {json.dumps(transition_list, indent=2)}",
+    )
     return LLMResponseOutput(response=resp_str)
 
   return LLMResponseOutput(response="Failed to retrieve transitions for JIRA ticket.")
 
+def _build_transition_payload(
+        issue_key: str,
+        resolution_id: str,
+        transition_name: str,
+        transitions: list | None
+) -> tuple[dict, dict]:
+  """
+  Builds the JSON body for a transition POST from the issue's expanded transitions.
+
+  Returns:
+      tuple: The request body and the transition it performs.
+
+  Raises:
+      Exception: If the issue has no transitions or the named transition does not exist.
+  """
+  if not transitions:
+    raise Exception(f"No transitions found for JIRA ticket {issue_key}.")
+
+  transition = _find_transition(transitions, transition_name)
+  if not transition:
+    raise Exception(f"Transition '{transition_name}' not found for JIRA ticket {issue_key}.")
+
+  required_fields = _required_fields_for_transition(issue_key, transition_name, transitions)
+
+  payload = {
+    'transition': {
+      'id': str(transition['id'])
+    }
+  }
+
+  fields = {}
+  logging.info(f'Required fields for transition {transition_name} on JIRA ticket {issue_key}: {json.dumps(required_fields, indent=2)}')
+  if required_fields:
+    for field_name in required_fields:
+      field_value = None
+      if field_name == 'resolution':
+        field_value = {'id': str(resolution_id)}
+        if resolution_id:
+          fields['resolution'] = field_value
+
+  if fields:
+    payload['fields'] = fields
+
+  return payload, transition
+
+def _transition_result(issue_key: str, transition_name: str, transition_response) -> str:
+  if transition_response.status_code == 204:
+    logging.info(f'JIRA ticket {issue_key} transitioned to state {transition_name} successfully.')
+    return f"JIRA ticket transitioned to {transition_name} successfully."
+  else:
+    logging.error(f'Failed to transition JIRA ticket {issue_key} to state {transition_name}. Status code: {transition_response.status_code}, Response: {transition_response.text}')
+    raise Exception(f"Failed to transition JIRA ticket {issue_key} to state {transition_name}. Status code: {transition_response.status_code}, Response: {transition_response.text}")
+
 @dryrun_response(MOCK_PERFORM_JIRA_TRANSITION_RESPONSE)
 def _perform_jira_transition(
         issue_key: str,
@@ -143,58 +286,65 @@ def _perform_jira_transition(
       Exception: If the JIRA API request fails or encounters an error. The exception will contain details about the failure, including the HTTP status code and response text (if available).
   """
   logging.info(f'Attempting to transition JIRA ticket {issue_key} to state {transition_name} with resolution ID {resolution_id}.')
-  jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
-
   try:
-    transition_url = f'{jira_server_url}/rest/api/3/issue/{issue_key}/transitions'
-    available_transitions = _get_jira_transitions(issue_key)
-    if not available_transitions:
-      raise Exception(f"No transitions found for JIRA ticket {issue_key}.")
-
-    transition_id = None
-    for transition in available_transitions:
-      if transition['name'].lower().replace('-', '') == transition_name.lower().replace('-', ''):
-        transition_id = transition['id']
-        break
-
-    if not transition_id:
-      raise Exception(f"Transition '{transition_name}' not found for JIRA ticket {issue_key}.")
-
-    payload = {
-      'transition': {
-        'id': str(transition_id)
-      }
-    }
+    transitions, cached = TransitionResolver.resolve(issue_key)
+    if cached and not _find_transition(transitions, transition_name):
+      transitions, cached = TransitionResolver.resolve(issue_key, refresh=True)
+    payload, transition = _build_transition_payload(issue_key, resolution_id, transition_name, transitions)
+
+    transition_response = JiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/transitions', payload)
+    if cached and transition_response.status_code in _STALE_TRANSITION_STATUS_CODES:
+      logging.info(f'Cached transitions for JIRA ticket {issue_key} are stale, retrying with fresh ones.')
+      TransitionResolver.invalidate(issue_key)
+      transitions, _ = TransitionResolver.resolve(issue_key, refresh=True)
+      payload, transition = _build_transition_payload(issue_key, resolution_id, transition_name, transitions)
+      transition_response = JiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/transitions', payload)
+
+    result = _transition_result(issue_key, transition_name, transition_response)
+    TransitionResolver.record_transition(issue_key, transition)
+    return result
+  except Exception as e:
+    logging.error(f'Failed to transition JIRA ticket {issue_key} to state {transition_name}. Error: {e}')
+    raise e
 
-    required_fields = _get_required_fields_for_transition(issue_key, transition_name)
-    fields = {}
-    logging.info(f'Required fields for transition {transition_name} on JIRA ticket {issue_key}: {json.dumps(required_fields, indent=2)}')
-    if required_fields:
-      for field_name in required_fields:
-        field_value = None
-        if field_name == 'resolution':
-          field_value = {'id': str(resolution_id)}
-          if resolution_id:
-            fields['resolution'] = field_value
-
-    if fields:
-      payload['fields'] = fields
-
-    payload = json.dumps(payload)
-
-    transition_response = requests.post(
-      transition_url,
-      data=payload,
-      headers=headers,
-      auth=auth
-    )
+@dryrun_response(MOCK_PERFORM_JIRA_TRANSITION_RESPONSE)
+async def _aperform_jira_transition(
+        issue_key: str,
+        resolution_id: str,
+        transition_name: str
+) -> str:
+  """
+  Transitions a JIRA ticket to a specified state without blocking the event loop.
+
+  Args:
+      issue_key (str): The key of the JIRA issue to transition.
+      transition_name (str): The name of the transition to perform.
+      resolution_id (str, optional): The ID of the resolution to set when transitioning to a resolved state. Defaults to None.
+
+  Returns:
+      str: A message indicating the result of the transition.
 
-    if transition_response.status_code == 204:
-      logging.info(f'JIRA ticket {issue_key} transitioned to state {transition_name} successfully.')
-      return f"JIRA ticket transitioned to {transition_name} successfully."
-    else:
-      logging.error(f'Failed to transition JIRA ticket {issue_key} to state {transition_name}. Status code: {transition_response.status_code}, Response: {transition_response.text}')
-      raise Exception(f"Failed to transition JIRA ticket {issue_key} to state {transition_name}. Status code: {transition_response.status_code}, Response: {transition_response.text}")
+  Raises:
+      Exception: If the JIRA API request fails or encounters an error.
+  """
+  logging.info(f'Attempting to transition JIRA ticket {issue_key} to state {transition_name} with resolution ID {resolution_id}.')
+  try:
+    transitions, cached = await TransitionResolver.aresolve(issue_key)
+    if cached and not _find_transition(transitions, transition_name):
+      transitions, cached = await TransitionResolver.aresolve(issue_key, refresh=True)
+    payload, transition = _build_transition_payload(issue_key, resolution_id, transition_name, transitions)
+
+    transition_response = await AsyncJiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/transitions', payload)
+    if cached and transition_response.status_code in _STALE_TRANSITION_STATUS_CODES:
+      logging.info(f'Cached transitions for JIRA ticket {issue_key} are stale, retrying with fresh ones.')
+      TransitionResolver.invalidate(issue_key)
+      transitions, _ = await TransitionResolver.aresolve(issue_key, refresh=True)
+      payload, transition = _build_transition_payload(issue_key, resolution_id, transition_name, transitions)
+      transition_response = await AsyncJiraRESTClient.request("POST", f'/rest/api/3/issue/{issue_key}/transitions', payload)
+
+    result = _transition_result(issue_key, transition_name, transition_response)
+    TransitionResolver.record_transition(issue_key, transition)
+    return result
   except Exception as e:
     logging.error(f'Failed to transition JIRA ticket {issue_key} to state {transition_name}. Error: {e}')
     raise e
@@ -218,5 +368,27 @@ def perform_jira_transition(
   try:
     result = _perform_jira_transition(issue_key, resolution_id, transition_name)
     return LLMResponseOutput(response=result)
+  except Exception as e:
+    return LLMResponseOutput(response=f"Failed to transition JIRA ticket to {transition_name}. Error: {str(e)}")
+
+async def aperform_jira_transition(
+        issue_key: str,
+        resolution_id: str,
+        transition_name: str
+) -> LLMResponseOutput:
+  """
+  Transitions a JIRA ticket to a specified state.
+
+  Args:
+      issue_key (str): The key of the JIRA issue to transition.
+      transition_name (str): The name of the transition to perform.
+      resolution_id (str, optional): The ID of the resolution to set when transitioning to a resolved state. Defaults to None.
+
+  Returns:
+      LLMResponseOutput: A message indicating the result of the transition.
+  """
+  try:
+    result = await _aperform_jira_transition(issue_key, resolution_id, transition_name)
+    return LLMResponseOutput(response=result)
   except Exception as e:
     return LLMResponseOutput(response=f"Failed to transition JIRA ticket to {transition_name}. Error: {str(e)}")
\ No newline at end of file
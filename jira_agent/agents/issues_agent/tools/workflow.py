@@ -0,0 +1,169 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from jira_agent.utils.cache import MISSING, TTLCache
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.codec import decode_response
+from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.jira_client.issue_fetch import IssueFetcher
+from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.run_context import run_cache
+
+# (project key, issue type id, status id)
+WorkflowState = Tuple[str, str, str]
+
+_ISSUE_WORKFLOW_PARAMS = {'fields': 'project,issuetype,status', 'expand': 'transitions.fields'}
+
+
+class TransitionResolver:
+  """
+  Resolves the transitions available on a Jira issue, with their fields.
+
+  Transitions are fetched together with the issue's project, issue type and
+  status in a single request, and the result is cached per workflow state
+  (project, issue type, status). Within a run the state of every issue seen
+  is remembered, and updated when the run transitions it, so transitioning
+  an issue again in the same run needs no request at all.
+
+  Transition conditions can depend on the issue itself, so a cached workflow
+  state is only a best guess; callers retry with `refresh=True` when Jira
+  rejects a transition resolved from the cache.
+  """
+  _cache = None
+  _lock = threading.Lock()
+
+  @classmethod
+  def get_cache(cls, config: JiraConfig | None = None) -> TTLCache:
+    """Return the shared workflow cache, creating it on first use."""
+    if cls._cache is None:
+      with cls._lock:
+        if cls._cache is None:
+          if config is None:
+            JiraRESTClient.get_auth_instance()
+            config = JiraRESTClient._config
+          cls._cache = TTLCache(
+            maxsize=config.JIRA_WORKFLOW_CACHE_MAXSIZE,
+            ttl=config.JIRA_WORKFLOW_CACHE_TTL_SECONDS,
+          )
+    return cls._cache
+
+  @staticmethod
+  def _issue_states() -> Dict[str, WorkflowState]:
+    return run_cache("issue_workflow_state")
+
+  @classmethod
+  def _cached(cls, issue_key: str) -> Optional[list]:
+    state = cls._issue_states().get(issue_key)
+    if state is None:
+      return None
+    transitions = cls.get_cache().lookup(state)
+    return None if transitions is MISSING else transitions
+
+  @classmethod
+  def _store(cls, issue_key: str, issue: dict) -> list:
+    fields = issue.get('fields', {})
+    state = (
+      fields['project']['key'],
+      str(fields['issuetype']['id']),
+      str(fields['status']['id']),
+    )
+    transitions = issue.get('transitions', [])
+    cls._issue_states()[issue_key] = state
+    cls.get_cache().set(state, transitions)
+    logging.info(f'Fetched {len(transitions)} transitions for JIRA ticket {issue_key} in workflow state {state}')
+    return transitions
+
+  @staticmethod
+  def _raise_for_status(issue_key: str, response):
+    if response.status_code != 200:
+      raise Exception(f'Failed to retrieve transitions for JIRA ticket {issue_key}. Status code: {response.status_code}, Response: {response.text}')
+
+  @classmethod
+  def resolve(cls, issue_key: str, refresh: bool = False) -> Tuple[list, bool]:
+    """
+    Return the transitions available on an issue, with their fields expanded.
+
+    Args:
+      issue_key (str): The key of the JIRA issue.
+      refresh (bool): Ignore cached transitions and fetch them from Jira.
+
+    Returns:
+      tuple: The transitions, and whether they were served from the cache.
+
+    Raises:
+      Exception: If the request to Jira fails.
+    """
+    if not refresh:
+      transitions = cls._cached(issue_key)
+      if transitions is not None:
+        return transitions, True
+
+    response = JiraRESTClient.request("GET", f'/rest/api/3/issue/{issue_key}', params=_ISSUE_WORKFLOW_PARAMS)
+    cls._raise_for_status(issue_key, response)
+    return cls._store(issue_key, decode_response(response)), False
+
+  @classmethod
+  async def aresolve(cls, issue_key: str, refresh: bool = False) -> Tuple[list, bool]:
+    """Async variant of `resolve`."""
+    if not refresh:
+      transitions = cls._cached(issue_key)
+      if transitions is not None:
+        return transitions, True
+
+    response = await AsyncJiraRESTClient.request("GET", f'/rest/api/3/issue/{issue_key}', params=_ISSUE_WORKFLOW_PARAMS)
+    cls._raise_for_status(issue_key, response)
+    return cls._store(issue_key, decode_response(response)), False
+
+  @classmethod
+  def record_transition(cls, issue_key: str, transition: dict):
+    """
+    Move an issue to the target status of a transition it just went through.
+
+    Args:
+      issue_key (str): The key of the JIRA issue.
+      transition (dict): The transition performed, as returned by `resolve`.
+    """
+    IssueFetcher.invalidate(issue_key)
+    states = cls._issue_states()
+    state = states.get(issue_key)
+    target = transition.get('to', {}).get('id')
+    if state is None or target is None:
+      states.pop(issue_key, None)
+      return
+    states[issue_key] = (state[0], state[1], str(target))
+
+  @classmethod
+  def invalidate(cls, issue_key: str):
+    """Forget the workflow state of an issue and its cached transitions."""
+    state = cls._issue_states().pop(issue_key, None)
+    if state is not None and cls._cache is not None:
+      cls._cache.invalidate(state)
+
+  @classmethod
+  def stats(cls) -> Dict[str, int]:
+    """Return hit/miss counters of the workflow cache (empty before first use)."""
+    return cls._cache.stats() if cls._cache is not None else {}
+
+  @classmethod
+  def reset(cls):
+    """Drop the shared cache; the next lookup recreates it from the current config."""
+    with cls._lock:
+      cls._cache = None
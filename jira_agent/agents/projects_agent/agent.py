@@ -14,8 +14,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from jira_agent.common.llm import get_llm
-from langgraph.prebuilt import create_react_agent
+from jira_agent.common.react_agent import create_jira_react_agent
 
 from jira_agent.agents.projects_agent.models import LLMResponseOutput
 
@@ -31,9 +30,8 @@ class ProjectsAgent:
         self.prompt=prompt.format(additional_context="")
 
     def agent(self):
-        agent = create_react_agent(
+        agent = create_jira_react_agent(
             name=self.name,
-            model=get_llm(),
             tools=self.tools,
             prompt=self.prompt,
             response_format=LLMResponseOutput
@@ -14,16 +14,24 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from langchain_core.tools import StructuredTool
+
 from .projects import (
   get_jira_project_by_name,
   create_jira_project,
   update_jira_project_description,
   update_jira_project_lead,
+  aget_jira_project_by_name,
+  acreate_jira_project,
+  aupdate_jira_project_description,
+  aupdate_jira_project_lead,
 )
 
+# Each tool carries a sync and an async implementation; the react agent uses the
+# coroutine when the graph is run with `ainvoke`/`astream`.
 tools = [
-  get_jira_project_by_name,
-  create_jira_project,
-  update_jira_project_description,
-  update_jira_project_lead,
+  StructuredTool.from_function(func=get_jira_project_by_name, coroutine=aget_jira_project_by_name),
+  StructuredTool.from_function(func=create_jira_project, coroutine=acreate_jira_project),
+  StructuredTool.from_function(func=update_jira_project_description, coroutine=aupdate_jira_project_description),
+  StructuredTool.from_function(func=update_jira_project_lead, coroutine=aupdate_jira_project_lead),
 ]
\ No newline at end of file
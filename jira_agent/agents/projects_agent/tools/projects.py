@@ -14,8 +14,6 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from langchain_core.tools import tool
-
 from jira_agent.common.logging_config import logging
 
 from jira_agent.agents.projects_agent.models import LLMResponseOutput
@@ -31,10 +29,13 @@ from .utils import (
   _get_jira_project_by_name,
   _create_jira_project,
   _update_jira_project_description,
-  _update_jira_project_lead
+  _update_jira_project_lead,
+  _aget_jira_project_by_name,
+  _acreate_jira_project,
+  _aupdate_jira_project_description,
+  _aupdate_jira_project_lead
 )
 
-@tool
 def get_jira_project_by_name(input: GetJiraProjectByNameInput) -> LLMResponseOutput:
   """
   Get a Jira Project by name.
@@ -56,7 +57,27 @@ def get_jira_project_by_name(input: GetJiraProjectByNameInput) -> LLMResponseOut
   logging.debug(f"tool output:{resp}")
   return resp
 
-@tool
+async def aget_jira_project_by_name(input: GetJiraProjectByNameInput) -> LLMResponseOutput:
+  """
+  Get a Jira Project by name.
+
+  Args:
+  input (GetJiraProjectByNameInput):
+    The user-provided input that guides the jira projects retrieval.
+    This request is serialized from a `GetJiraProjectByNameInput` object,
+    which must have a `model_dump()` method for JSON conversion.
+
+  Returns:
+  LLMResponseOutput:
+    A JSON representation of the LLMResponseOutput.
+    This response is serialized from a `LLMResponseOutput` object,
+    which must have a `model_dump()` method for JSON conversion.
+  """
+  logging.debug(f"tool input:{input}")
+  resp = await _aget_jira_project_by_name(input)
+  logging.debug(f"tool output:{resp}")
+  return resp
+
 def create_jira_project(input: CreateJiraProjectInput) -> LLMResponseOutput:
   """
   Create a jira project and return the output.
@@ -78,7 +99,27 @@ def create_jira_project(input: CreateJiraProjectInput) -> LLMResponseOutput:
   logging.debug(f"tool output:{resp}")
   return resp
 
-@tool
+async def acreate_jira_project(input: CreateJiraProjectInput) -> LLMResponseOutput:
+  """
+  Create a jira project and return the output.
+
+  Args:
+    input (CreateJiraProjectInput):
+      The user-provided input that guides the jira project creation.
+      This request is serialized from a `CreateJiraProjectInput` object,
+      which must have a `model_dump()` method for JSON conversion.
+
+  Returns:
+    LLMResponseOutput:
+      A JSON representation of the LLMResponseOutput.
+      This response is serialized from a `LLMResponseOutput` object,
+      which must have a `model_dump()` method for JSON conversion.
+  """
+  logging.debug(f"tool input:{input}")
+  resp = await _acreate_jira_project(input)
+  logging.debug(f"tool output:{resp}")
+  return resp
+
 def update_jira_project_description(input: UpdateJiraProjectDescriptionInput) -> LLMResponseOutput:
   """
   Update a jira project description and return the output.
@@ -99,7 +140,26 @@ def update_jira_project_description(input: UpdateJiraProjectDescriptionInput) ->
   logging.debug(f"tool output:{resp}")
   return resp
 
-@tool
+async def aupdate_jira_project_description(input: UpdateJiraProjectDescriptionInput) -> LLMResponseOutput:
+  """
+  Update a jira project description and return the output.
+  Args:
+    input (UpdateJiraProjectDescriptionInput):
+      The user-provided input that guides the jira project description updation.
+      This request is serialized from a `UpdateJiraProjectDescriptionInput` object,
+      which must have a `model_dump()` method for JSON conversion.
+
+  Returns:
+    LLMResponseOutput:
+      A JSON representation of the LLMResponseOutput.
+      This response is serialized from a `LLMResponseOutput` object,
+      which must have a `model_dump()` method for JSON conversion.
+  """
+  logging.debug(f"tool input:{input}")
+  resp = await _aupdate_jira_project_description(input)
+  logging.debug(f"tool output:{resp}")
+  return resp
+
 def update_jira_project_lead(input: UpdateJiraProjectLeadInput) -> LLMResponseOutput:
   """
   Update a jira project lead and return the output.
@@ -120,3 +180,24 @@ def update_jira_project_lead(input: UpdateJiraProjectLeadInput) -> LLMResponseOu
   resp = _update_jira_project_lead(input)
   logging.debug(f"tool output:{resp}")
   return resp
+
+async def aupdate_jira_project_lead(input: UpdateJiraProjectLeadInput) -> LLMResponseOutput:
+  """
+  Update a jira project lead and return the output.
+
+  Args:
+    input (UpdateJiraProjectLeadInput):
+      The user-provided input that guides the jira project lead updation.
+      This request is serialized from a `UpdateJiraProjectLeadInput` object,
+      which must have a `model_dump()` method for JSON conversion.
+
+  Returns:
+    LLMResponseOutput:
+      A JSON representation of the LLMResponseOutput.
+      This response is serialized from a `LLMResponseOutput` object,
+      which must have a `model_dump()` method for JSON conversion.
+  """
+  logging.debug(f"tool input:{input}")
+  resp = await _aupdate_jira_project_lead(input)
+  logging.debug(f"tool output:{resp}")
+  return resp
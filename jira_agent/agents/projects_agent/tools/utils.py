@@ -14,7 +14,6 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 import logging
 import re
 
@@ -33,7 +32,11 @@ from .dryrun.mock_responses import (
 )
 
 from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.codec import dumps
+from jira_agent.utils.jira_client.identity import IdentityCache
 from jira_agent.utils.dryrun_utils import dryrun_response
+from jira_agent.utils.tool_output import encode_tool_output, select_fields
 
 from jira_agent.common.config import INTERNAL_ERROR_MESSAGE
 
@@ -60,21 +63,28 @@ def _get_jira_project_by_name(input: GetJiraProjectByNameInput) -> LLMResponseOu
   try:
     url_path = f"/rest/api/3/project/search?query={input.name}"
     jira_resp = JiraRESTClient.jira_request_get(url_path)
-    jira_resp_json = json.loads(jira_resp)
-    if 'error' in jira_resp_json and 'exception' in jira_resp_json:
-      response_str = f"{INTERNAL_ERROR_MESSAGE}:{jira_resp}"
-    else:
-      project_urls = _parse_project_url_from_get_jira_project_by_name(jira_resp_json)
-      # project_key = _parse_project_key_from_get_jira_project_by_name(jira_resp_json)
-      if len(project_urls) == 0:
-        response_str = f"{INTERNAL_ERROR_MESSAGE}:No projects found for {input.name}, {jira_resp}"
-      elif len(project_urls) > 1:
-        response_str = (f"{INTERNAL_ERROR_MESSAGE}:Multiple projects found for {input.name}, {jira_resp}. "
-                        f"Please try using the unique project key instead of project name")
-      else:
-        response_str = f'{project_urls[0]}, {jira_resp}'
+    return _get_jira_project_by_name_response(input, jira_resp)
+
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(LLMResponseOutput(response=MOCK_GET_PROJECT_KEY_BY_NAME_RESPONSE))
+async def _aget_jira_project_by_name(input: GetJiraProjectByNameInput) -> LLMResponseOutput:
+  """
+  Retrieves a Jira project by name without blocking the event loop.
 
-    return LLMResponseOutput(response=response_str)
+  Args:
+    input (GetJiraProjectByNameInput):
+      The user-provided input that guides the retrieval of Jira projects.
+
+  Returns:
+    LLMResponseOutput:
+      A JSON representation of the response.
+  """
+  try:
+    url_path = f"/rest/api/3/project/search?query={input.name}"
+    jira_resp = await AsyncJiraRESTClient.jira_request_get(url_path)
+    return _get_jira_project_by_name_response(input, jira_resp)
 
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
@@ -106,25 +116,37 @@ def _create_jira_project(input: CreateJiraProjectInput) -> LLMResponseOutput:
         return LLMResponseOutput(response=f"{INTERNAL_ERROR_MESSAGE}: {input.leadAccountId} not found in Jira")
 
     url_path = "/rest/api/3/project"
+    jira_resp = JiraRESTClient.jira_request_post(url_path, _create_jira_project_payload(input, leadAccountId))
+    return _project_url_response(jira_resp)
 
-    payload = json.dumps({
-      "assigneeType": "PROJECT_LEAD",
-      "description": input.description,
-      "key": input.key,
-      "leadAccountId": leadAccountId,
-      "name": input.name,
-      "projectTypeKey": input.projectTypeKey
-    })
-
-    jira_resp = JiraRESTClient.jira_request_post(url_path, payload)
-    jira_resp_json = json.loads(jira_resp)
-    if 'error' in jira_resp_json and 'exception' in jira_resp_json:
-      response_str = f"{INTERNAL_ERROR_MESSAGE}:{jira_resp}"
-    else:
-      project_url = jira_resp_json['self']
-      response_str = project_url
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(LLMResponseOutput(response=MOCK_CREATE_PROJECT_RESPONSE))
+async def _acreate_jira_project(input: CreateJiraProjectInput) -> LLMResponseOutput:
+  """
+  create a jira project without blocking the event loop and return the output.
 
-    return LLMResponseOutput(response=response_str)
+  Args:
+    input (CreateJiraProjectInput):
+      The user-provided input that guides the jira project creation.
+
+   Returns:
+    LLMResponseOutput:
+      A JSON representation of the LLMResponseOutput.
+  """
+  try:
+    leadAccountId = input.leadAccountId
+    if is_valid_email(input.leadAccountId):
+      account_id = await _aget_jira_accountID_by_user_email(input.leadAccountId)
+      if account_id:
+        leadAccountId = account_id
+      else:
+        return LLMResponseOutput(response=f"{INTERNAL_ERROR_MESSAGE}: {input.leadAccountId} not found in Jira")
+
+    url_path = "/rest/api/3/project"
+    jira_resp = await AsyncJiraRESTClient.jira_request_post(url_path, _create_jira_project_payload(input, leadAccountId))
+    return _project_url_response(jira_resp)
 
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
@@ -147,19 +169,36 @@ def _update_jira_project_description(input: UpdateJiraProjectDescriptionInput) -
   try:
     url_path = "/rest/api/3/project/" + input.key
 
-    payload = json.dumps({
+    payload = {
       "description": input.description
-    })
+    }
 
     jira_resp = JiraRESTClient.jira_request_put(url_path, payload)
-    jira_resp_json = json.loads(jira_resp)
-    if 'error' in jira_resp_json and 'exception' in jira_resp_json:
-      response_str = f"{INTERNAL_ERROR_MESSAGE}:{jira_resp}"
-    else:
-      project_url = jira_resp_json['self']
-      response_str = project_url
+    return _project_url_response(jira_resp)
+
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(LLMResponseOutput(response=MOCK_UPDATE_PROJECT_DESCRIPTION_RESPONSE))
+async def _aupdate_jira_project_description(input: UpdateJiraProjectDescriptionInput) -> LLMResponseOutput:
+  """update a jira project description without blocking the event loop and return the output.
+       Args:
+       input (UpdateJiraProjectDescriptionInput):
+           The user-provided input that guides the jira project description updation.
+
+   Returns:
+       LLMResponseOutput:
+           A JSON representation of the LLMResponseOutput.
+  """
+  try:
+    url_path = "/rest/api/3/project/" + input.key
+
+    payload = {
+      "description": input.description
+    }
 
-    return LLMResponseOutput(response=response_str)
+    jira_resp = await AsyncJiraRESTClient.jira_request_put(url_path, payload)
+    return _project_url_response(jira_resp)
 
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
@@ -190,25 +229,90 @@ def _update_jira_project_lead(input: UpdateJiraProjectLeadInput) -> LLMResponseO
 
     url_path = "/rest/api/3/project/" + input.key
 
-    payload = json.dumps({
+    payload = {
       "leadAccountId": leadAccountId
-    })
+    }
 
     jira_resp = JiraRESTClient.jira_request_put(url_path, payload)
-    jira_resp_json = json.loads(jira_resp)
-    if 'error' in jira_resp_json and 'exception' in jira_resp_json:
-      response_str = f"{INTERNAL_ERROR_MESSAGE}:{jira_resp}"
-    else:
-      project_url = jira_resp_json['self']
-      response_str = project_url
+    return _project_url_response(jira_resp)
+
+  except Exception as e:
+    return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
+
+@dryrun_response(LLMResponseOutput(response=MOCK_UPDATE_PROJECT_LEAD_RESPONSE))
+async def _aupdate_jira_project_lead(input: UpdateJiraProjectLeadInput) -> LLMResponseOutput:
+  """update a jira project lead without blocking the event loop and return the output.
+       Args:
+       input (UpdateJiraProjectLeadInput):
+           The user-provided input that guides the jira project lead updation.
+
+   Returns:
+       LLMResponseOutput:
+           A JSON representation of the LLMResponseOutput.
+  """
+  try:
+    leadAccountId = input.leadAccountId
+    if is_valid_email(input.leadAccountId):
+      account_id = await _aget_jira_accountID_by_user_email(input.leadAccountId)
+      if account_id:
+        leadAccountId = account_id
+      else:
+        return LLMResponseOutput(response=f"{INTERNAL_ERROR_MESSAGE}: {input.leadAccountId} not found in Jira")
+
+    url_path = "/rest/api/3/project/" + input.key
+
+    payload = {
+      "leadAccountId": leadAccountId
+    }
 
-    return LLMResponseOutput(response=response_str)
+    jira_resp = await AsyncJiraRESTClient.jira_request_put(url_path, payload)
+    return _project_url_response(jira_resp)
 
   except Exception as e:
     return LLMResponseOutput(response=INTERNAL_ERROR_MESSAGE + ":" + str(e))
 
 
 ################################ Util Helper functions ################################
+def _encode_projects(projects):
+  # The tool used to return the whitelisted fields as compact JSON already, on a single line
+  baseline = dumps(select_fields('get_jira_project_by_name', projects))
+  return encode_tool_output('get_jira_project_by_name', projects, baseline=baseline)
+
+def _get_jira_project_by_name_response(input: GetJiraProjectByNameInput, jira_resp_json: dict) -> LLMResponseOutput:
+  if 'error' in jira_resp_json and 'exception' in jira_resp_json:
+    response_str = f"{INTERNAL_ERROR_MESSAGE}:{dumps(jira_resp_json)}"
+  else:
+    project_urls = _parse_project_url_from_get_jira_project_by_name(jira_resp_json)
+    projects = jira_resp_json.get('values', [])
+    if len(project_urls) == 0:
+      response_str = f"{INTERNAL_ERROR_MESSAGE}:No projects found for {input.name}"
+    elif len(project_urls) > 1:
+      response_str = (f"{INTERNAL_ERROR_MESSAGE}:Multiple projects found for {input.name}, "
+                      f"{_encode_projects(projects)}. "
+                      f"Please try using the unique project key instead of project name")
+    else:
+      response_str = f"{project_urls[0]}, {_encode_projects(projects[0])}"
+
+  return LLMResponseOutput(response=response_str)
+
+def _project_url_response(jira_resp_json: dict) -> LLMResponseOutput:
+  if 'error' in jira_resp_json and 'exception' in jira_resp_json:
+    response_str = f"{INTERNAL_ERROR_MESSAGE}:{dumps(jira_resp_json)}"
+  else:
+    response_str = jira_resp_json['self']
+
+  return LLMResponseOutput(response=response_str)
+
+def _create_jira_project_payload(input: CreateJiraProjectInput, leadAccountId: str) -> dict:
+  return {
+    "assigneeType": "PROJECT_LEAD",
+    "description": input.description,
+    "key": input.key,
+    "leadAccountId": leadAccountId,
+    "name": input.name,
+    "projectTypeKey": input.projectTypeKey
+  }
+
 def _parse_project_url_from_get_jira_project_by_name(jira_resp_json):
   project_urls = []
   if 'total' in jira_resp_json and jira_resp_json['total'] != 0:
@@ -248,23 +352,52 @@ def is_valid_email(email):
 
 def _get_jira_accountID_by_user_email(user_email):
   try:
-    url_path = f"/rest/api/3/groupuserpicker?query={user_email}"
-    jira_resp = JiraRESTClient.jira_request_get(url_path)
-    user_data = json.loads(jira_resp)
+    return IdentityCache.resolve(user_email, _pick_jira_accountID_by_user_email)
 
-    # Extract accountId from the response
-    if 'users' in user_data:
-      if 'total' in user_data['users'] and user_data['users']['total'] == 0:
-        logging.error(f"User email: {user_email} not found in Jira")
-        return None
-      else:
-        if 'users' in user_data['users']:
-          # unique email - will have only one user
-          for user in user_data['users']['users']:
-            account_id = user['accountId']
-            return account_id
+  except Exception as e:
+    logging.error(f"Error getting Jira account ID for user email: {user_email}, error: {str(e)}")
+
+  return None
+
+
+async def _aget_jira_accountID_by_user_email(user_email):
+  try:
+    return await IdentityCache.aresolve(user_email, _apick_jira_accountID_by_user_email)
 
   except Exception as e:
     logging.error(f"Error getting Jira account ID for user email: {user_email}, error: {str(e)}")
 
   return None
+
+
+def _pick_jira_accountID_by_user_email(user_email):
+  # Uncached groupuserpicker lookup, used by IdentityCache on a miss
+  url_path = f"/rest/api/3/groupuserpicker?query={user_email}"
+  user_data = JiraRESTClient.jira_request_get(url_path)
+  return _parse_account_id_from_groupuserpicker(user_email, user_data)
+
+
+async def _apick_jira_accountID_by_user_email(user_email):
+  url_path = f"/rest/api/3/groupuserpicker?query={user_email}"
+  user_data = await AsyncJiraRESTClient.jira_request_get(url_path)
+  return _parse_account_id_from_groupuserpicker(user_email, user_data)
+
+
+def _parse_account_id_from_groupuserpicker(user_email, user_data):
+  # Surface request failures instead of reporting them as an unknown user
+  if 'error' in user_data:
+    raise Exception(user_data.get('exception', user_data['error']))
+
+  # Extract accountId from the response
+  if 'users' in user_data:
+    if 'total' in user_data['users'] and user_data['users']['total'] == 0:
+      logging.error(f"User email: {user_email} not found in Jira")
+      return None
+    else:
+      if 'users' in user_data['users']:
+        # unique email - will have only one user
+        for user in user_data['users']['users']:
+          account_id = user['accountId']
+          return account_id
+
+  return None
@@ -14,11 +14,24 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import inspect
+import uuid
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import END, START, StateGraph
+from langgraph.prebuilt import create_react_agent
+from langgraph.prebuilt.chat_agent_executor import AgentState
+from langgraph.types import Command
 from langgraph_supervisor import create_supervisor
+from langgraph_supervisor.handoff import create_handoff_back_messages, create_handoff_tool
 
 from jira_agent.agents.issues_agent.agent import IssuesAgent
 from jira_agent.agents.projects_agent.agent import ProjectsAgent
+from jira_agent.common.history import HANDOFF_TOOL_PREFIX, compacting_prompt
+from jira_agent.common.intent_router import build_intent_router
 from jira_agent.common.llm import get_llm
+from jira_agent.common.react_agent import is_final_answer, supervisor_routing
 from .prompt import prompt
 
 
@@ -27,6 +40,7 @@ from .prompt import prompt
 
 # SupervisorAgent acts as a router for the Jira agents.
 class SupervisorAgent:
+    router_name = "jira_intent_router"
 
     def __init__(self):
         self.name = "jira_supervisor"
@@ -36,7 +50,11 @@ class SupervisorAgent:
 
     def agent(self):
 
-        prompt = self.prompt
+        # Earlier handoffs and tool results are compacted before each supervisor call
+        prompt = compacting_prompt(self.prompt, keep_current_turn=False)
+
+        if supervisor_routing() == "direct":
+            return self.direct_return_graph(prompt)
 
         # returns a state graph
         graph = create_supervisor(
@@ -50,3 +68,90 @@ class SupervisorAgent:
         )
 
         return graph
+
+    def direct_return_graph(self, prompt):
+        """
+        Build the supervisor graph with direct-return routing.
+
+        Same graph as `create_supervisor(..., output_mode="full_history")`, except
+        that a sub-agent answer marked as final (see `is_final_answer`) ends the
+        run instead of going back to the supervisor for one more LLM turn. Other
+        answers are handed back to the supervisor, e.g. for multi-domain requests.
+
+        Unless `JIRA_AGENT_INTENT_ROUTING` is none, requests whose intent is obvious
+        are handed off to their sub-agent before the supervisor LLM is called.
+
+        Args:
+            prompt: The supervisor prompt.
+
+        Returns:
+            StateGraph: The supervisor state graph.
+        """
+        handoff_tools = [create_handoff_tool(agent_name=agent.name) for agent in self.agents]
+        model = get_llm()
+        # One handoff at a time, as create_supervisor does
+        if "parallel_tool_calls" in inspect.signature(model.bind_tools).parameters:
+            model = model.bind_tools(handoff_tools, parallel_tool_calls=False)
+        else:
+            model = model.bind_tools(handoff_tools)
+        supervisor = create_react_agent(
+            name=self.name,
+            model=model,
+            tools=handoff_tools,
+            prompt=prompt,
+        )
+
+        graph = StateGraph(AgentState)
+        graph.add_node(supervisor, destinations=tuple(agent.name for agent in self.agents) + (END,))
+        router = build_intent_router()
+        if router is None:
+            graph.add_edge(START, self.name)
+        else:
+            graph.add_node(
+                self.router_name,
+                self._pre_route(router),
+                destinations=(self.name,) + tuple(agent.name for agent in self.agents),
+            )
+            graph.add_edge(START, self.router_name)
+        for agent in self.agents:
+            graph.add_node(agent.name, self._call_agent(agent))
+            graph.add_conditional_edges(agent.name, self._route_agent_answer, [self.name, END])
+        return graph
+
+    def _pre_route(self, router):
+        def pre_route(state: dict) -> Command:
+            request = state["messages"][-1]
+            agent = None
+            if isinstance(request, HumanMessage) and isinstance(request.content, str):
+                agent = router.route(request.content)
+            if agent is None:
+                return Command(goto=self.name)
+            # The same messages as a supervisor handoff, so the sub-agent and history compaction see a normal turn
+            tool_name, tool_call_id = f"{HANDOFF_TOOL_PREFIX}{agent}", str(uuid.uuid4())
+            return Command(goto=agent, update={"messages": [
+                AIMessage(content="", name=self.name, tool_calls=[{"name": tool_name, "args": {}, "id": tool_call_id}]),
+                ToolMessage(content=f"Successfully transferred to {agent}", name=tool_name, tool_call_id=tool_call_id),
+            ]})
+
+        return pre_route
+
+    def _call_agent(self, agent):
+        def process_output(output: dict) -> dict:
+            messages = list(output["messages"])
+            if is_final_answer(messages):
+                # The caller gets the sub-agent's own answer as the last message
+                messages.append(AIMessage(content=messages[-1].content, name=agent.name))
+            else:
+                messages.extend(create_handoff_back_messages(agent.name, self.name))
+            return {**output, "messages": messages}
+
+        def call_agent(state: dict) -> dict:
+            return process_output(agent.invoke(state))
+
+        async def acall_agent(state: dict) -> dict:
+            return process_output(await agent.ainvoke(state))
+
+        return RunnableLambda(call_agent, afunc=acall_agent)
+
+    def _route_agent_answer(self, state: dict) -> str:
+        return END if is_final_answer(state["messages"][:-1]) else self.name
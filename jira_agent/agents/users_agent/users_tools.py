@@ -14,12 +14,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import json
 import logging
 
+from jira_agent.agents.projects_agent.tools.utils import _pick_jira_accountID_by_user_email
 from jira_agent.common.config import INTERNAL_ERROR_MESSAGE
 from jira_agent.utils.dryrun_utils import dryrun_response
-from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.jira_client.identity import IdentityCache
 from users_models import GetJiraAccountIdByUserEmailInput
 from users_models import JiraUserOutput
 
@@ -49,20 +49,12 @@ def get_jira_accountID_by_user_email(input: GetJiraAccountIdByUserEmailInput) ->
         if not input or input is None:
             return JiraUserOutput(response="error performing the operation")
 
-        url_path = f"/rest/api/3/groupuserpicker?query={input.user_email}"
-        jira_resp = JiraRESTClient.jira_request_get(url_path)
-        user_data = json.loads(jira_resp)
-
-        # Extract accountId from the response
-        account_id = None
-        if 'users' in user_data and 'users' in user_data['users']:
-            for user in user_data['users']['users']:
-                account_id = user['accountId']
+        account_id = IdentityCache.resolve(input.user_email, _pick_jira_accountID_by_user_email)
 
         if account_id:
             response_str = f"{account_id} for user email: {input.user_email}"
         else:
-            response_str = f"Could not find Jira account ID for user email: {input.user_email}, user details: {jira_resp}"
+            response_str = f"Could not find Jira account ID for user email: {input.user_email}"
 
         resp = JiraUserOutput(response=response_str)
         logging.debug(f"tool output:{resp}")
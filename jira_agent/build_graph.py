@@ -26,7 +26,7 @@ def build_graph():
      Returns:
      CompiledGraph: A compiled LangGraph instance.
      """
-  jira_graph = JiraGraph()
+  jira_graph = JiraGraph.get_instance()
   return jira_graph.get_graph()
 
 
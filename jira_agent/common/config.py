@@ -30,6 +30,19 @@ class Settings(BaseSettings):
   PROJECT_NAME: str = "Jira Agent"
   DESCRIPTION: str = "Agent serving jira operations via natural language"
 
+  # Run execution settings
+  JIRA_AGENT_MAX_CONCURRENT_RUNS: int = 32  # runs executing at once per process; extra runs wait for a slot
+  JIRA_AGENT_DISCONNECT_POLL_SECONDS: float = 0.5  # how often a run checks whether its client went away
+  JIRA_AGENT_RUN_QUEUE_SIZE: int = 256  # runs allowed to wait for a worker before new runs get 503
+  JIRA_AGENT_RUN_HISTORY_SIZE: int = 1000  # finished runs kept for status polling
+  JIRA_AGENT_WEBHOOK_TIMEOUT_SECONDS: float = 10.0  # timeout for run completion webhooks
+
+  # Checkpointer settings
+  JIRA_AGENT_CHECKPOINTER: Literal["none", "memory", "sqlite"] = "none"  # stateless runs need no checkpoints
+  JIRA_AGENT_CHECKPOINT_MAX_THREADS: int = 256  # threads kept by the in-memory checkpointer (LRU)
+  JIRA_AGENT_CHECKPOINT_TTL_SECONDS: float = 3600.0  # idle time after which the in-memory checkpointer drops a thread
+  JIRA_AGENT_CHECKPOINT_SQLITE_PATH: str = "jira_agent_checkpoints.sqlite"  # database of the sqlite checkpointer
+
   # TODO: Keep these LLM-related env vars for now for validator purposes, but consider removing them in the future
   # Mandatory LLM settings
   LLM_PROVIDER: Optional[str] = "azure"  # or "openai"
@@ -0,0 +1,181 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import os
+import threading
+from typing import Callable, Dict, List
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+# none: send the full history to the model
+# last_message: keep the user messages and the final answer of every earlier turn, drop tool calls and results
+# summarize: keep every message but cut earlier tool results down to JIRA_AGENT_TOOL_SUMMARY_CHARS
+# budget: summarize, then drop the oldest tool exchanges until the history fits JIRA_AGENT_HISTORY_TOKEN_BUDGET
+HISTORY_COMPACTION_MODES = ("none", "last_message", "summarize", "budget")
+
+HANDOFF_TOOL_PREFIX = "transfer_to_"
+
+
+def _current_turn_start(messages: List[BaseMessage]) -> int:
+  """
+  Index of the first message of the running agent turn, which is never compacted.
+
+  A sub-agent turn starts after the supervisor's handoff to it; the tool loop
+  it is running must reach the model unchanged.
+  """
+  for index in range(len(messages) - 1, -1, -1):
+    message = messages[index]
+    if isinstance(message, ToolMessage) and (message.name or "").startswith(HANDOFF_TOOL_PREFIX):
+      return index + 1
+  return len(messages)
+
+
+def _exchanges(messages: List[BaseMessage]) -> List[List[BaseMessage]]:
+  """Group messages so that an AI tool call always stays with its tool results."""
+  exchanges: List[List[BaseMessage]] = []
+  for message in messages:
+    if isinstance(message, ToolMessage) and exchanges:
+      exchanges[-1].append(message)
+    else:
+      exchanges.append([message])
+  return exchanges
+
+
+def _summarize(message: BaseMessage, max_chars: int) -> BaseMessage:
+  if not isinstance(message, ToolMessage) or not isinstance(message.content, str) or len(message.content) <= max_chars:
+    return message
+  omitted = len(message.content) - max_chars
+  return message.model_copy(update={"content": f"{message.content[:max_chars]} [... {omitted} characters omitted]"})
+
+
+def compact_messages(
+  messages: List[BaseMessage],
+  mode: str,
+  token_budget: int = 4000,
+  summary_chars: int = 400,
+  keep_current_turn: bool = True,
+) -> List[BaseMessage]:
+  """
+  Compact the message history sent to a model, leaving the running agent turn as is.
+
+  Args:
+    messages List[BaseMessage]: The conversation state.
+    mode str: One of `HISTORY_COMPACTION_MODES`.
+    token_budget int: Approximate token budget of the history in `budget` mode.
+    summary_chars int: Characters kept of an earlier tool result in `summarize` and `budget` modes.
+    keep_current_turn bool: Leave the messages after the last handoff as is (sub-agents);
+      the supervisor has no tool loop of its own and compacts everything.
+
+  Returns:
+    List[BaseMessage]: The messages to send to the model.
+  """
+  if mode == "none":
+    return list(messages)
+  split = _current_turn_start(messages) if keep_current_turn else len(messages)
+  history, current = list(messages[:split]), list(messages[split:])
+
+  if mode == "last_message":
+    history = [
+      message for message in history
+      if isinstance(message, HumanMessage) or (isinstance(message, AIMessage) and not message.tool_calls and message.content)
+    ]
+    return history + current
+
+  history = [_summarize(message, summary_chars) for message in history]
+  if mode == "budget":
+    exchanges = _exchanges(history)
+    tokens = count_tokens_approximately(history + current)
+    # Drop the oldest exchanges first; user messages are short and give the rest meaning
+    for exchange in list(exchanges):
+      if tokens <= token_budget:
+        break
+      if isinstance(exchange[0], HumanMessage):
+        continue
+      exchanges.remove(exchange)
+      tokens -= count_tokens_approximately(exchange)
+    history = [message for exchange in exchanges for message in exchange]
+  return history + current
+
+
+class HistoryCompaction:
+  """
+  Per-mode accounting of the prompt tokens saved by history compaction.
+  """
+  _stats: Dict[str, Dict[str, int]] = {}
+  _lock = threading.Lock()
+
+  @classmethod
+  def record(cls, mode: str, tokens_before: int, tokens_after: int):
+    with cls._lock:
+      stats = cls._stats.setdefault(mode, {"calls": 0, "tokens_before": 0, "tokens_after": 0})
+      stats["calls"] += 1
+      stats["tokens_before"] += tokens_before
+      stats["tokens_after"] += tokens_after
+
+  @classmethod
+  def stats(cls) -> Dict[str, Dict[str, int]]:
+    """
+    Return, per compaction mode, the model calls and their approximate prompt tokens before and after compaction.
+    """
+    with cls._lock:
+      return {mode: dict(stats) for mode, stats in cls._stats.items()}
+
+  @classmethod
+  def reset(cls):
+    with cls._lock:
+      cls._stats = {}
+
+
+def history_compaction_mode() -> str:
+  """
+  Return the mode selected by `JIRA_AGENT_HISTORY_COMPACTION` (see `HISTORY_COMPACTION_MODES`).
+  """
+  mode = os.getenv("JIRA_AGENT_HISTORY_COMPACTION", "summarize").lower()
+  if mode not in HISTORY_COMPACTION_MODES:
+    raise ValueError(
+      f"Unknown JIRA_AGENT_HISTORY_COMPACTION '{mode}', expected one of: {', '.join(HISTORY_COMPACTION_MODES)}"
+    )
+  return mode
+
+
+def compacting_prompt(system_prompt: str, keep_current_turn: bool = True) -> Callable[[dict], List[BaseMessage]]:
+  """
+  Build a `create_react_agent` prompt that compacts the history before every model call.
+
+  The state itself is left untouched: only what is sent to the model is
+  compacted, so the caller still receives the full conversation.
+
+  Args:
+    system_prompt str: The agent system prompt.
+    keep_current_turn bool: See `compact_messages`; False for the supervisor.
+
+  Returns:
+    Callable[[dict], List[BaseMessage]]: The prompt, mapping the agent state to the model input.
+  """
+  mode = history_compaction_mode()
+  token_budget = int(os.getenv("JIRA_AGENT_HISTORY_TOKEN_BUDGET", "4000"))
+  summary_chars = int(os.getenv("JIRA_AGENT_TOOL_SUMMARY_CHARS", "400"))
+  system_message = SystemMessage(content=system_prompt)
+
+  def prompt(state: dict) -> List[BaseMessage]:
+    messages = state["messages"]
+    compacted = compact_messages(messages, mode, token_budget, summary_chars, keep_current_turn)
+    HistoryCompaction.record(mode, count_tokens_approximately(messages), count_tokens_approximately(compacted))
+    return [system_message, *compacted]
+
+  return prompt
@@ -0,0 +1,341 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# none: every request goes through the supervisor LLM
+# rules: keyword/regex rules route the requests they recognise straight to a sub-agent
+# hybrid: rules first, then a TF-IDF/logistic classifier for requests no rule matched
+INTENT_ROUTING_MODES = ("none", "rules", "hybrid")
+
+ISSUES_AGENT = "jira_issues_agent"
+PROJECTS_AGENT = "jira_projects_agent"
+
+ISSUE_KEY = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
+EMAIL = re.compile(r"\S+@\S+\.\w+")
+# Hyphenated names and quoted values, e.g. a project name or a new summary
+VALUE = re.compile(r"'[^']*'|\"[^\"]*\"|\b\w+(?:-\w+)+\b")
+
+# (pattern, agent, confidence); a request matching rules of both agents is left to the supervisor
+RULES: List[Tuple[re.Pattern, str, float]] = [
+  (ISSUE_KEY, ISSUES_AGENT, 0.95),
+  (re.compile(r"\bjql\b", re.IGNORECASE), ISSUES_AGENT, 0.95),
+  (re.compile(r"\b(issues?|tickets?|bugs?|epics?|stor(y|ies)|(sub-?)?tasks?|sprints?)\b", re.IGNORECASE), ISSUES_AGENT, 0.9),
+  (re.compile(r"\b(create|add)\s+(a\s+|an\s+)?(new\s+)?(jira\s+)?projects?\b", re.IGNORECASE), PROJECTS_AGENT, 0.9),
+  (re.compile(r"\bprojects?\s+(lead|description|details|key)\b", re.IGNORECASE), PROJECTS_AGENT, 0.9),
+  (re.compile(r"\b(lead|description|details)\s+(for|of|about)\s+(my\s+|the\s+)?projects?\b", re.IGNORECASE), PROJECTS_AGENT, 0.9),
+]
+
+# Generic requests the classifier is trained on; names, keys and emails are placeholders, see `_features`
+SEED_EXAMPLES: Dict[str, List[str]] = {
+  ISSUES_AGENT: [
+    "Show me the open issues assigned to jane.doe@example.com",
+    "List the latest tickets in project WEB",
+    "How many bugs were closed in project API last month?",
+    "Find the tasks reported by me that are still in progress",
+    "Search for stories with the label 'frontend'",
+    "Create a bug in project WEB with summary 'Login page crashes'",
+    "Open a new task in project OPS to rotate the certificates",
+    "Create an epic called 'Q3 migration' in project DATA",
+    "Add a story to project APP for the new onboarding flow",
+    "Assign WEB-42 to john.smith@example.com",
+    "Move OPS-7 to Done",
+    "Transition API-310 to In Review",
+    "What transitions are available for DATA-15?",
+    "Change the priority of APP-88 to High",
+    "Update the description of WEB-12 to 'needs a design review'",
+    "Add the label 'regression' to API-99",
+    "Add jane.doe@example.com as a watcher on OPS-21",
+    "Show the details of WEB-1001",
+    "What is the status of APP-5?",
+    "Run this query: project = OPS AND status = Open ORDER BY created DESC",
+  ],
+  PROJECTS_AGENT: [
+    "Get the details of project 'Customer Portal'",
+    "Show me the information about project Mobile-App",
+    "Who is the lead of project Data-Platform?",
+    "Find the project named 'Billing Service'",
+    "What is the key of project Internal-Tools?",
+    "Create a project for my team 'Payments' with lead jane.doe@example.com",
+    "Create a new project called Analytics with key ANL and lead john.smith@example.com",
+    "Set up a software project for the Search-Team",
+    "Make jane.doe@example.com the lead of project Mobile-App",
+    "Update the lead of project 'Customer Portal' to john.smith@example.com",
+    "Change the project description of Data-Platform to 'Shared data services'",
+    "Update the description for project Billing-Service to 'Invoices and payments'",
+    "Rename the description of the Search-Team project",
+    "Which projects do we have in Jira?",
+    "Give me the URL of project Internal-Tools",
+  ],
+}
+
+
+def rule_route(text: str) -> Tuple[Optional[str], float]:
+  """
+  Route a request with the keyword/regex rules.
+
+  Args:
+    text str: The user request.
+
+  Returns:
+    Tuple[Optional[str], float]: The agent and the confidence of the strongest matching rule,
+      or (None, 0.0) when no rule or rules of several agents match.
+  """
+  matches: Dict[str, float] = {}
+  for pattern, agent, confidence in RULES:
+    if pattern.search(text):
+      matches[agent] = max(confidence, matches.get(agent, 0.0))
+  if len(matches) != 1:
+    return None, 0.0
+  return next(iter(matches.items()))
+
+
+def _features(text: str) -> List[str]:
+  # Issue keys, emails and names carry the intent, not their values
+  text = VALUE.sub(" value ", EMAIL.sub(" emailaddress ", ISSUE_KEY.sub(" issuekey ", text)))
+  words = re.findall(r"[a-z]+", text.lower())
+  return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class TfidfClassifier:
+  """
+  A small TF-IDF + multinomial logistic regression text classifier.
+
+  Sized for a few dozen labelled prompts: it trains in milliseconds at startup
+  and needs no dependency beyond the standard library.
+  """
+
+  def __init__(self, epochs: int = 50, learning_rate: float = 0.5, l2: float = 1e-3):
+    self.epochs = epochs
+    self.learning_rate = learning_rate
+    self.l2 = l2
+    self.idf: Dict[str, float] = {}
+    self.labels: List[str] = []
+    self.weights: Dict[str, Dict[str, float]] = {}
+    self.bias: Dict[str, float] = {}
+
+  def _vector(self, text: str) -> Dict[str, float]:
+    counts = Counter(feature for feature in _features(text) if feature in self.idf)
+    vector = {feature: count * self.idf[feature] for feature, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+    return {feature: value / norm for feature, value in vector.items()}
+
+  def _probabilities(self, vector: Dict[str, float]) -> Dict[str, float]:
+    scores = {
+      label: self.bias[label] + sum(self.weights[label].get(feature, 0.0) * value for feature, value in vector.items())
+      for label in self.labels
+    }
+    top = max(scores.values())
+    exp = {label: math.exp(score - top) for label, score in scores.items()}
+    total = sum(exp.values())
+    return {label: value / total for label, value in exp.items()}
+
+  def fit(self, texts: List[str], labels: List[str]) -> "TfidfClassifier":
+    """
+    Train on labelled requests, weighting the classes so that a small one is not drowned out.
+
+    Args:
+      texts List[str]: The requests.
+      labels List[str]: The agent handling each request.
+
+    Returns:
+      TfidfClassifier: The trained classifier.
+    """
+    documents = [set(_features(text)) for text in texts]
+    frequencies = Counter(feature for document in documents for feature in document)
+    self.idf = {feature: math.log((1 + len(texts)) / (1 + count)) + 1 for feature, count in frequencies.items()}
+    self.labels = sorted(set(labels))
+    self.weights = {label: {} for label in self.labels}
+    self.bias = {label: 0.0 for label in self.labels}
+    class_counts = Counter(labels)
+    class_weights = {label: len(labels) / (len(self.labels) * count) for label, count in class_counts.items()}
+    vectors = [self._vector(text) for text in texts]
+
+    for _ in range(self.epochs):
+      for vector, label in zip(vectors, labels):
+        probabilities = self._probabilities(vector)
+        for candidate in self.labels:
+          error = class_weights[label] * (probabilities[candidate] - (candidate == label))
+          weights = self.weights[candidate]
+          for feature, value in vector.items():
+            weight = weights.get(feature, 0.0)
+            weights[feature] = weight - self.learning_rate * (error * value + self.l2 * weight)
+          self.bias[candidate] -= self.learning_rate * error
+    return self
+
+  def predict(self, text: str) -> Tuple[str, float]:
+    """
+    Return the most likely agent for a request and its probability.
+    """
+    probabilities = self._probabilities(self._vector(text))
+    label = max(probabilities, key=probabilities.get)
+    return label, probabilities[label]
+
+
+def trajectory_agents(trajectory: str) -> List[str]:
+  """The sub-agents a reference trajectory of the strict match dataset goes through."""
+  nodes = {node.split(":")[0] for node in trajectory.split(";")}
+  return [agent for agent in (ISSUES_AGENT, PROJECTS_AGENT) if agent in nodes]
+
+
+def load_dataset(path: Path) -> List[Tuple[str, List[str]]]:
+  """
+  Read the prompts of the strict match dataset with the sub-agents their reference trajectory uses.
+
+  Args:
+    path Path: The strict match dataset.
+
+  Returns:
+    List[Tuple[str, List[str]]]: (prompt, agents) pairs; an empty list if the file does not exist.
+  """
+  if not Path(path).exists():
+    return []
+  import yaml
+
+  with open(path, encoding="utf-8") as dataset_file:
+    tests = yaml.safe_load(dataset_file).get("tests", {})
+  examples = []
+  for cases in tests.values():
+    for case in cases:
+      trajectory = next(iter(case["reference_trajectory"][0].values()))
+      examples.append((case["input"], trajectory_agents(trajectory)))
+  return examples
+
+
+def training_examples(path: Optional[Path] = None) -> Tuple[List[str], List[str]]:
+  """
+  Build the classifier training set: `SEED_EXAMPLES`, plus the single-agent prompts of a dataset if given.
+
+  Args:
+    path Optional[Path]: A dataset in the strict match format with more labelled prompts.
+
+  Returns:
+    Tuple[List[str], List[str]]: The prompts and their agent.
+  """
+  examples = [(prompt, agent) for agent, prompts in SEED_EXAMPLES.items() for prompt in prompts]
+  if path is not None:
+    examples += [(prompt, agents[0]) for prompt, agents in load_dataset(path) if len(agents) == 1]
+  return [prompt for prompt, _ in examples], [agent for _, agent in examples]
+
+
+class IntentRouting:
+  """
+  Accounting of the requests routed without the supervisor LLM, per decision source and agent.
+  """
+  _stats: Dict[str, Dict[str, int]] = {}
+  _lock = threading.Lock()
+
+  @classmethod
+  def record(cls, source: str, agent: str):
+    with cls._lock:
+      counts = cls._stats.setdefault(source, {})
+      counts[agent] = counts.get(agent, 0) + 1
+
+  @classmethod
+  def stats(cls) -> Dict[str, Dict[str, int]]:
+    """
+    Return, per source (rules, classifier, or supervisor for requests left to the LLM), the requests per agent.
+    """
+    with cls._lock:
+      return {source: dict(counts) for source, counts in cls._stats.items()}
+
+  @classmethod
+  def reset(cls):
+    with cls._lock:
+      cls._stats = {}
+
+
+class IntentRouter:
+  """
+  Pre-routes a request to a sub-agent when its intent is obvious, saving the supervisor LLM hop.
+  """
+
+  def __init__(self, threshold: float = 0.85, classifier: Optional[TfidfClassifier] = None):
+    self.threshold = threshold
+    self.classifier = classifier
+
+  def decide(self, text: str) -> Tuple[Optional[str], str]:
+    """
+    Args:
+      text str: The user request.
+
+    Returns:
+      Tuple[Optional[str], str]: The agent, or None for the supervisor, and the source of the decision.
+    """
+    agent, confidence = rule_route(text)
+    if agent is not None and confidence >= self.threshold:
+      return agent, "rules"
+    # A request matching rules of several agents likely needs both: leave it to the supervisor
+    if self.classifier is not None and not any(pattern.search(text) for pattern, _, _ in RULES):
+      agent, confidence = self.classifier.predict(text)
+      if confidence >= self.threshold:
+        return agent, "classifier"
+    return None, "supervisor"
+
+  def route(self, text: str) -> Optional[str]:
+    """
+    Return the sub-agent to send a request to, or None to let the supervisor decide.
+    """
+    agent, source = self.decide(text)
+    IntentRouting.record(source, agent or "jira_supervisor")
+    logging.debug(f"Intent routing: {source} -> {agent or 'jira_supervisor'}")
+    return agent
+
+
+def intent_routing_mode() -> str:
+  """
+  Return the mode selected by `JIRA_AGENT_INTENT_ROUTING` (see `INTENT_ROUTING_MODES`).
+  """
+  mode = os.getenv("JIRA_AGENT_INTENT_ROUTING", "none").lower()
+  if mode not in INTENT_ROUTING_MODES:
+    raise ValueError(
+      f"Unknown JIRA_AGENT_INTENT_ROUTING '{mode}', expected one of: {', '.join(INTENT_ROUTING_MODES)}"
+    )
+  return mode
+
+
+def build_intent_router(mode: Optional[str] = None) -> Optional[IntentRouter]:
+  """
+  Build the router for `mode`, training the classifier in hybrid mode.
+
+  The classifier learns from `SEED_EXAMPLES`, plus the prompts of
+  `JIRA_AGENT_INTENT_ROUTING_DATASET` when it is set.
+
+  Args:
+    mode Optional[str]: One of `INTENT_ROUTING_MODES`; defaults to `intent_routing_mode()`.
+
+  Returns:
+    Optional[IntentRouter]: The router, or None when every request goes through the supervisor.
+  """
+  mode = mode or intent_routing_mode()
+  if mode == "none":
+    return None
+  threshold = float(os.getenv("JIRA_AGENT_INTENT_ROUTING_THRESHOLD", "0.85"))
+  classifier = None
+  if mode == "hybrid":
+    dataset = os.getenv("JIRA_AGENT_INTENT_ROUTING_DATASET")
+    texts, labels = training_examples(Path(dataset) if dataset else None)
+    classifier = TfidfClassifier().fit(texts, labels)
+  return IntentRouter(threshold, classifier)
@@ -14,18 +14,104 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import functools
 import os
+import threading
+import weakref
 
+import httpx
 from cisco_outshift_agent_utils.llm_factory import LLMFactory
 from dotenv import load_dotenv
 
+# Providers whose LangChain clients accept caller-provided httpx clients
+_HTTPX_PROVIDERS = ("openai", "azure")
+
+# One chat model per provider, shared by every agent of the process
+_llms: dict = {}
+_llm_lock = threading.Lock()
+
+
+@functools.cache
+def _load_environment():
+  load_dotenv()
+
+
+class LoopPooledAsyncClient(httpx.AsyncClient):
+  """
+  An `httpx.AsyncClient` that sends every request through a pooled client of the running event loop.
+
+  The chat model, and the client handed to its SDK, are built once per
+  process, but httpx connections cannot be shared between event loops. The
+  connections therefore live in one client per loop, like the Jira clients
+  of `AsyncJiraRESTClient`.
+  """
+
+  def __init__(self, **kwargs):
+    """
+    Args:
+      **kwargs: Arguments of the per-loop `httpx.AsyncClient`s, e.g. `limits`.
+    """
+    super().__init__(**kwargs)
+    self._client_kwargs = kwargs
+    self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    self._clients_lock = threading.Lock()
+
+  def get_client(self) -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = self._clients.get(loop)
+    if client is None:
+      with self._clients_lock:
+        client = self._clients.get(loop)
+        if client is None:
+          client = httpx.AsyncClient(**self._client_kwargs)
+          self._clients[loop] = client
+    return client
+
+  async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+    return await self.get_client().send(request, **kwargs)
+
+  async def aclose(self):
+    """Close the client bound to the running event loop."""
+    client = self._clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+      await client.aclose()
+
+
+def _http_client_kwargs(provider: str) -> dict:
+  """Pooled httpx clients for the provider SDK, sized by `LLM_HTTP_POOL_MAXSIZE`."""
+  if provider not in _HTTPX_PROVIDERS:
+    return {}
+  pool_size = int(os.getenv("LLM_HTTP_POOL_MAXSIZE", "32"))
+  limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+  return {
+    "http_client": httpx.Client(limits=limits),
+    "http_async_client": LoopPooledAsyncClient(limits=limits),
+  }
+
+
+def _build_llm(provider: str):
+  llm = _llms.get(provider)
+  if llm is None:
+    with _llm_lock:
+      llm = _llms.get(provider)
+      if llm is None:
+        factory = LLMFactory(
+          provider=provider,
+        )
+        llm = factory.get_llm(**_http_client_kwargs(factory.provider))
+        _llms[provider] = llm
+  return llm
+
 
 def get_llm():
   """
     Get the LLM provider based on the configuration using LLMFactory.
+
+    The chat model is built once per process and provider and shared by every
+    agent, so all LLM calls reuse one connection pool to the provider (one
+    per event loop for async calls).
     """
-  load_dotenv()
-  factory = LLMFactory(
-    provider=os.getenv("LLM_PROVIDER"),
-  )
-  return factory.get_llm()
+  _load_environment()
+  return _build_llm(os.getenv("LLM_PROVIDER"))
@@ -194,6 +194,4 @@ def configure_logging() -> None:
   coloredlogs.install(level=log_level, fmt="%(asctime)s [%(name)s] [%(levelname)s] [%(funcName)s] %(message)s")
 
   logger = logging.getLogger("agntcy_agents_common")
-  logger.info("Logging has been configured successfully.")
-
-configure_logging()
\ No newline at end of file
+  logger.info("Logging has been configured successfully.")
\ No newline at end of file
@@ -0,0 +1,175 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import os
+from typing import Optional, Type
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+from langgraph.graph import END, START, StateGraph
+from langgraph.prebuilt import create_react_agent
+from langgraph.prebuilt.chat_agent_executor import AgentStateWithStructuredResponse
+from pydantic import BaseModel
+
+from jira_agent.common.history import compacting_prompt
+from jira_agent.common.llm import get_llm
+
+# llm: always ask the model for the structured response (one extra LLM call per sub-agent run)
+# auto: build it from the tool output or final answer, asking the model only when that is not enough
+# none: do not produce a structured response
+RESPONSE_FINALIZATION_MODES = ("llm", "auto", "none")
+
+# direct: a sub-agent can return its answer straight to the caller
+# supervisor: every sub-agent answer goes back to the supervisor for a final turn
+SUPERVISOR_ROUTING_MODES = ("direct", "supervisor")
+
+FINAL_ANSWER_TOOL = "submit_final_answer"
+
+FINAL_ANSWER_INSTRUCTIONS = f"""
+When your answer completes everything the user asked for, call the `{FINAL_ANSWER_TOOL}` tool with it, on its own and after every other tool result is in; it is returned to the user as is.
+If the user also asked for something your tools cannot do, reply normally instead so the supervisor can continue.
+"""
+
+
+@tool(FINAL_ANSWER_TOOL, return_direct=True)
+def submit_final_answer(answer: str) -> str:
+  """Return your answer straight to the user. Only use it when the answer completes the user's whole request."""
+  return answer
+
+
+def supervisor_routing() -> str:
+  """
+  Return the routing mode selected by `JIRA_AGENT_SUPERVISOR_ROUTING` (see `SUPERVISOR_ROUTING_MODES`).
+  """
+  mode = os.getenv("JIRA_AGENT_SUPERVISOR_ROUTING", "direct").lower()
+  if mode not in SUPERVISOR_ROUTING_MODES:
+    raise ValueError(
+      f"Unknown JIRA_AGENT_SUPERVISOR_ROUTING '{mode}', expected one of: {', '.join(SUPERVISOR_ROUTING_MODES)}"
+    )
+  return mode
+
+
+def is_final_answer(messages: list) -> bool:
+  """
+  Whether a sub-agent run ended by marking its answer as final.
+
+  Args:
+    messages list: The messages of the sub-agent run.
+
+  Returns:
+    bool: True if the last message is the result of the final answer tool.
+  """
+  return bool(messages) and isinstance(messages[-1], ToolMessage) and messages[-1].name == FINAL_ANSWER_TOOL
+
+
+def _text_field(schema: Type[BaseModel]) -> Optional[str]:
+  """The name of the only field of `schema` if it is a string, e.g. `response` of LLMResponseOutput."""
+  fields = schema.model_fields
+  if len(fields) != 1:
+    return None
+  name, field = next(iter(fields.items()))
+  return name if field.annotation is str else None
+
+
+def structured_response_from_messages(messages: list, schema: Type[BaseModel]) -> Optional[BaseModel]:
+  """
+  Build the structured response of a sub-agent run from its messages, without an LLM call.
+
+  A run ends on a tool call when the tool returns directly, e.g. the final
+  answer tool; the tool's output is then the answer. Either way the answer
+  fills the schema if it only holds a text field.
+
+  Args:
+    messages list: The messages of the sub-agent run.
+    schema Type[BaseModel]: The structured response schema.
+
+  Returns:
+    Optional[BaseModel]: The structured response, or None if the model has to produce it.
+  """
+  if not messages:
+    return None
+  last = messages[-1]
+  text_field = _text_field(schema)
+  if isinstance(last, ToolMessage) and isinstance(last.content, str) and text_field:
+    return schema(**{text_field: last.content})
+  if isinstance(last, AIMessage) and not last.tool_calls and text_field:
+    if isinstance(last.content, str) and last.content:
+      return schema(**{text_field: last.content})
+  return None
+
+
+def create_jira_react_agent(name: str, tools: list, prompt: str, response_format: Type[BaseModel]):
+  """
+  Create a ReAct sub-agent whose final answer is also returned as `response_format`.
+
+  `JIRA_AGENT_RESPONSE_FINALIZATION` selects how `structured_response` is
+  produced (see `RESPONSE_FINALIZATION_MODES`). In `auto` mode, the default,
+  the agent is followed by a node that reuses the tool output or final answer
+  and only falls back to the structured-output LLM call when it cannot.
+
+  With direct supervisor routing the agent also gets the final answer tool,
+  which ends its run and lets the supervisor graph return the answer as is.
+
+  Args:
+    name str: The agent name, used by the supervisor to hand off to it.
+    tools list: The agent tools.
+    prompt str: The agent system prompt.
+    response_format Type[BaseModel]: The structured response schema.
+
+  Returns:
+    CompiledGraph: The sub-agent graph.
+  """
+  model = get_llm()
+  if supervisor_routing() == "direct":
+    tools = [*tools, submit_final_answer]
+    prompt = prompt + FINAL_ANSWER_INSTRUCTIONS
+  mode = os.getenv("JIRA_AGENT_RESPONSE_FINALIZATION", "auto").lower()
+  if mode not in RESPONSE_FINALIZATION_MODES:
+    raise ValueError(
+      f"Unknown JIRA_AGENT_RESPONSE_FINALIZATION '{mode}', expected one of: {', '.join(RESPONSE_FINALIZATION_MODES)}"
+    )
+  prompt = compacting_prompt(prompt)
+  if mode == "llm":
+    return create_react_agent(name=name, model=model, tools=tools, prompt=prompt, response_format=response_format)
+
+  agent = create_react_agent(name=name, model=model, tools=tools, prompt=prompt)
+  if mode == "none":
+    return agent
+
+  def finalize(state: dict) -> dict:
+    response = structured_response_from_messages(state["messages"], response_format)
+    if response is None:
+      logging.debug(f"{name}: asking the model for the structured response")
+      response = model.with_structured_output(response_format).invoke(state["messages"])
+    return {"structured_response": response}
+
+  async def afinalize(state: dict) -> dict:
+    response = structured_response_from_messages(state["messages"], response_format)
+    if response is None:
+      logging.debug(f"{name}: asking the model for the structured response")
+      response = await model.with_structured_output(response_format).ainvoke(state["messages"])
+    return {"structured_response": response}
+
+  workflow = StateGraph(AgentStateWithStructuredResponse)
+  workflow.add_node("agent", agent)
+  workflow.add_node("finalize_response", RunnableLambda(finalize, afunc=afinalize))
+  workflow.add_edge(START, "agent")
+  workflow.add_edge("agent", "finalize_response")
+  workflow.add_edge("finalize_response", END)
+  return workflow.compile(name=name)
@@ -0,0 +1,548 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+  WRITES_IDX_MAP,
+  BaseCheckpointSaver,
+  ChannelVersions,
+  Checkpoint,
+  CheckpointMetadata,
+  CheckpointTuple,
+  get_checkpoint_id,
+  get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+CHECKPOINTER_MODES = ("none", "memory", "sqlite")
+
+
+def _payload_size(value: Any) -> int:
+  """
+  Size in bytes of a serialized checkpoint entry.
+
+  Args:
+    value Any: A `(type, bytes)` pair from the serializer, or a tuple holding some.
+
+  Returns:
+    int: The number of serialized bytes.
+  """
+  if isinstance(value, (bytes, bytearray)):
+    return len(value)
+  if isinstance(value, tuple):
+    return sum(_payload_size(item) for item in value)
+  return 0
+
+
+class BoundedMemorySaver(InMemorySaver):
+  """
+  An `InMemorySaver` that keeps a bounded number of threads.
+
+  Threads are evicted least recently used first once `max_threads` is
+  exceeded, and when they have not been read or written for `ttl_seconds`.
+  Keep `max_threads` above the number of concurrent runs, or a long run may
+  lose its earlier checkpoints.
+  """
+
+  def __init__(self, max_threads: int = 256, ttl_seconds: float = 3600.0, serde=None):
+    super().__init__(serde=serde)
+    self.max_threads = max_threads
+    self.ttl_seconds = ttl_seconds
+    self._lock = threading.RLock()
+    # thread_id -> last access, least recently used first
+    self._threads: "OrderedDict[str, float]" = OrderedDict()
+    self._thread_bytes: Dict[str, int] = {}
+    self._thread_keys: Dict[str, Tuple[set, set]] = {}
+    self._evictions = 0
+
+  def _touch(self, thread_id: str, added_bytes: int = 0):
+    self._threads[thread_id] = time.monotonic()
+    self._threads.move_to_end(thread_id)
+    self._thread_bytes[thread_id] = self._thread_bytes.get(thread_id, 0) + added_bytes
+
+  def _evict(self):
+    expires_before = time.monotonic() - self.ttl_seconds
+    while self._threads:
+      thread_id, last_access = next(iter(self._threads.items()))
+      if len(self._threads) <= self.max_threads and last_access >= expires_before:
+        break
+      self.delete_thread(thread_id)
+      self._evictions += 1
+
+  def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+    thread_id = config["configurable"]["thread_id"]
+    with self._lock:
+      # The base class would leave an empty entry behind for unknown threads
+      if thread_id not in self.storage:
+        return None
+      self._touch(thread_id)
+      return super().get_tuple(config)
+
+  def list(self, config: Optional[RunnableConfig], **kwargs) -> Iterator[CheckpointTuple]:
+    with self._lock:
+      if config and config["configurable"]["thread_id"] not in self.storage:
+        return iter(())
+      items = list(super().list(config, **kwargs))
+    return iter(items)
+
+  def put(
+    self,
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    metadata: CheckpointMetadata,
+    new_versions: ChannelVersions,
+  ) -> RunnableConfig:
+    thread_id = config["configurable"]["thread_id"]
+    checkpoint_ns = config["configurable"]["checkpoint_ns"]
+    with self._lock:
+      saved = super().put(config, checkpoint, metadata, new_versions)
+      blob_keys = [(thread_id, checkpoint_ns, channel, version) for channel, version in new_versions.items()]
+      self._thread_keys.setdefault(thread_id, (set(), set()))[0].update(blob_keys)
+      added = _payload_size(self.storage[thread_id][checkpoint_ns][checkpoint["id"]][:2])
+      added += sum(_payload_size(self.blobs[key]) for key in blob_keys)
+      self._touch(thread_id, added)
+      self._evict()
+    return saved
+
+  def put_writes(
+    self,
+    config: RunnableConfig,
+    writes: Sequence[Tuple[str, Any]],
+    task_id: str,
+    task_path: str = "",
+  ) -> None:
+    thread_id = config["configurable"]["thread_id"]
+    outer_key = (
+      thread_id,
+      config["configurable"].get("checkpoint_ns", ""),
+      config["configurable"]["checkpoint_id"],
+    )
+    with self._lock:
+      before = _payload_size(tuple(self.writes.get(outer_key, {}).values()))
+      super().put_writes(config, writes, task_id, task_path)
+      self._thread_keys.setdefault(thread_id, (set(), set()))[1].add(outer_key)
+      self._touch(thread_id, _payload_size(tuple(self.writes[outer_key].values())) - before)
+      self._evict()
+
+  def delete_thread(self, thread_id: str) -> None:
+    with self._lock:
+      # Only drop the keys of this thread rather than scanning every stored blob
+      blob_keys, write_keys = self._thread_keys.pop(thread_id, (set(), set()))
+      self.storage.pop(thread_id, None)
+      for key in blob_keys:
+        self.blobs.pop(key, None)
+      for key in write_keys:
+        self.writes.pop(key, None)
+      self._threads.pop(thread_id, None)
+      self._thread_bytes.pop(thread_id, None)
+
+  def stats(self) -> Dict[str, Any]:
+    """
+    Return the thread count and the serialized size of the checkpoints held in memory.
+    """
+    with self._lock:
+      return {
+        "mode": "memory",
+        "threads": len(self._threads),
+        "resident_bytes": sum(self._thread_bytes.values()),
+        "max_threads": self.max_threads,
+        "ttl_seconds": self.ttl_seconds,
+        "evictions": self._evictions,
+      }
+
+
+class SQLiteSaver(BaseCheckpointSaver):
+  """
+  A checkpointer that persists threads to a SQLite database.
+
+  Each checkpoint is stored whole, with its channel values, so threads survive
+  restarts and nothing is held in memory between runs. Async methods run the
+  queries in a worker thread.
+
+  Writes are batched: checkpoints and task writes are buffered and committed
+  in one transaction once `batch_size` of them are pending, when the thread is
+  read, or on `flush()` (called at the end of every thread run). The database
+  uses SQLite's write-ahead log, so a commit does not wait for a full fsync.
+  """
+
+  def __init__(self, path: str, serde=None, batch_size: int = 64):
+    super().__init__(serde=serde)
+    self.path = path
+    self.batch_size = batch_size
+    self._lock = threading.Lock()
+    self._pending_checkpoints: list = []
+    self._pending_writes: list = []
+    self._conn = sqlite3.connect(path, check_same_thread=False)
+    with self._lock, self._conn:
+      if path != ":memory:":
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+      self._conn.execute(
+        """CREATE TABLE IF NOT EXISTS checkpoints (
+          thread_id TEXT NOT NULL,
+          checkpoint_ns TEXT NOT NULL DEFAULT '',
+          checkpoint_id TEXT NOT NULL,
+          parent_checkpoint_id TEXT,
+          type TEXT,
+          checkpoint BLOB,
+          metadata_type TEXT,
+          metadata BLOB,
+          PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+        )"""
+      )
+      self._conn.execute(
+        """CREATE TABLE IF NOT EXISTS writes (
+          thread_id TEXT NOT NULL,
+          checkpoint_ns TEXT NOT NULL DEFAULT '',
+          checkpoint_id TEXT NOT NULL,
+          task_id TEXT NOT NULL,
+          idx INTEGER NOT NULL,
+          channel TEXT NOT NULL,
+          type TEXT,
+          value BLOB,
+          task_path TEXT NOT NULL DEFAULT '',
+          PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+        )"""
+      )
+
+  def _flush_pending(self):
+    # Callers hold the lock
+    if not self._pending_checkpoints and not self._pending_writes:
+      return
+    with self._conn:
+      self._conn.executemany(
+        "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._pending_checkpoints
+      )
+      # Keep the order of the writes: whether a write is replaced or ignored depends on what came before
+      for verb, rows in self._pending_writes:
+        self._conn.executemany(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    self._pending_checkpoints = []
+    self._pending_writes = []
+
+  def _buffer(self, checkpoint_row: Optional[tuple] = None, writes: Optional[Tuple[str, list]] = None):
+    with self._lock:
+      if checkpoint_row:
+        self._pending_checkpoints.append(checkpoint_row)
+      if writes:
+        self._pending_writes.append(writes)
+      if len(self._pending_checkpoints) + len(self._pending_writes) >= self.batch_size:
+        self._flush_pending()
+
+  def flush(self):
+    """
+    Commit the buffered checkpoints and writes.
+    """
+    with self._lock:
+      self._flush_pending()
+
+  def close(self):
+    """
+    Commit the buffered checkpoints and writes and close the database.
+    """
+    with self._lock:
+      self._flush_pending()
+      self._conn.close()
+
+  def _query(self, sql: str, params: Sequence[Any] = ()) -> list:
+    with self._lock:
+      self._flush_pending()
+      return self._conn.execute(sql, params).fetchall()
+
+  def _to_tuple(self, thread_id: str, row: Sequence[Any]) -> CheckpointTuple:
+    checkpoint_ns, checkpoint_id, parent_checkpoint_id, type_, checkpoint, metadata_type, metadata = row
+    writes = self._query(
+      "SELECT task_id, channel, type, value FROM writes"
+      " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+      (thread_id, checkpoint_ns, checkpoint_id),
+    )
+    return CheckpointTuple(
+      config={
+        "configurable": {
+          "thread_id": thread_id,
+          "checkpoint_ns": checkpoint_ns,
+          "checkpoint_id": checkpoint_id,
+        }
+      },
+      checkpoint=self.serde.loads_typed((type_, checkpoint)),
+      metadata=self.serde.loads_typed((metadata_type, metadata)),
+      pending_writes=[
+        (task_id, channel, self.serde.loads_typed((value_type, value)))
+        for task_id, channel, value_type, value in writes
+      ],
+      parent_config=(
+        {
+          "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": parent_checkpoint_id,
+          }
+        }
+        if parent_checkpoint_id
+        else None
+      ),
+    )
+
+  def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+    thread_id = config["configurable"]["thread_id"]
+    checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+    columns = "checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+    if checkpoint_id := get_checkpoint_id(config):
+      rows = self._query(
+        f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+        (thread_id, checkpoint_ns, checkpoint_id),
+      )
+    else:
+      rows = self._query(
+        f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        " ORDER BY checkpoint_id DESC LIMIT 1",
+        (thread_id, checkpoint_ns),
+      )
+    return self._to_tuple(thread_id, rows[0]) if rows else None
+
+  def list(
+    self,
+    config: Optional[RunnableConfig],
+    *,
+    filter: Optional[Dict[str, Any]] = None,
+    before: Optional[RunnableConfig] = None,
+    limit: Optional[int] = None,
+  ) -> Iterator[CheckpointTuple]:
+    clauses, params = [], []
+    if config:
+      clauses.append("thread_id = ?")
+      params.append(config["configurable"]["thread_id"])
+      if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+        clauses.append("checkpoint_ns = ?")
+        params.append(checkpoint_ns)
+      if checkpoint_id := get_checkpoint_id(config):
+        clauses.append("checkpoint_id = ?")
+        params.append(checkpoint_id)
+    if before and (before_id := get_checkpoint_id(before)):
+      clauses.append("checkpoint_id < ?")
+      params.append(before_id)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = self._query(
+      "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type,"
+      f" metadata FROM checkpoints{where} ORDER BY checkpoint_id DESC",
+      params,
+    )
+    for row in rows:
+      if limit is not None and limit <= 0:
+        break
+      item = self._to_tuple(row[0], row[1:])
+      # Metadata is serialized, so the filter is applied once it is loaded
+      if filter and any(item.metadata.get(key) != value for key, value in filter.items()):
+        continue
+      if limit is not None:
+        limit -= 1
+      yield item
+
+  def put(
+    self,
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    metadata: CheckpointMetadata,
+    new_versions: ChannelVersions,
+  ) -> RunnableConfig:
+    thread_id = config["configurable"]["thread_id"]
+    checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+    type_, serialized = self.serde.dumps_typed(checkpoint)
+    metadata_type, serialized_metadata = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+    self._buffer(checkpoint_row=(
+      thread_id,
+      checkpoint_ns,
+      checkpoint["id"],
+      config["configurable"].get("checkpoint_id"),
+      type_,
+      serialized,
+      metadata_type,
+      serialized_metadata,
+    ))
+    return {
+      "configurable": {
+        "thread_id": thread_id,
+        "checkpoint_ns": checkpoint_ns,
+        "checkpoint_id": checkpoint["id"],
+      }
+    }
+
+  def put_writes(
+    self,
+    config: RunnableConfig,
+    writes: Sequence[Tuple[str, Any]],
+    task_id: str,
+    task_path: str = "",
+  ) -> None:
+    thread_id = config["configurable"]["thread_id"]
+    checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+    checkpoint_id = config["configurable"]["checkpoint_id"]
+    # Special channels (errors, interrupts) overwrite, regular writes are only stored once
+    verb = "INSERT OR REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "INSERT OR IGNORE"
+    rows = []
+    for idx, (channel, value) in enumerate(writes):
+      type_, serialized = self.serde.dumps_typed(value)
+      rows.append((
+        thread_id,
+        checkpoint_ns,
+        checkpoint_id,
+        task_id,
+        WRITES_IDX_MAP.get(channel, idx),
+        channel,
+        type_,
+        serialized,
+        task_path,
+      ))
+    self._buffer(writes=(verb, rows))
+
+  def delete_thread(self, thread_id: str) -> None:
+    with self._lock, self._conn:
+      self._flush_pending()
+      self._conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+      self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+  def rollback_thread(self, thread_id: str, checkpoint_id: Optional[str]) -> None:
+    """
+    Delete the checkpoints and writes a thread gained after a checkpoint.
+
+    Checkpoint ids grow with time, so everything written by a later run sorts
+    after `checkpoint_id`. A thread without a checkpoint to go back to is
+    deleted.
+
+    Args:
+      thread_id (str): The thread to roll back.
+      checkpoint_id (Optional[str]): The last checkpoint to keep, or None to delete the thread.
+    """
+    if checkpoint_id is None:
+      self.delete_thread(thread_id)
+      return
+    with self._lock, self._conn:
+      self._flush_pending()
+      params = (thread_id, checkpoint_id)
+      self._conn.execute("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_id > ?", params)
+      self._conn.execute("DELETE FROM writes WHERE thread_id = ? AND checkpoint_id > ?", params)
+
+  async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+    return await asyncio.to_thread(self.get_tuple, config)
+
+  async def alist(
+    self,
+    config: Optional[RunnableConfig],
+    *,
+    filter: Optional[Dict[str, Any]] = None,
+    before: Optional[RunnableConfig] = None,
+    limit: Optional[int] = None,
+  ) -> AsyncIterator[CheckpointTuple]:
+    items = await asyncio.to_thread(
+      lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+    )
+    for item in items:
+      yield item
+
+  async def aput(
+    self,
+    config: RunnableConfig,
+    checkpoint: Checkpoint,
+    metadata: CheckpointMetadata,
+    new_versions: ChannelVersions,
+  ) -> RunnableConfig:
+    return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+  async def aput_writes(
+    self,
+    config: RunnableConfig,
+    writes: Sequence[Tuple[str, Any]],
+    task_id: str,
+    task_path: str = "",
+  ) -> None:
+    await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+  async def adelete_thread(self, thread_id: str) -> None:
+    await asyncio.to_thread(self.delete_thread, thread_id)
+
+  async def arollback_thread(self, thread_id: str, checkpoint_id: Optional[str]) -> None:
+    await asyncio.to_thread(self.rollback_thread, thread_id, checkpoint_id)
+
+  def get_next_version(self, current: Optional[str], channel: None) -> str:
+    # Same version format as InMemorySaver, so checkpoints can move between the two
+    return InMemorySaver.get_next_version(self, current, channel)
+
+  def stats(self) -> Dict[str, Any]:
+    """
+    Return the thread count and the size of the checkpoints stored in the database.
+    """
+    threads, checkpoint_bytes = self._query(
+      "SELECT COUNT(DISTINCT thread_id), COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints"
+    )[0]
+    write_bytes = self._query("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes")[0][0]
+    return {
+      "mode": "sqlite",
+      "path": self.path,
+      "threads": threads,
+      # Nothing is kept in memory between runs
+      "resident_bytes": 0,
+      "stored_bytes": checkpoint_bytes + write_bytes,
+    }
+
+
+def build_checkpointer(
+  mode: str,
+  max_threads: int = 256,
+  ttl_seconds: float = 3600.0,
+  sqlite_path: str = "jira_agent_checkpoints.sqlite",
+) -> Optional[BaseCheckpointSaver]:
+  """
+  Build the checkpointer the graph is compiled with.
+
+  Args:
+    mode str: `none` (stateless runs keep no history), `memory` (bounded LRU/TTL) or `sqlite`.
+    max_threads int: Threads kept by the in-memory checkpointer.
+    ttl_seconds float: Idle time after which the in-memory checkpointer drops a thread.
+    sqlite_path str: Database file of the SQLite checkpointer.
+
+  Returns:
+    Optional[BaseCheckpointSaver]: The checkpointer, or None when runs are not checkpointed.
+  """
+  mode = mode.lower()
+  if mode == "none":
+    return None
+  if mode == "memory":
+    return BoundedMemorySaver(max_threads=max_threads, ttl_seconds=ttl_seconds)
+  if mode == "sqlite":
+    return SQLiteSaver(sqlite_path)
+  raise ValueError(f"Unknown checkpointer '{mode}', expected one of: {', '.join(CHECKPOINTER_MODES)}")
+
+
+def checkpointer_stats(checkpointer: Optional[BaseCheckpointSaver]) -> Dict[str, Any]:
+  """
+  Return the metrics of a checkpointer built by `build_checkpointer`.
+
+  Args:
+    checkpointer Optional[BaseCheckpointSaver]: The checkpointer, None when runs are not checkpointed.
+
+  Returns:
+    Dict[str, Any]: The mode, thread count and resident checkpoint bytes.
+  """
+  if checkpointer is None:
+    return {"mode": "none", "threads": 0, "resident_bytes": 0}
+  return checkpointer.stats()
@@ -14,15 +14,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import logging
 import os
+import threading
 import uuid
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
-from langgraph.checkpoint.memory import InMemorySaver
-
-from jira_agent.agents.supervisor_agent.supervisor_agent import SupervisorAgent
+from jira_agent.common.config import get_settings_from_env
 from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.run_context import run_scope
 
 
 # If DRYRUN is set, we don't want to initialize Jira settings
@@ -32,28 +33,177 @@ def _init_jira_config() -> Optional[JiraConfig]:
   return JiraConfig()
 
 class JiraGraph:
+  _instance = None
+  _lock = threading.Lock()
+
   def __init__(self):
     """
     Initialize the JiraGraph as a LangGraph.
     """
     self.jira_config = _init_jira_config() # This is just for validation purposes
+    self.checkpointer = None
+    self.thread_checkpointer = None
+    self._thread_graph = None
+    self._thread_lock = threading.Lock()
     self.graph = self.build_graph()
 
   def build_graph(self):
     """
     Build a LangGraph instance of the Jira graph.
 
+    The agents, LangGraph and the LLM SDKs are imported here rather than at
+    module import, so importing this module (e.g. from the API routes) is cheap.
+
     Returns:
       CompiledGraph: A compiled LangGraph instance.
     """
-    graph = SupervisorAgent().agent()
+    from jira_agent.agents.supervisor_agent.supervisor_agent import SupervisorAgent
+    from jira_agent.graph.checkpointer import build_checkpointer
 
-    checkpointer = InMemorySaver()
-    return graph.compile(checkpointer=checkpointer)
+    self.workflow = SupervisorAgent().agent()
+
+    settings = get_settings_from_env()
+    self.checkpointer = build_checkpointer(
+      settings.JIRA_AGENT_CHECKPOINTER,
+      max_threads=settings.JIRA_AGENT_CHECKPOINT_MAX_THREADS,
+      ttl_seconds=settings.JIRA_AGENT_CHECKPOINT_TTL_SECONDS,
+      sqlite_path=settings.JIRA_AGENT_CHECKPOINT_SQLITE_PATH,
+    )
+    return self.workflow.compile(checkpointer=self.checkpointer)
 
   def get_graph(self):
     return self.graph
 
+  def get_thread_graph(self):
+    """
+    Return the graph used for stateful thread runs, compiling it on first use.
+
+    Threads are persisted with the SQLite checkpointer at
+    `JIRA_AGENT_CHECKPOINT_SQLITE_PATH`, whatever checkpointer stateless runs
+    use, so a follow-up run on a thread sees the earlier conversation.
+
+    Returns:
+      CompiledGraph: The supervisor graph compiled with the thread checkpointer.
+    """
+    if self._thread_graph is None:
+      with self._thread_lock:
+        if self._thread_graph is None:
+          from jira_agent.graph.checkpointer import SQLiteSaver
+
+          if isinstance(self.checkpointer, SQLiteSaver):
+            self.thread_checkpointer, self._thread_graph = self.checkpointer, self.graph
+          else:
+            self.thread_checkpointer = SQLiteSaver(get_settings_from_env().JIRA_AGENT_CHECKPOINT_SQLITE_PATH)
+            self._thread_graph = self.workflow.compile(checkpointer=self.thread_checkpointer)
+    return self._thread_graph
+
+  def _run_target(self, thread_id: Optional[str]):
+    if thread_id:
+      return self.get_thread_graph(), {"configurable": {"thread_id": thread_id}}
+    return self.graph, {"configurable": {"thread_id": uuid.uuid4()}}
+
+  async def _flush_thread(self, thread_id: Optional[str]):
+    if thread_id and self.thread_checkpointer is not None:
+      await asyncio.to_thread(self.thread_checkpointer.flush)
+
+  async def aget_thread_state(self, thread_id: str):
+    """
+    Return the latest state of a thread.
+
+    Args:
+      thread_id str: The thread to read.
+
+    Returns:
+      StateSnapshot: The thread state; its values are empty if the thread never ran.
+    """
+    return await self.get_thread_graph().aget_state({"configurable": {"thread_id": thread_id}})
+
+  async def aget_thread_history(self, thread_id: str, limit: int = 10) -> list:
+    """
+    Return the states of a thread, most recent first.
+
+    Args:
+      thread_id str: The thread to read.
+      limit int: Maximum number of states to return.
+
+    Returns:
+      list: StateSnapshots of the thread's checkpoints.
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    return [state async for state in self.get_thread_graph().aget_state_history(config, limit=limit)]
+
+  async def adelete_thread(self, thread_id: str):
+    """
+    Delete every checkpoint of a thread.
+
+    Args:
+      thread_id str: The thread to delete.
+    """
+    self.get_thread_graph()
+    await self.thread_checkpointer.adelete_thread(thread_id)
+
+  async def aget_thread_checkpoint_id(self, thread_id: str) -> Optional[str]:
+    """
+    Return the id of the latest checkpoint of a thread.
+
+    Args:
+      thread_id str: The thread to read.
+
+    Returns:
+      Optional[str]: The checkpoint id, or None if the thread never ran.
+    """
+    self.get_thread_graph()
+    checkpoint = await self.thread_checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}})
+    return checkpoint.config["configurable"]["checkpoint_id"] if checkpoint else None
+
+  async def arollback_thread(self, thread_id: str, checkpoint_id: Optional[str]):
+    """
+    Restore a thread to a checkpoint, dropping everything written after it.
+
+    Args:
+      thread_id str: The thread to roll back.
+      checkpoint_id Optional[str]: The checkpoint to restore, or None to delete the thread.
+    """
+    self.get_thread_graph()
+    await self.thread_checkpointer.arollback_thread(thread_id, checkpoint_id)
+
+  @classmethod
+  def get_instance(cls) -> "JiraGraph":
+    """
+    Return the process-wide JiraGraph, building and compiling it on first use.
+
+    Every entry point (API routes, ACP manifest, LangGraph server) shares this
+    instance, so the agents and their LLM client are built once per process.
+    """
+    if cls._instance is None:
+      with cls._lock:
+        if cls._instance is None:
+          logging.info("Building the Jira graph")
+          cls._instance = cls()
+    return cls._instance
+
+  @classmethod
+  def stats(cls) -> dict:
+    """
+    Return the checkpointer metrics (mode, threads, resident checkpoint bytes).
+    """
+    if cls._instance is None:
+      return {"mode": get_settings_from_env().JIRA_AGENT_CHECKPOINTER, "threads": 0, "resident_bytes": 0}
+    from jira_agent.graph.checkpointer import checkpointer_stats
+
+    return checkpointer_stats(cls._instance.checkpointer)
+
+  @classmethod
+  def close(cls):
+    """
+    Commit the buffered checkpoints and close the SQLite checkpointers, if any were opened.
+    """
+    if cls._instance is None:
+      return
+    for checkpointer in {cls._instance.checkpointer, cls._instance.thread_checkpointer}:
+      if hasattr(checkpointer, "close"):
+        checkpointer.close()
+
   def serve(self, user_prompt: str):
     """
     Runs the LangGraph for Jira operations.
@@ -66,14 +216,15 @@ class JiraGraph:
     """
     try:
       logging.info("Got user prompt: " + user_prompt)
-      result = self.graph.invoke({
-        "messages": [
-          {
-            "role": "user",
-            "content": user_prompt
-          }
-        ],
-      }, {"configurable": {"thread_id": uuid.uuid4()}})
+      with run_scope():
+        result = self.graph.invoke({
+          "messages": [
+            {
+              "role": "user",
+              "content": user_prompt
+            }
+          ],
+        }, {"configurable": {"thread_id": uuid.uuid4()}})
       if logging.getLogger().isEnabledFor(logging.DEBUG):
         for m in result["messages"]:
           m.pretty_print()
@@ -82,3 +233,80 @@ class JiraGraph:
 
     except Exception as e:
       raise Exception("Jira operation failed: " + str(e))
+
+  async def aserve(self, user_prompt: str, thread_id: Optional[str] = None):
+    """
+    Runs the LangGraph for Jira operations without blocking the event loop.
+
+    Args:
+      user_prompt str: user_prompt to serve.
+      thread_id Optional[str]: Thread to continue; None runs statelessly.
+
+    Returns:
+      dict: Output data containing `jira_output`.
+    """
+    try:
+      logging.info("Got user prompt: " + user_prompt)
+      graph, config = self._run_target(thread_id)
+      with run_scope():
+        try:
+          result = await graph.ainvoke({
+            "messages": [
+              {
+                "role": "user",
+                "content": user_prompt
+              }
+            ],
+          }, config)
+        finally:
+          await self._flush_thread(thread_id)
+      if logging.getLogger().isEnabledFor(logging.DEBUG):
+        for m in result["messages"]:
+          m.pretty_print()
+
+      return result["messages"][-1].content, result
+
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      raise Exception("Jira operation failed: " + str(e))
+
+
+  async def astream(
+    self,
+    user_prompt: str,
+    stream_mode: List[str],
+    subgraphs: bool = False,
+    thread_id: Optional[str] = None,
+  ) -> AsyncIterator[Tuple[Tuple[str, ...], str, Any]]:
+    """
+    Streams the LangGraph run for Jira operations as it progresses.
+
+    Args:
+      user_prompt str: user_prompt to serve.
+      stream_mode List[str]: LangGraph stream modes (values, updates, messages, debug, custom).
+      subgraphs bool: Whether to include events emitted by the sub-agents.
+      thread_id Optional[str]: Thread to continue; None runs statelessly.
+
+    Yields:
+      tuple: (namespace, stream mode, chunk) for every event emitted by the graph.
+    """
+    logging.info("Got user prompt: " + user_prompt)
+    graph, config = self._run_target(thread_id)
+    with run_scope():
+      try:
+        async for event in graph.astream({
+          "messages": [
+            {
+              "role": "user",
+              "content": user_prompt
+            }
+          ],
+        }, config, stream_mode=stream_mode, subgraphs=subgraphs):
+          # Without subgraphs LangGraph omits the namespace from multi-mode events
+          if subgraphs:
+            yield event
+          else:
+            yield (), *event
+      finally:
+        await self._flush_thread(thread_id)
\ No newline at end of file
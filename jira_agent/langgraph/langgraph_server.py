@@ -14,9 +14,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from langgraph.checkpoint.memory import InMemorySaver
-
-from jira_agent.agents.supervisor_agent.supervisor_agent import SupervisorAgent
+from jira_agent.graph.graph import JiraGraph
 
 
 # To run the standalone LangGraph Server:
@@ -29,15 +27,12 @@ def graph():
   """
   Constructs and compiles a LangGraph instance.
 
-  This function initializes a `SupervisorAgent` to create the base graph structure
-  and uses an `InMemorySaver` as the checkpointer for the compilation process.
+  The graph is the process-wide `JiraGraph`, built from a `SupervisorAgent` and
+  compiled with the checkpointer selected by `JIRA_AGENT_CHECKPOINTER` once, on first use.
 
   The resulting compiled graph can be used to execute Supervisor workflow in LangGraph Studio.
 
   Returns:
   CompiledGraph: A fully compiled LangGraph instance ready for execution.
   """
-  graph = SupervisorAgent().agent()
-
-  checkpointer = InMemorySaver()
-  return graph.compile(checkpointer=checkpointer)
+  return JiraGraph.get_instance().get_graph()
@@ -19,6 +19,7 @@ from __future__ import annotations
 # Start the FastAPI application using Uvicorn
 import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import AsyncGenerator
@@ -31,7 +32,12 @@ from uvicorn import Config, Server
 
 from jira_agent.common.config import get_settings_from_env
 from jira_agent.common.logging_config import logging, configure_logging
-from jira_agent.protocol.ap.api.routes import stateless_runs
+from jira_agent.graph.graph import JiraGraph
+from jira_agent.protocol.ap.api.routes import stateless_runs, threads
+from jira_agent.utils.jira_client.identity import IdentityCache
+from jira_agent.utils.jira_client.project_metadata import ProjectMetadataCache
+from jira_agent.utils.jira_client.resilience import JiraResilience
+from jira_agent.utils.startup_profiler import profile_imports
 
 
 def load_environment_variables(env_file: str | None = None) -> None:
@@ -77,17 +83,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
       None: The application runs while `yield` is active.
 
   Behavior:
-  - On startup: Logs a startup message.
-  - On shutdown: Logs a shutdown message.
+  - On startup: Logs a startup message and builds the shared Jira graph.
+  - On shutdown: Stops the run scheduler and logs a shutdown message.
   - Can be extended to initialize resources (e.g., database connections).
   """
   logging.info("Starting Jira Agent...")
 
+  # Build the graph and LLM client before serving so the first run does not pay for it
+  started = time.perf_counter()
+  await asyncio.to_thread(JiraGraph.get_instance)
+  logging.info(f"Jira graph ready in {time.perf_counter() - started:.2f}s")
+
   # Example: Attach database connection to app state (if needed)
   # app.state.db = await init_db_connection()
 
   yield  # Application runs while 'yield' is in effect.
 
+  await stateless_runs.scheduler.stop()
+  JiraGraph.close()
   logging.info("Application shutdown")
 
   # Example: Close database connection (if needed)
@@ -120,10 +133,24 @@ def add_health_check_handler(app: FastAPI) -> None:
 
   @app.get("/healthz")
   def health_check():
+    # Imported on first use: the tools package pulls in LangChain
+    from jira_agent.agents.issues_agent.tools.workflow import TransitionResolver
+    from jira_agent.common.history import HistoryCompaction
+    from jira_agent.common.intent_router import IntentRouting
+    from jira_agent.utils.tool_output import ToolOutputEncoding
+
     return {
       "service_name": "jira-agntcy-agent",
       "service_state": "Up",
       "last_updated": datetime.now().isoformat(),
+      "identity_cache": IdentityCache.stats(),
+      "project_metadata_cache": ProjectMetadataCache.stats(),
+      "workflow_cache": TransitionResolver.stats(),
+      "jira_http": JiraResilience.stats(),
+      "checkpoints": JiraGraph.stats(),
+      "history_compaction": HistoryCompaction.stats(),
+      "tool_output": ToolOutputEncoding.stats(),
+      "intent_routing": IntentRouting.stats(),
     }
 
 
@@ -152,6 +179,7 @@ def create_app() -> FastAPI:
 
   add_health_check_handler(app)
   app.include_router(stateless_runs.router, prefix=settings.API_V1_STR)
+  app.include_router(threads.router, prefix=settings.API_V1_STR)
 
   # Set all CORS enabled origins
   app.add_middleware(
@@ -172,6 +200,7 @@ def main() -> None:
 
   This function performs the following:
   - Configures logging globally.
+  - Logs the import-time breakdown when `JIRA_AGENT_PROFILE_STARTUP=1`.
   - Loads environment variables from a `.env` file.
   - Retrieves the port from environment variables (default: 8125).
   - Starts the Uvicorn server.
@@ -184,6 +213,9 @@ def main() -> None:
   logger = logging.getLogger("app")  # Default logger for main script
   logger.info("Starting FastAPI application...")
 
+  if os.getenv("JIRA_AGENT_PROFILE_STARTUP", "0") == "1":
+    logger.info(profile_imports().report())
+
   # Load environment variables before starting the application
   load_environment_variables()
 
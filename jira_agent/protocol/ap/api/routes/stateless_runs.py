@@ -16,62 +16,349 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import uuid
 from http import HTTPStatus
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse
 
 from jira_agent.common.config import INTERNAL_ERROR_MESSAGE, get_settings_from_env
 from jira_agent.graph.graph import JiraGraph
-from jira_agent.models.models import Any, ErrorResponse, RunCreateStateless, Union
+from jira_agent.models.models import (
+    Any,
+    ErrorResponse,
+    MultitaskStrategy,
+    OnDisconnect,
+    RunCreateStateful,
+    RunCreateStateless,
+    Status,
+    StreamMode,
+    Union,
+)
+from jira_agent.protocol.ap.api.scheduler import (
+    RunNotFound,
+    RunExecutor,
+    RunQueueFull,
+    RunRecord,
+    RunRollback,
+    RunScheduler,
+    ThreadBusy,
+)
 
 router = APIRouter(tags=["Stateless Runs"])
 logger = logging.getLogger(__name__)  # This will be "app.api.routes.<name>"
-graph = JiraGraph()
 
+# Bounds the number of graph executions in flight in this process, shared by
+# scheduled and streamed runs.
+settings = get_settings_from_env()
+run_slots = asyncio.Semaphore(settings.JIRA_AGENT_MAX_CONCURRENT_RUNS)
 
-@router.post(
-    "/runs",
-    response_model=Any,
-    responses={
-        "404": {"model": ErrorResponse},
-        "409": {"model": ErrorResponse},
-        "422": {"model": ErrorResponse},
-    },
-    tags=["Stateless Runs"],
+# Non-standard status code (nginx convention) for requests abandoned by the client.
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+# API stream modes mapped to the LangGraph stream mode that produces them.
+STREAM_MODES: Dict[str, str] = {
+    "values": "values",
+    "updates": "updates",
+    "messages-tuple": "messages",
+    "debug": "debug",
+    "custom": "custom",
+}
+
+
+def get_query(body: RunCreateStateless | RunCreateStateful) -> str:
+    """
+    Validate a run request and extract the user query from it.
+
+    Args:
+        body (RunCreateStateless | RunCreateStateful): The run request.
+
+    Returns:
+        str: The query to send to the graph.
+
+    Raises:
+        HTTPException: If the agent id is missing or the input is not a dictionary.
+    """
+    logging.debug(f"Agent id: {body.agent_id}")
+
+    # Validate that the assistant_id is not empty.
+    if not body.agent_id:
+        msg = "agent_id is required and cannot be empty."
+        logging.error(msg)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=msg,
+        )
+
+    # Retrieve the 'input' field and ensure it is a dictionary.
+    input_field = body.input
+    if not isinstance(input_field, dict):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail="Invalid input format"
+        )
+
+    # Retrieve the 'query' field from the input dictionary.
+    return input_field.get("query")
+
+
+def get_stream_modes(body: RunCreateStateless | RunCreateStateful) -> List[str]:
+    """
+    Normalize the requested stream mode(s) into a list of API stream mode names.
+
+    Args:
+        body (RunCreateStateless | RunCreateStateful): The run request.
+
+    Returns:
+        List[str]: The requested stream modes, defaulting to ['values'].
+    """
+    requested = body.stream_mode or [StreamMode.values]
+    if not isinstance(requested, list):
+        requested = [requested]
+    return [getattr(mode, "value", mode) for mode in requested]
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def encode_stream_chunk(mode: str, chunk: Any) -> str:
+    """
+    Serialize a LangGraph stream chunk for an SSE data field.
+
+    Message chunks are sent as a [message, metadata] pair, keeping only the
+    metadata needed to tell which node produced the tokens.
+
+    Args:
+        mode (str): The LangGraph stream mode that produced the chunk.
+        chunk (Any): The chunk emitted by the graph.
+
+    Returns:
+        str: The JSON encoded chunk.
+    """
+    if mode == "messages":
+        message, metadata = chunk
+        chunk = [
+            message,
+            {
+                key: metadata.get(key)
+                for key in ("langgraph_node", "langgraph_step", "checkpoint_ns")
+            },
+        ]
+    return orjson.dumps(chunk, default=_json_default).decode()
+
+
+def check_stream_modes(stream_modes: List[str]):
+    """
+    Reject stream modes the graph cannot produce.
+
+    Raises:
+        HTTPException: 422 if a stream mode is not supported.
+    """
+    unsupported = [mode for mode in stream_modes if mode not in STREAM_MODES]
+    if unsupported:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported stream_mode: {', '.join(unsupported)}",
+        )
+
+
+async def stream_run_events(
+    query: str, stream_modes: List[str], thread_id: Optional[str] = None
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Run the graph and yield its progress as server-sent events.
+
+    Sub-agent events are included so that supervisor handoffs and tool calls
+    are visible as they happen; their event name carries the sub-agent
+    namespace, e.g. 'updates|issues_agent:<task id>'.
+
+    Args:
+        query (str): The user query.
+        stream_modes (List[str]): The API stream modes to emit.
+        thread_id (Optional[str]): The thread to continue; None runs statelessly.
+
+    Yields:
+        dict: Server-sent events with 'event' and 'data' keys.
+    """
+    run_id = str(uuid.uuid4())
+    metadata = {"run_id": run_id, "thread_id": thread_id} if thread_id else {"run_id": run_id}
+    yield {"event": "metadata", "data": orjson.dumps(metadata).decode()}
+
+    async with run_slots:
+        try:
+            async for namespace, mode, chunk in JiraGraph.get_instance().astream(
+                query,
+                stream_mode=[STREAM_MODES[mode] for mode in stream_modes],
+                subgraphs=True,
+                thread_id=thread_id,
+            ):
+                yield {
+                    "event": "|".join((mode, *namespace)),
+                    "data": encode_stream_chunk(mode, chunk),
+                }
+        except asyncio.CancelledError:
+            logger.info(f"Client disconnected, cancelled run {run_id}")
+            raise
+        except Exception as exc:
+            logger.error(f"Internal error during run {run_id}: {exc}", exc_info=True)
+            yield {
+                "event": "error",
+                "data": orjson.dumps(
+                    {"error": "InternalError", "message": INTERNAL_ERROR_MESSAGE}
+                ).decode(),
+            }
+            return
+
+    yield {"event": "end", "data": ""}
+
+
+async def execute_run(query: str) -> Any:
+    """
+    Execute a graph run for the scheduler, sharing the process-wide run slots.
+
+    Args:
+        query (str): The user query.
+
+    Returns:
+        Any: The final answer of the graph.
+    """
+    async with run_slots:
+        result, _ = await JiraGraph.get_instance().aserve(query)
+    logging.info("result: %s", result)
+    return result
+
+
+scheduler = RunScheduler(
+    execute_run,
+    workers=settings.JIRA_AGENT_MAX_CONCURRENT_RUNS,
+    max_queued=settings.JIRA_AGENT_RUN_QUEUE_SIZE,
+    history_size=settings.JIRA_AGENT_RUN_HISTORY_SIZE,
+    webhook_timeout=settings.JIRA_AGENT_WEBHOOK_TIMEOUT_SECONDS,
 )
-def run_stateless_runs_post(body: RunCreateStateless) -> Union[Any, ErrorResponse]:
+
+
+def submit_run(
+    body: RunCreateStateless | RunCreateStateful,
+    thread_id: Optional[str] = None,
+    executor: Optional[RunExecutor] = None,
+    rollback: Optional[RunRollback] = None,
+) -> RunRecord:
     """
-    Create Background Run
+    Validate a run request and hand it to the run scheduler.
+
+    Runs that share `config.configurable.thread_id` are coordinated with the
+    request's multitask strategy; runs without a thread id never conflict.
+
+    Args:
+        body (RunCreateStateless | RunCreateStateful): The run request.
+        thread_id (Optional[str]): The thread of a stateful run, overriding the config.
+        executor (Optional[RunExecutor]): Executor of a stateful run, defaults to a stateless run.
+        rollback (Optional[RunRollback]): Undoes the run if a 'rollback' run interrupts it.
+
+    Returns:
+        RunRecord: The scheduled run.
+
+    Raises:
+        HTTPException: 409 if the thread is busy and the strategy is 'reject',
+            503 if the run queue is full.
     """
+    query = get_query(body)
+    logging.info("query: %s", query)
 
+    configurable = (body.config.configurable if body.config else None) or {}
+    record = RunRecord(
+        query=query,
+        thread_id=thread_id or str(configurable.get("thread_id") or uuid.uuid4()),
+        agent_id=body.agent_id,
+        metadata=body.metadata or {},
+        multitask_strategy=MultitaskStrategy(
+            getattr(body.multitask_strategy, "value", body.multitask_strategy or "reject")
+        ),
+        webhook=str(body.webhook) if body.webhook else None,
+        after_seconds=body.after_seconds,
+        executor=executor,
+        rollback=rollback,
+    )
     try:
-        # Extract assistant_id from the payload
-        agent_id = body.agent_id
-        logging.debug(f"Agent id: {agent_id}")
-
-        # Validate that the assistant_id is not empty.
-        if not body.agent_id:
-            msg = "agent_id is required and cannot be empty."
-            logging.error(msg)
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=msg,
-            )
+        return scheduler.submit(record)
+    except ThreadBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    except RunQueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+
+
+async def wait_for_run(
+    request: Request, record: RunRecord, on_disconnect: OnDisconnect | str | None
+) -> RunRecord:
+    """
+    Wait for a scheduled run, cancelling it if the HTTP client disconnects first.
+
+    Args:
+        request (Request): The incoming request, polled for disconnects.
+        record (RunRecord): The run to wait for.
+        on_disconnect (OnDisconnect | str | None): 'cancel' (default) stops the run when
+            the client goes away; 'continue' lets it finish regardless.
+
+    Returns:
+        RunRecord: The finished run.
 
-        # Retrieve the 'input' field and ensure it is a dictionary.
-        input_field = body.input
-        if not isinstance(input_field, dict):
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST, detail="Invalid input format"
+    Raises:
+        HTTPException: 499 if the client disconnected and the run was cancelled.
+    """
+    if getattr(on_disconnect, "value", on_disconnect) == OnDisconnect.continue_.value:
+        await record.done.wait()
+        return record
+
+    while not record.done.is_set():
+        try:
+            await asyncio.wait_for(
+                record.done.wait(), timeout=settings.JIRA_AGENT_DISCONNECT_POLL_SECONDS
             )
+        except asyncio.TimeoutError:
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected, cancelling run {record.run_id}")
+                scheduler.cancel(record.run_id)
+                raise HTTPException(
+                    status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+                    detail="Client disconnected",
+                )
+    return record
+
+
+def get_run_or_404(run_id: str) -> RunRecord:
+    try:
+        return scheduler.get(run_id)
+    except RunNotFound as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
-        # Retrieve the 'query' field from the input dictionary.
-        query = input_field.get("query")
-        logging.info("query: %s", query)
-        result, _ = graph.serve(query)
-        logging.info("result: %s", result)
+
+async def run_and_wait(
+    body: RunCreateStateless | RunCreateStateful,
+    request: Request,
+    thread_id: Optional[str] = None,
+    executor: Optional[RunExecutor] = None,
+    rollback: Optional[RunRollback] = None,
+) -> JSONResponse:
+    """
+    Schedule a run, wait for it and return its output.
+    """
+    try:
+        record = submit_run(body, thread_id, executor, rollback)
+        await wait_for_run(request, record, body.on_disconnect)
     except HTTPException as http_exc:
         logger.error(
             "HTTP error during run processing: %s", http_exc.detail, exc_info=True
@@ -84,16 +371,53 @@ def run_stateless_runs_post(body: RunCreateStateless) -> Union[Any, ErrorRespons
             detail=INTERNAL_ERROR_MESSAGE,
         )
 
+    if record.status == Status.interrupted:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=record.error)
+    if record.status != Status.success:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=INTERNAL_ERROR_MESSAGE,
+        )
+
     payload = {
-        "agent_id": agent_id,
-        "output": result,
-        "model": get_settings_from_env().OPENAI_API_VERSION,
-        "metadata": {},
+        "agent_id": record.agent_id,
+        "output": record.output,
+        "model": settings.OPENAI_API_VERSION,
+        "metadata": {"run_id": record.run_id, "thread_id": record.thread_id},
     }
 
     return JSONResponse(content=payload, status_code=status.HTTP_200_OK)
 
 
+@router.post(
+    "/runs",
+    response_model=Any,
+    responses={
+        "404": {"model": ErrorResponse},
+        "409": {"model": ErrorResponse},
+        "422": {"model": ErrorResponse},
+    },
+    tags=["Stateless Runs"],
+)
+async def run_stateless_runs_post(
+    body: RunCreateStateless, request: Request
+) -> Union[Any, ErrorResponse]:
+    """
+    Create Background Run
+
+    Runs with a `webhook` or `after_seconds` are executed in the background:
+    the run is returned immediately with status 202 and can be polled with
+    `GET /runs/{run_id}`. Other runs wait for the output, as before.
+    """
+    if body.webhook or body.after_seconds:
+        record = submit_run(body)
+        return JSONResponse(
+            content=record.to_dict(), status_code=status.HTTP_202_ACCEPTED
+        )
+
+    return await run_and_wait(body, request)
+
+
 @router.post(
     "/runs/stream",
     response_model=str,
@@ -104,13 +428,19 @@ def run_stateless_runs_post(body: RunCreateStateless) -> Union[Any, ErrorRespons
     },
     tags=["Stateless Runs"],
 )
-def stream_run_stateless_runs_stream_post(
+async def stream_run_stateless_runs_stream_post(
     body: RunCreateStateless,
 ) -> Union[str, ErrorResponse]:
     """
     Create Run, Stream Output
     """
-    pass
+    query = get_query(body)
+    logging.info("query: %s", query)
+
+    stream_modes = get_stream_modes(body)
+    check_stream_modes(stream_modes)
+
+    return EventSourceResponse(stream_run_events(query, stream_modes))
 
 
 @router.post(
@@ -123,10 +453,59 @@ def stream_run_stateless_runs_stream_post(
     },
     tags=["Stateless Runs"],
 )
-def wait_run_stateless_runs_wait_post(
-    body: RunCreateStateless,
+async def wait_run_stateless_runs_wait_post(
+    body: RunCreateStateless, request: Request
 ) -> Union[Any, ErrorResponse]:
     """
     Create Run, Wait for Output
     """
-    pass
\ No newline at end of file
+    return await run_and_wait(body, request)
+
+
+@router.get(
+    "/runs/{run_id}",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+    tags=["Stateless Runs"],
+)
+async def get_run_stateless_runs_run_id_get(run_id: str) -> Union[Any, ErrorResponse]:
+    """
+    Get Run
+    """
+    return get_run_or_404(run_id).to_dict()
+
+
+@router.get(
+    "/runs/{run_id}/wait",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+    tags=["Stateless Runs"],
+)
+async def wait_run_stateless_runs_run_id_wait_get(
+    run_id: str, request: Request
+) -> Union[Any, ErrorResponse]:
+    """
+    Wait for a Run to finish
+    """
+    record = get_run_or_404(run_id)
+    # The caller only observes this run; going away must not cancel it
+    await wait_for_run(request, record, OnDisconnect.continue_)
+    return record.to_dict()
+
+
+@router.post(
+    "/runs/{run_id}/cancel",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+    tags=["Stateless Runs"],
+)
+async def cancel_run_stateless_runs_run_id_cancel_post(
+    run_id: str,
+) -> Union[Any, ErrorResponse]:
+    """
+    Cancel Run
+    """
+    try:
+        return scheduler.cancel(run_id).to_dict()
+    except RunNotFound as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
\ No newline at end of file
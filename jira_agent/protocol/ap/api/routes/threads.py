@@ -0,0 +1,436 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import AsyncIterator, Dict, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
+from sse_starlette.sse import EventSourceResponse
+
+from jira_agent.graph.graph import JiraGraph
+from jira_agent.models.models import (
+    Any,
+    ErrorResponse,
+    IfNotExists,
+    RunCreateStateful,
+    ThreadCreate,
+    ThreadSearchRequest,
+    Union,
+)
+from jira_agent.models.models import Status1 as ThreadStatus
+from jira_agent.protocol.ap.api.routes.stateless_runs import (
+    check_stream_modes,
+    get_query,
+    get_run_or_404,
+    get_stream_modes,
+    run_and_wait,
+    run_slots,
+    scheduler,
+    settings,
+    stream_run_events,
+    submit_run,
+)
+from jira_agent.protocol.ap.api.scheduler import RunExecutor, RunRollback
+from jira_agent.protocol.ap.api.threads import ThreadExists, ThreadNotFound, ThreadStore
+
+router = APIRouter(tags=["Threads"])
+logger = logging.getLogger(__name__)  # This will be "app.api.routes.<name>"
+
+
+@functools.cache
+def get_thread_store() -> ThreadStore:
+    """
+    Return the thread registry, kept in the same database as the thread checkpoints.
+    """
+    return ThreadStore(settings.JIRA_AGENT_CHECKPOINT_SQLITE_PATH)
+
+
+def get_thread_or_404(thread_id: str) -> Dict[str, Any]:
+    try:
+        return get_thread_store().get(thread_id)
+    except ThreadNotFound as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+
+
+def is_thread_busy(thread: Dict[str, Any]) -> bool:
+    """
+    Return whether a thread has a run going on, scheduled or streamed.
+
+    Streamed runs do not go through the scheduler; they only mark the thread busy.
+    """
+    return thread["status"] == ThreadStatus.busy.value or scheduler.is_busy(thread["thread_id"])
+
+
+def get_run_thread(thread_id: str, body: RunCreateStateful) -> Dict[str, Any]:
+    """
+    Return the thread a run is created on, creating it if the request allows it.
+
+    Raises:
+        HTTPException: 404 if the thread is unknown and `if_not_exists` is 'reject'.
+    """
+    if_not_exists = getattr(body.if_not_exists, "value", body.if_not_exists)
+    if if_not_exists == IfNotExists.create.value:
+        return get_thread_store().create(thread_id, body.metadata, if_exists="do_nothing")
+    return get_thread_or_404(thread_id)
+
+
+def get_scheduled_run_thread(thread_id: str, body: RunCreateStateful) -> str:
+    """
+    Return the id of the thread a scheduled run is created on.
+
+    The scheduler applies the multitask strategy to the runs it holds, but a
+    streamed run is outside of it and cannot be interrupted or waited for.
+
+    Raises:
+        HTTPException: 404 if the thread is unknown and `if_not_exists` is 'reject',
+            409 if a streamed run is going on on the thread.
+    """
+    thread = get_run_thread(thread_id, body)
+    if thread["status"] == ThreadStatus.busy.value and not scheduler.is_busy(thread["thread_id"]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Thread {thread['thread_id']} already has an active run",
+        )
+    return thread["thread_id"]
+
+
+async def execute_thread_run(thread_id: str, query: str) -> Any:
+    """
+    Execute a graph run on a thread for the scheduler, tracking the thread status.
+
+    Args:
+        thread_id (str): The thread to continue.
+        query (str): The user query.
+
+    Returns:
+        Any: The final answer of the graph.
+    """
+    store = get_thread_store()
+    store.set_status(thread_id, ThreadStatus.busy)
+    try:
+        async with run_slots:
+            result, _ = await JiraGraph.get_instance().aserve(query, thread_id=thread_id)
+    except Exception:
+        store.set_status(thread_id, ThreadStatus.error)
+        raise
+    finally:
+        try:
+            if store.get(thread_id)["status"] == ThreadStatus.busy.value:
+                store.set_status(thread_id, ThreadStatus.idle)
+        except ThreadNotFound:
+            # The thread was deleted while the run was going on
+            pass
+    logging.info("result: %s", result)
+    return result
+
+
+def thread_run_callbacks(thread_id: str) -> Tuple[RunExecutor, RunRollback]:
+    """
+    Return the scheduler executor of a run on a thread, and the rollback undoing it.
+
+    The executor records the latest checkpoint of the thread before the run
+    starts; the rollback restores the thread to that checkpoint, dropping
+    whatever the interrupted run wrote.
+
+    Args:
+        thread_id (str): The thread to continue.
+
+    Returns:
+        Tuple[RunExecutor, RunRollback]: The executor and the rollback of the run.
+    """
+    start: Dict[str, Any] = {}
+
+    async def executor(query: str) -> Any:
+        start["checkpoint_id"] = await JiraGraph.get_instance().aget_thread_checkpoint_id(thread_id)
+        return await execute_thread_run(thread_id, query)
+
+    async def rollback():
+        if "checkpoint_id" in start:
+            await JiraGraph.get_instance().arollback_thread(thread_id, start["checkpoint_id"])
+
+    return executor, rollback
+
+
+async def stream_thread_run_events(
+    thread_id: str, query: str, stream_modes: list
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Stream a run on a thread marked busy by the caller, tracking the thread status.
+    """
+    store = get_thread_store()
+    final_status = ThreadStatus.idle
+    try:
+        async for event in stream_run_events(query, stream_modes, thread_id=thread_id):
+            if event["event"] == "error":
+                final_status = ThreadStatus.error
+            yield event
+    except Exception:
+        final_status = ThreadStatus.error
+        raise
+    finally:
+        store.set_status(thread_id, final_status)
+
+
+async def get_thread_view(thread: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the current values and messages of a thread to its record.
+    """
+    state = await JiraGraph.get_instance().aget_thread_state(thread["thread_id"])
+    return {**thread, **state_values(state.values)}
+
+
+def state_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split graph state values into the `values` and `messages` of the Agent Protocol.
+
+    Args:
+        values (Dict[str, Any]): The state values of a checkpoint.
+
+    Returns:
+        Dict[str, Any]: The `values` (without messages) and the `messages`.
+    """
+    values = dict(values or {})
+    messages = values.pop("messages", [])
+    return {
+        "values": values,
+        "messages": [
+            {"role": message.type, "content": message.content, "id": message.id}
+            for message in messages
+        ],
+    }
+
+
+@router.post(
+    "/threads",
+    response_model=Any,
+    responses={"409": {"model": ErrorResponse}},
+)
+async def create_thread_threads_post(body: ThreadCreate) -> Union[Any, ErrorResponse]:
+    """
+    Create Thread
+    """
+    try:
+        return get_thread_store().create(
+            body.thread_id,
+            body.metadata,
+            if_exists=getattr(body.if_exists, "value", body.if_exists),
+        )
+    except ThreadExists as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+
+
+@router.post(
+    "/threads/search",
+    response_model=Any,
+)
+async def search_threads_threads_search_post(body: ThreadSearchRequest) -> Any:
+    """
+    Search Threads
+    """
+    return get_thread_store().search(
+        metadata=body.metadata,
+        status=getattr(body.status, "value", body.status),
+        limit=body.limit,
+        offset=body.offset,
+    )
+
+
+@router.get(
+    "/threads/{thread_id}",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+)
+async def get_thread_threads_thread_id_get(thread_id: str) -> Union[Any, ErrorResponse]:
+    """
+    Get Thread
+    """
+    return await get_thread_view(get_thread_or_404(thread_id))
+
+
+@router.get(
+    "/threads/{thread_id}/history",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+)
+async def get_thread_history_threads_thread_id_history_get(
+    thread_id: str, limit: int = 10
+) -> Union[Any, ErrorResponse]:
+    """
+    Get Thread History
+    """
+    get_thread_or_404(thread_id)
+    history = await JiraGraph.get_instance().aget_thread_history(thread_id, limit=limit)
+    return [
+        {
+            "checkpoint": {
+                "checkpoint_id": state.config["configurable"]["checkpoint_id"],
+                "checkpoint_ns": state.config["configurable"].get("checkpoint_ns", ""),
+            },
+            **state_values(state.values),
+            "metadata": state.metadata,
+        }
+        for state in history
+    ]
+
+
+@router.delete(
+    "/threads/{thread_id}",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}, "409": {"model": ErrorResponse}},
+)
+async def delete_thread_threads_thread_id_delete(
+    thread_id: str,
+) -> Union[Any, ErrorResponse]:
+    """
+    Delete Thread
+    """
+    if is_thread_busy(get_thread_or_404(thread_id)):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Thread {thread_id} has an active run",
+        )
+    await JiraGraph.get_instance().adelete_thread(thread_id)
+    get_thread_store().delete(thread_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/threads/{thread_id}/runs",
+    response_model=Any,
+    responses={
+        "404": {"model": ErrorResponse},
+        "409": {"model": ErrorResponse},
+        "422": {"model": ErrorResponse},
+    },
+    tags=["Thread Runs"],
+)
+async def create_run_threads_thread_id_runs_post(
+    thread_id: str, body: RunCreateStateful, request: Request
+) -> Union[Any, ErrorResponse]:
+    """
+    Create Background Run on a Thread
+
+    Like `POST /runs`, the run waits for its output unless it has a `webhook`
+    or `after_seconds`. The run continues the thread's conversation.
+    """
+    thread_id = get_scheduled_run_thread(thread_id, body)
+    executor, rollback = thread_run_callbacks(thread_id)
+    if body.webhook or body.after_seconds:
+        record = submit_run(body, thread_id, executor, rollback)
+        return JSONResponse(
+            content=record.to_dict(), status_code=status.HTTP_202_ACCEPTED
+        )
+
+    return await run_and_wait(body, request, thread_id, executor, rollback)
+
+
+@router.post(
+    "/threads/{thread_id}/runs/wait",
+    response_model=Any,
+    responses={
+        "404": {"model": ErrorResponse},
+        "409": {"model": ErrorResponse},
+        "422": {"model": ErrorResponse},
+    },
+    tags=["Thread Runs"],
+)
+async def wait_run_threads_thread_id_runs_wait_post(
+    thread_id: str, body: RunCreateStateful, request: Request
+) -> Union[Any, ErrorResponse]:
+    """
+    Create Run on a Thread, Wait for Output
+    """
+    thread_id = get_scheduled_run_thread(thread_id, body)
+    executor, rollback = thread_run_callbacks(thread_id)
+    return await run_and_wait(body, request, thread_id, executor, rollback)
+
+
+@router.post(
+    "/threads/{thread_id}/runs/stream",
+    response_model=str,
+    responses={
+        "404": {"model": ErrorResponse},
+        "409": {"model": ErrorResponse},
+        "422": {"model": ErrorResponse},
+    },
+    tags=["Thread Runs"],
+)
+async def stream_run_threads_thread_id_runs_stream_post(
+    thread_id: str, body: RunCreateStateful
+) -> Union[str, ErrorResponse]:
+    """
+    Create Run on a Thread, Stream Output
+    """
+    query = get_query(body)
+    logging.info("query: %s", query)
+
+    stream_modes = get_stream_modes(body)
+    check_stream_modes(stream_modes)
+
+    thread = get_run_thread(thread_id, body)
+    # The thread is marked busy before the response is returned, so that a
+    # concurrent stream request cannot start a second run on it
+    if scheduler.is_busy(thread["thread_id"]) or not get_thread_store().mark_busy(thread["thread_id"]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Thread {thread['thread_id']} already has an active run",
+        )
+
+    return EventSourceResponse(
+        stream_thread_run_events(thread["thread_id"], query, stream_modes)
+    )
+
+
+@router.get(
+    "/threads/{thread_id}/runs",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+    tags=["Thread Runs"],
+)
+async def list_runs_threads_thread_id_runs_get(
+    thread_id: str,
+) -> Union[Any, ErrorResponse]:
+    """
+    List Runs of a Thread
+    """
+    get_thread_or_404(thread_id)
+    return [record.to_dict() for record in scheduler.list(thread_id)]
+
+
+@router.get(
+    "/threads/{thread_id}/runs/{run_id}",
+    response_model=Any,
+    responses={"404": {"model": ErrorResponse}},
+    tags=["Thread Runs"],
+)
+async def get_run_threads_thread_id_runs_run_id_get(
+    thread_id: str, run_id: str
+) -> Union[Any, ErrorResponse]:
+    """
+    Get Run of a Thread
+    """
+    record = get_run_or_404(run_id)
+    if record.thread_id != thread_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Run {run_id} not found on thread {thread_id}",
+        )
+    return record.to_dict()
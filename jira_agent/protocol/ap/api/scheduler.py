@@ -0,0 +1,362 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import httpx
+
+from jira_agent.models.models import MultitaskStrategy, Status
+
+logger = logging.getLogger(__name__)
+
+RunExecutor = Callable[[str], Awaitable[Any]]
+RunRollback = Callable[[], Awaitable[None]]
+
+
+class RunQueueFull(Exception):
+  """Raised when the scheduler already holds the maximum number of pending runs."""
+
+
+class ThreadBusy(Exception):
+  """Raised when a run is rejected because its thread already has an active run."""
+
+
+class RunNotFound(Exception):
+  """Raised when a run id is unknown or has been evicted from the run history."""
+
+
+@dataclass
+class RunRecord:
+  """
+  Book-keeping for a single scheduled run.
+
+  `status` stays `pending` while the run is queued or executing, matching the
+  Agent Protocol run statuses.
+  """
+  query: str
+  thread_id: str
+  agent_id: Optional[str] = None
+  metadata: Dict[str, Any] = field(default_factory=dict)
+  multitask_strategy: MultitaskStrategy = MultitaskStrategy.reject
+  webhook: Optional[str] = None
+  after_seconds: Optional[int] = None
+  # Overrides the scheduler's executor, e.g. to run on a stateful thread
+  executor: Optional[RunExecutor] = None
+  # Undoes what an interrupted run wrote, e.g. the checkpoints of its thread
+  rollback: Optional[RunRollback] = None
+  run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+  created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+  updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+  status: Status = Status.pending
+  output: Any = None
+  error: Optional[str] = None
+  dispatched: bool = False
+  task: Optional[asyncio.Task] = None
+  done: asyncio.Event = field(default_factory=asyncio.Event)
+
+  def finish(self, status: Status, output: Any = None, error: Optional[str] = None):
+    self.status = status
+    self.output = output
+    self.error = error
+    self.updated_at = datetime.now(timezone.utc)
+    self.done.set()
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Serialize the run in the shape of the Agent Protocol `Run` model plus its outcome."""
+    return {
+      "run_id": self.run_id,
+      "thread_id": self.thread_id,
+      "agent_id": self.agent_id,
+      "created_at": self.created_at.isoformat(),
+      "updated_at": self.updated_at.isoformat(),
+      "status": self.status.value,
+      "metadata": self.metadata,
+      "kwargs": {"input": {"query": self.query}},
+      "multitask_strategy": self.multitask_strategy.value,
+      "output": self.output,
+      "error": self.error,
+    }
+
+
+class RunScheduler:
+  """
+  In-process scheduler for graph runs.
+
+  Runs wait in a bounded queue drained by a fixed pool of worker
+  tasks, so bursts of traffic wait for a worker instead of piling up on the
+  server. Runs that share a thread are serialized according to their
+  multitask strategy, and finished runs are kept in a bounded history so
+  their status can be polled.
+  """
+
+  def __init__(
+    self,
+    executor: RunExecutor,
+    workers: int,
+    max_queued: int,
+    history_size: int,
+    webhook_timeout: float = 10.0,
+  ):
+    """
+    Args:
+      executor (RunExecutor): Coroutine function executing a query and returning its output.
+      workers (int): Number of runs executed concurrently.
+      max_queued (int): Maximum number of runs waiting for a worker before new runs are refused.
+      history_size (int): Number of runs (active or finished) kept for status polling.
+      webhook_timeout (float): Timeout in seconds for webhook completion callbacks.
+    """
+    self._executor = executor
+    self._workers = workers
+    self._max_queued = max_queued
+    self._history_size = history_size
+    self._webhook_timeout = webhook_timeout
+    self._queue: Optional[asyncio.Queue] = None
+    self._worker_tasks: List[asyncio.Task] = []
+    self._background: Set[asyncio.Task] = set()
+    self._runs: "OrderedDict[str, RunRecord]" = OrderedDict()
+    self._threads: Dict[str, Deque[RunRecord]] = {}
+    self._active = 0
+
+  def start(self):
+    """Start the worker pool on the running event loop. Safe to call more than once."""
+    if self._worker_tasks:
+      return
+    self._queue = asyncio.Queue()
+    self._worker_tasks = [
+      asyncio.create_task(self._worker(), name=f"run-worker-{i}")
+      for i in range(self._workers)
+    ]
+    logger.info(f"Run scheduler started with {self._workers} workers")
+
+  async def stop(self):
+    """Cancel the workers and every active run."""
+    for record in list(self._runs.values()):
+      if record.status == Status.pending:
+        self._interrupt(record, notify=False)
+    tasks = self._worker_tasks + list(self._background)
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    self._worker_tasks = []
+    self._background.clear()
+    self._queue = None
+    logger.info("Run scheduler stopped")
+
+  def submit(self, record: RunRecord) -> RunRecord:
+    """
+    Schedule a run, applying the multitask strategy of its thread.
+
+    Args:
+      record (RunRecord): The run to schedule.
+
+    Returns:
+      RunRecord: The scheduled run.
+
+    Raises:
+      ThreadBusy: If the strategy is `reject` and the thread has an active run.
+      RunQueueFull: If the maximum number of runs is already waiting for a worker.
+    """
+    self.start()
+
+    active = self._threads.get(record.thread_id)
+    rolled_back: List[RunRecord] = []
+    if active:
+      if record.multitask_strategy == MultitaskStrategy.reject:
+        raise ThreadBusy(f"Thread {record.thread_id} already has an active run")
+      if record.multitask_strategy in (MultitaskStrategy.interrupt, MultitaskStrategy.rollback):
+        for previous in list(active):
+          self._interrupt(previous)
+          # Rolled back runs are discarded instead of being kept as interrupted
+          if record.multitask_strategy == MultitaskStrategy.rollback:
+            self._runs.pop(previous.run_id, None)
+            rolled_back.append(previous)
+
+    if self._active >= self._workers + self._max_queued:
+      raise RunQueueFull(f"Run queue is full ({self._max_queued} queued runs)")
+
+    self._active += 1
+    self._remember(record)
+    queue = self._threads.setdefault(record.thread_id, deque())
+    queue.append(record)
+    if queue[0] is record:
+      if rolled_back:
+        # The run starts once the interrupted runs are stopped and undone
+        record.dispatched = True
+        self._spawn(self._dispatch_after_rollback(record, rolled_back))
+      else:
+        self._dispatch(record)
+    return record
+
+  def get(self, run_id: str) -> RunRecord:
+    """
+    Return a run by id.
+
+    Raises:
+      RunNotFound: If the run is unknown.
+    """
+    try:
+      return self._runs[run_id]
+    except KeyError:
+      raise RunNotFound(f"Run {run_id} not found")
+
+  def cancel(self, run_id: str) -> RunRecord:
+    """
+    Cancel a run if it is still pending or executing.
+
+    Raises:
+      RunNotFound: If the run is unknown.
+    """
+    record = self.get(run_id)
+    if record.status == Status.pending:
+      self._interrupt(record)
+    return record
+
+  async def wait(self, run_id: str) -> RunRecord:
+    """Wait for a run to finish and return it."""
+    record = self.get(run_id)
+    await record.done.wait()
+    return record
+
+  def is_busy(self, thread_id: str) -> bool:
+    """Return whether a thread has a pending or executing run."""
+    return bool(self._threads.get(thread_id))
+
+  def list(self, thread_id: str) -> List[RunRecord]:
+    """Return the runs of a thread still in the run history, oldest first."""
+    return [record for record in self._runs.values() if record.thread_id == thread_id]
+
+  def stats(self) -> Dict[str, int]:
+    return {
+      "workers": len(self._worker_tasks),
+      "active": self._active,
+      "runs": len(self._runs),
+    }
+
+  def _remember(self, record: RunRecord):
+    self._runs[record.run_id] = record
+    overflow = len(self._runs) - self._history_size
+    if overflow > 0:
+      # Evict the oldest finished runs; active runs are always kept
+      finished = [run_id for run_id, run in self._runs.items() if run.done.is_set()]
+      for run_id in finished[:overflow]:
+        del self._runs[run_id]
+
+  def _dispatch(self, record: RunRecord):
+    record.dispatched = True
+    if record.after_seconds:
+      self._spawn(self._enqueue_later(record, record.after_seconds))
+    else:
+      self._queue.put_nowait(record)
+
+  async def _dispatch_after_rollback(self, record: RunRecord, rolled_back: List[RunRecord]):
+    started = [previous for previous in rolled_back if previous.task is not None]
+    await asyncio.gather(*(previous.task for previous in started), return_exceptions=True)
+    for previous in started:
+      if previous.rollback is None:
+        continue
+      try:
+        await previous.rollback()
+        logger.info(f"Run {previous.run_id} rolled back")
+      except Exception as e:
+        logger.error(f"Rollback of run {previous.run_id} failed: {e}", exc_info=True)
+    if record.status == Status.pending and self._queue is not None:
+      self._dispatch(record)
+
+  async def _enqueue_later(self, record: RunRecord, delay: float):
+    await asyncio.sleep(delay)
+    if record.status == Status.pending and self._queue is not None:
+      self._queue.put_nowait(record)
+
+  def _interrupt(self, record: RunRecord, notify: bool = True):
+    started = record.task is not None
+    if started and not record.task.done():
+      record.task.cancel()
+    self._release(record)
+    record.finish(Status.interrupted, error="Run was interrupted")
+    logger.info(f"Run {record.run_id} interrupted")
+    # A started run calls its webhook once its task is stopped
+    if notify and not started and record.webhook:
+      self._spawn(self._call_webhook(record))
+
+  def _release(self, record: RunRecord):
+    """Drop a run from its thread and start the next run waiting on that thread."""
+    if record.status != Status.pending or record.done.is_set():
+      return
+    self._active -= 1
+    thread = self._threads.get(record.thread_id)
+    if thread is None:
+      return
+    if record in thread:
+      thread.remove(record)
+    if not thread:
+      del self._threads[record.thread_id]
+    elif not thread[0].dispatched:
+      self._dispatch(thread[0])
+
+  async def _worker(self):
+    while True:
+      record = await self._queue.get()
+      try:
+        if record.status != Status.pending or record.done.is_set():
+          continue
+        await self._execute(record)
+      finally:
+        self._queue.task_done()
+
+  async def _execute(self, record: RunRecord):
+    logger.info(f"Run {record.run_id} started")
+    record.task = asyncio.create_task((record.executor or self._executor)(record.query))
+    try:
+      output = await record.task
+    except asyncio.CancelledError:
+      if not record.done.is_set():
+        self._release(record)
+        record.finish(Status.interrupted, error="Run was interrupted")
+      if asyncio.current_task().cancelling():
+        # The worker itself is stopping, not only the run
+        raise
+      # The run was interrupted; the worker itself keeps going
+    except Exception as e:
+      logger.error(f"Run {record.run_id} failed: {e}", exc_info=True)
+      self._release(record)
+      record.finish(Status.error, error=str(e))
+    else:
+      self._release(record)
+      record.finish(Status.success, output=output)
+      logger.info(f"Run {record.run_id} finished")
+
+    if record.webhook:
+      self._spawn(self._call_webhook(record))
+
+  async def _call_webhook(self, record: RunRecord):
+    try:
+      async with httpx.AsyncClient(timeout=self._webhook_timeout) as client:
+        response = await client.post(record.webhook, json=record.to_dict())
+        response.raise_for_status()
+    except Exception as e:
+      logger.warning(f"Webhook for run {record.run_id} failed: {e}")
+
+  def _spawn(self, coro: Awaitable):
+    task = asyncio.create_task(coro)
+    self._background.add(task)
+    task.add_done_callback(self._background.discard)
@@ -0,0 +1,194 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from jira_agent.models.models import Status1 as ThreadStatus
+
+
+class ThreadNotFound(Exception):
+  """Raised when a thread id is unknown or the thread was deleted."""
+
+
+class ThreadExists(Exception):
+  """Raised when creating a thread whose id is already taken."""
+
+
+class ThreadStore:
+  """
+  Registry of stateful threads, persisted in SQLite.
+
+  Only the thread record (metadata, status, timestamps) is kept here; the
+  conversation itself lives in the graph's thread checkpointer, which can
+  share the same database file.
+  """
+
+  def __init__(self, path: str):
+    """
+    Args:
+      path (str): The SQLite database file.
+    """
+    self.path = path
+    self._lock = threading.Lock()
+    self._conn = sqlite3.connect(path, check_same_thread=False)
+    with self._lock, self._conn:
+      self._conn.execute(
+        """CREATE TABLE IF NOT EXISTS threads (
+          thread_id TEXT PRIMARY KEY,
+          created_at TEXT NOT NULL,
+          updated_at TEXT NOT NULL,
+          metadata BLOB NOT NULL,
+          status TEXT NOT NULL
+        )"""
+      )
+      # Runs do not survive a restart, so no thread can still be busy
+      self._conn.execute(
+        "UPDATE threads SET status = ? WHERE status = ?",
+        (ThreadStatus.idle.value, ThreadStatus.busy.value),
+      )
+
+  @staticmethod
+  def _to_dict(row) -> Dict[str, Any]:
+    thread_id, created_at, updated_at, metadata, status = row
+    return {
+      "thread_id": thread_id,
+      "created_at": created_at,
+      "updated_at": updated_at,
+      "metadata": orjson.loads(metadata),
+      "status": status,
+    }
+
+  def create(
+    self,
+    thread_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    if_exists: str = "raise",
+  ) -> Dict[str, Any]:
+    """
+    Create a thread.
+
+    Args:
+      thread_id (Optional[str]): The thread id, a random UUID if not given.
+      metadata (Optional[Dict[str, Any]]): Metadata of the thread.
+      if_exists (str): 'raise' or 'do_nothing' (return the existing thread).
+
+    Returns:
+      Dict[str, Any]: The thread.
+
+    Raises:
+      ThreadExists: If the thread exists and `if_exists` is 'raise'.
+    """
+    thread_id = str(thread_id or uuid.uuid4())
+    now = datetime.now(timezone.utc).isoformat()
+    with self._lock, self._conn:
+      inserted = self._conn.execute(
+        "INSERT OR IGNORE INTO threads VALUES (?, ?, ?, ?, ?)",
+        (thread_id, now, now, orjson.dumps(metadata or {}), ThreadStatus.idle.value),
+      ).rowcount
+    if not inserted and if_exists == "raise":
+      raise ThreadExists(f"Thread {thread_id} already exists")
+    return self.get(thread_id)
+
+  def get(self, thread_id: str) -> Dict[str, Any]:
+    """
+    Return a thread by id.
+
+    Raises:
+      ThreadNotFound: If the thread is unknown.
+    """
+    with self._lock:
+      row = self._conn.execute("SELECT * FROM threads WHERE thread_id = ?", (str(thread_id),)).fetchone()
+    if row is None:
+      raise ThreadNotFound(f"Thread {thread_id} not found")
+    return self._to_dict(row)
+
+  def search(
+    self,
+    metadata: Optional[Dict[str, Any]] = None,
+    status: Optional[str] = None,
+    limit: int = 10,
+    offset: int = 0,
+  ) -> List[Dict[str, Any]]:
+    """
+    Return the threads matching a metadata filter and status, most recently updated first.
+
+    Args:
+      metadata (Optional[Dict[str, Any]]): Metadata key/values the threads must have.
+      status (Optional[str]): Status the threads must have.
+      limit (int): Maximum number of threads to return.
+      offset (int): Number of matching threads to skip.
+
+    Returns:
+      List[Dict[str, Any]]: The matching threads.
+    """
+    query, params = "SELECT * FROM threads", []
+    if status:
+      query, params = query + " WHERE status = ?", [status]
+    with self._lock:
+      rows = self._conn.execute(query + " ORDER BY updated_at DESC", params).fetchall()
+    threads = [self._to_dict(row) for row in rows]
+    if metadata:
+      threads = [
+        thread for thread in threads
+        if all(thread["metadata"].get(key) == value for key, value in metadata.items())
+      ]
+    return threads[offset:offset + limit]
+
+  def set_status(self, thread_id: str, status: ThreadStatus):
+    """Record the status of a thread, touching its `updated_at`."""
+    with self._lock, self._conn:
+      self._conn.execute(
+        "UPDATE threads SET status = ?, updated_at = ? WHERE thread_id = ?",
+        (status.value, datetime.now(timezone.utc).isoformat(), str(thread_id)),
+      )
+
+  def mark_busy(self, thread_id: str) -> bool:
+    """
+    Mark a thread busy unless it already is, in a single statement.
+
+    Returns:
+      bool: Whether the thread was marked busy, False if it was busy or unknown.
+    """
+    with self._lock, self._conn:
+      updated = self._conn.execute(
+        "UPDATE threads SET status = ?, updated_at = ? WHERE thread_id = ? AND status != ?",
+        (
+          ThreadStatus.busy.value,
+          datetime.now(timezone.utc).isoformat(),
+          str(thread_id),
+          ThreadStatus.busy.value,
+        ),
+      ).rowcount
+    return bool(updated)
+
+  def delete(self, thread_id: str):
+    """
+    Delete a thread.
+
+    Raises:
+      ThreadNotFound: If the thread is unknown.
+    """
+    with self._lock, self._conn:
+      deleted = self._conn.execute("DELETE FROM threads WHERE thread_id = ?", (str(thread_id),)).rowcount
+    if not deleted:
+      raise ThreadNotFound(f"Thread {thread_id} not found")
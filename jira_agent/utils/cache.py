@@ -0,0 +1,90 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Returned by TTLCache.lookup when a key is absent or expired
+MISSING = object()
+
+
+class TTLCache:
+  """
+  Thread-safe LRU cache whose entries expire after a time-to-live.
+
+  Entries may carry their own TTL, which lets callers cache negative results
+  (e.g. "user not found") for a shorter time than positive ones. Hit, miss,
+  eviction and expiration counters are kept for observability.
+  """
+
+  def __init__(self, maxsize: int, ttl: float):
+    """
+    Args:
+      maxsize (int): Maximum number of entries; the least recently used entry is evicted first.
+      ttl (float): Default time-to-live in seconds.
+    """
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    self._lock = threading.Lock()
+    self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+  def lookup(self, key: Hashable) -> Any:
+    """
+    Return the cached value for `key`, or `MISSING` if it is absent or expired.
+
+    Cached values may legitimately be `None`, hence the sentinel.
+    """
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        expires_at, value = entry
+        if expires_at > time.monotonic():
+          self._entries.move_to_end(key)
+          self._stats["hits"] += 1
+          return value
+        del self._entries[key]
+        self._stats["expirations"] += 1
+      self._stats["misses"] += 1
+      return MISSING
+
+  def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+    """Store `value` under `key` for `ttl` seconds (the cache default if None)."""
+    expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+    with self._lock:
+      self._entries[key] = (expires_at, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.maxsize:
+        self._entries.popitem(last=False)
+        self._stats["evictions"] += 1
+
+  def invalidate(self, key: Hashable):
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> Dict[str, int]:
+    with self._lock:
+      return {**self._stats, "size": len(self._entries)}
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -0,0 +1,101 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CallResult:
+  """The outcome of one call of a fan-out: its value, or the exception it raised."""
+  value: Any = None
+  error: Optional[BaseException] = None
+
+  @property
+  def ok(self) -> bool:
+    return self.error is None
+
+  def unwrap(self) -> Any:
+    """Return the value, re-raising the captured exception if the call failed."""
+    if self.error is not None:
+      raise self.error
+    return self.value
+
+
+def gather_calls(*calls: Callable[[], Any], max_workers: Optional[int] = None) -> List[CallResult]:
+  """
+  Run independent blocking calls concurrently and return their results in order.
+
+  Each call runs in a copy of the caller's context, so per-run caches stay
+  visible. A failing call does not affect the others; its exception is
+  captured in its `CallResult`.
+
+  Args:
+    calls (Callable[[], Any]): Zero-argument callables.
+    max_workers (Optional[int]): Maximum calls in flight; all of them by default.
+
+  Returns:
+    List[CallResult]: One result per call, in the order given.
+  """
+  if len(calls) <= 1:
+    return [_call(call) for call in calls]
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers or len(calls), len(calls)))) as pool:
+    futures = [pool.submit(contextvars.copy_context().run, _call, call) for call in calls]
+    return [future.result() for future in futures]
+
+
+async def agather_calls(*calls: Callable[[], Awaitable[Any]], limit: Optional[int] = None) -> List[CallResult]:
+  """Async variant of `gather_calls`; `limit` bounds the coroutines awaited at once."""
+  semaphore = asyncio.Semaphore(limit) if limit else None
+
+  async def run(call: Callable[[], Awaitable[Any]]) -> CallResult:
+    try:
+      if semaphore is None:
+        return CallResult(value=await call())
+      async with semaphore:
+        return CallResult(value=await call())
+    except Exception as e:
+      return CallResult(error=e)
+
+  return list(await asyncio.gather(*(run(call) for call in calls)))
+
+
+def map_calls(func: Callable[[T], Any], items: Iterable[T], max_workers: Optional[int] = None) -> List[CallResult]:
+  """Apply `func` to every item with `gather_calls`."""
+  return gather_calls(*(_bind(func, item) for item in items), max_workers=max_workers)
+
+
+async def amap_calls(func: Callable[[T], Awaitable[Any]], items: Iterable[T], limit: Optional[int] = None) -> List[CallResult]:
+  """Apply the coroutine function `func` to every item with `agather_calls`."""
+  return await agather_calls(*(_bind(func, item) for item in items), limit=limit)
+
+
+def _bind(func: Callable[[T], Any], item: T) -> Callable[[], Any]:
+  return lambda: func(item)
+
+
+def _call(call: Callable[[], Any]) -> CallResult:
+  try:
+    return CallResult(value=call())
+  except Exception as e:
+    return CallResult(error=e)
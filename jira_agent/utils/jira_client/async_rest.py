@@ -0,0 +1,156 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+import threading
+import traceback
+import weakref
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+from .codec import decode_response, encode_payload
+from .resilience import JiraResilience
+from .rest import JiraRESTClient
+
+
+class AsyncJiraRESTClient:
+  """
+  Asyncio counterpart of `JiraRESTClient` backed by `httpx.AsyncClient`.
+
+  Authentication, headers and pool sizing come from the same JiraConfig as the
+  sync client. One pooled `httpx.AsyncClient` is kept per event loop, because
+  httpx connections cannot be shared between loops.
+  """
+  _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+  _lock = threading.Lock()
+
+  @classmethod
+  def get_client(cls) -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = cls._clients.get(loop)
+    if client is None:
+      with cls._lock:
+        client = cls._clients.get(loop)
+        if client is None:
+          client = cls._build_client()
+          cls._clients[loop] = client
+    return client
+
+  @classmethod
+  def _build_client(cls) -> httpx.AsyncClient:
+    jira_instance, auth, headers = JiraRESTClient.get_auth_instance()
+    config = JiraRESTClient._config
+    logging.info(f"Creating pooled async Jira HTTP client (max_connections={config.JIRA_HTTP_POOL_MAXSIZE})")
+    return httpx.AsyncClient(
+      base_url=jira_instance,
+      auth=httpx.BasicAuth(auth.username, auth.password) if auth is not None else None,
+      headers=headers,
+      limits=httpx.Limits(
+        max_connections=config.JIRA_HTTP_POOL_MAXSIZE,
+        max_keepalive_connections=config.JIRA_HTTP_POOL_MAXSIZE,
+      ),
+      timeout=httpx.Timeout(config.JIRA_HTTP_READ_TIMEOUT, connect=config.JIRA_HTTP_CONNECT_TIMEOUT),
+    )
+
+  @classmethod
+  async def request(
+    cls,
+    method: str,
+    url_path: str,
+    payload: Union[dict, str, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+  ) -> httpx.Response:
+    """
+    Send a request to the Jira instance over the pooled async client.
+
+    Args:
+      method (str): HTTP method.
+      url_path (str): Path relative to the Jira instance, e.g. `/rest/api/3/project`.
+      payload (Union[dict, str, None]): Request body; dicts are encoded with orjson.
+      params (Optional[Dict[str, Any]]): Query string parameters.
+
+    Retries and rate limiting follow `JiraRESTClient.request`.
+
+    Returns:
+      httpx.Response: The raw response; status handling is left to the caller.
+    """
+    client = cls.get_client()
+    url = f"{client.base_url}{url_path}"
+    JiraRESTClient.get_auth_instance()
+    policy, rate_limiter = JiraResilience.get(JiraRESTClient._config)
+    breaker = JiraResilience.breaker(JiraRESTClient._config, url_path)
+    content = encode_payload(payload)
+    attempt = 0
+    while True:
+      breaker.allow()
+      JiraResilience.record_throttle(await rate_limiter.aacquire())
+      logging.info(f"Sending async {method} request to: {url}")
+      try:
+        response = await client.request(method, url_path, content=content, params=params)
+      except httpx.TransportError as e:
+        error = "connect" if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)) else "transport"
+        breaker.record(error=error)
+        delay = policy.retry_delay(method, attempt, error=error)
+        if delay is None:
+          raise
+        JiraResilience.record_retry(method, url, delay, repr(e))
+      else:
+        breaker.record(response.status_code)
+        delay = policy.retry_delay(method, attempt, response.status_code, response.headers.get("Retry-After"))
+        if delay is None:
+          return response
+        JiraResilience.record_retry(method, url, delay, f"status {response.status_code}")
+      await asyncio.sleep(delay)
+      attempt += 1
+
+  @classmethod
+  async def _send_request(cls, method: str, url_path: str, payload: Union[dict, str, None] = None) -> Any:
+    """Async variant of `JiraRESTClient._send_request`."""
+    try:
+      response = await cls.request(method, url_path, payload)
+      response.raise_for_status()
+      logging.info(f"Received response: {response.status_code}")
+
+      return decode_response(response)
+
+    except Exception as e:
+      return {
+        "error": "Unexpected failure",
+        "exception": str(e),
+        "stack_trace": traceback.format_exc(),
+      }
+
+  @classmethod
+  async def jira_request_get(cls, url_path: str) -> Any:
+    return await cls._send_request("GET", url_path)
+
+  @classmethod
+  async def jira_request_post(cls, url_path: str, payload: Union[dict, str]) -> Any:
+    return await cls._send_request("POST", url_path, payload)
+
+  @classmethod
+  async def jira_request_put(cls, url_path: str, payload: Union[dict, str]) -> Any:
+    return await cls._send_request("PUT", url_path, payload)
+
+  @classmethod
+  async def aclose(cls):
+    """Close the client bound to the running event loop."""
+    client = cls._clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+      await client.aclose()
@@ -0,0 +1,48 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+from typing import Any, Union
+
+import orjson
+
+
+def encode_payload(payload: Union[dict, list, str, bytes, None]) -> Union[str, bytes, None]:
+  """Serialize a request body with orjson; strings and bytes are sent as given."""
+  if isinstance(payload, (dict, list)):
+    return orjson.dumps(payload)
+  return payload
+
+
+def decode_response(response) -> Any:
+  """
+  Parse a Jira response body with orjson straight from the raw bytes.
+
+  Args:
+    response (requests.Response | httpx.Response): The response to decode.
+
+  Returns:
+    Any: The parsed JSON document, or None for an empty body.
+  """
+  if not response.content:
+    return None
+  return orjson.loads(response.content)
+
+
+def dumps(value: Any) -> str:
+  """Serialize an already parsed document for display, e.g. in a tool response."""
+  return orjson.dumps(value).decode()
@@ -27,6 +27,29 @@ class JiraConfig(BaseSettings):
   JIRA_API_TOKEN: Optional[str] = Field(None, description="Jira API token")
   JIRA_PERSONAL_ACCESS_TOKEN: Optional[str] = Field(None, description="Personal access token")
   JIRA_OAUTH_CREDENTIALS: Optional[Dict[str, Any]] = Field(None, description="OAuth credentials")
+  JIRA_HTTP_POOL_CONNECTIONS: int = Field(10, description="Number of per-host connection pools to keep")
+  JIRA_HTTP_POOL_MAXSIZE: int = Field(20, description="Maximum keep-alive connections per host")
+  JIRA_HTTP_POOL_BLOCK: bool = Field(False, description="Block instead of opening extra connections when the pool is full")
+  JIRA_HTTP_CONNECT_TIMEOUT: float = Field(5.0, gt=0, description="Connect timeout in seconds for Jira HTTP calls")
+  JIRA_HTTP_READ_TIMEOUT: float = Field(30.0, gt=0, description="Read timeout in seconds for Jira HTTP calls")
+  JIRA_HTTP_MAX_RETRIES: int = Field(3, description="Retries of a throttled or transiently failed Jira request")
+  JIRA_HTTP_BACKOFF_BASE_SECONDS: float = Field(0.5, description="Base delay of the exponential retry backoff")
+  JIRA_HTTP_BACKOFF_MAX_SECONDS: float = Field(30.0, description="Longest retry delay, including a Retry-After requested by Jira")
+  JIRA_RATE_LIMIT_PER_SECOND: float = Field(10.0, description="Client-side request rate per Jira instance (0 disables)")
+  JIRA_RATE_LIMIT_BURST: int = Field(20, description="Requests allowed in a burst above the client-side rate")
+  JIRA_CIRCUIT_FAILURE_THRESHOLD: int = Field(5, description="Consecutive failures that open the circuit of a Jira endpoint class")
+  JIRA_CIRCUIT_RESET_SECONDS: float = Field(30.0, description="How long an open circuit fails fast before a probe request")
+  JIRA_IDENTITY_CACHE_TTL_SECONDS: float = Field(3600.0, description="How long a resolved email -> accountId mapping is cached")
+  JIRA_IDENTITY_CACHE_NEGATIVE_TTL_SECONDS: float = Field(300.0, description="How long an unknown user email is cached")
+  JIRA_IDENTITY_CACHE_MAXSIZE: int = Field(1024, description="Maximum number of cached user identities")
+  JIRA_PROJECT_METADATA_TTL_SECONDS: float = Field(3600.0, description="How long project creation metadata (createmeta) is cached")
+  JIRA_PROJECT_METADATA_REFRESH_SECONDS: float = Field(900.0, description="Age after which cached project metadata is refreshed in the background")
+  JIRA_PROJECT_METADATA_CACHE_MAXSIZE: int = Field(256, description="Maximum number of projects with cached metadata")
+  JIRA_WORKFLOW_CACHE_TTL_SECONDS: float = Field(3600.0, description="How long the transitions of a workflow state are cached")
+  JIRA_WORKFLOW_CACHE_MAXSIZE: int = Field(512, description="Maximum number of cached workflow states")
+  JIRA_SEARCH_PAGE_SIZE: int = Field(50, description="Issues fetched per JQL search request")
+  JIRA_SEARCH_MAX_RESULTS: int = Field(200, description="Hard cap on the number of issues a JQL search returns")
+  JIRA_BULK_MAX_CONCURRENCY: int = Field(8, description="Concurrent Jira requests per bulk operation without a bulk endpoint")
 
   class Config:
     env_file = ".env"
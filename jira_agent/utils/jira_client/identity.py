@@ -0,0 +1,111 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Optional
+
+from jira_agent.utils.cache import MISSING, TTLCache
+
+from .config import JiraConfig
+from .rest import JiraRESTClient
+
+
+class IdentityCache:
+  """
+  Process-wide cache of email -> Jira accountId resolutions.
+
+  Every tool that resolves a user goes through this cache, so the same person
+  is only looked up once per TTL regardless of which Jira endpoint the tool
+  uses. Unknown users are cached for a shorter, negative TTL; lookups that
+  fail with an error are never cached.
+  """
+  _cache = None
+  _negative_ttl = None
+  _lock = threading.Lock()
+
+  @classmethod
+  def get_cache(cls, config: JiraConfig | None = None) -> TTLCache:
+    """Return the shared cache, creating it on first use."""
+    if cls._cache is None:
+      with cls._lock:
+        if cls._cache is None:
+          if config is None:
+            JiraRESTClient.get_auth_instance()
+            config = JiraRESTClient._config
+          cls._negative_ttl = config.JIRA_IDENTITY_CACHE_NEGATIVE_TTL_SECONDS
+          cls._cache = TTLCache(
+            maxsize=config.JIRA_IDENTITY_CACHE_MAXSIZE,
+            ttl=config.JIRA_IDENTITY_CACHE_TTL_SECONDS,
+          )
+    return cls._cache
+
+  @staticmethod
+  def _key(email: str) -> str:
+    return email.strip().lower()
+
+  @classmethod
+  def _store(cls, email: str, account_id: Optional[str]) -> Optional[str]:
+    cache = cls.get_cache()
+    if account_id:
+      cache.set(cls._key(email), account_id)
+    else:
+      logging.debug(f"Caching unknown Jira user {email} for {cls._negative_ttl}s")
+      cache.set(cls._key(email), None, ttl=cls._negative_ttl)
+    return account_id or None
+
+  @classmethod
+  def resolve(cls, email: str, lookup: Callable[[str], Optional[str]]) -> Optional[str]:
+    """
+    Resolve an email to an accountId, calling `lookup` only on a cache miss.
+
+    Args:
+      email (str): The user email.
+      lookup (Callable[[str], Optional[str]]): Queries Jira; returns the accountId,
+        a falsy value if the user does not exist, and raises on errors.
+
+    Returns:
+      Optional[str]: The accountId, or None if the user does not exist.
+    """
+    cached = cls.get_cache().lookup(cls._key(email))
+    if cached is not MISSING:
+      return cached
+    return cls._store(email, lookup(email))
+
+  @classmethod
+  async def aresolve(cls, email: str, lookup: Callable[[str], Awaitable[Optional[str]]]) -> Optional[str]:
+    """Async variant of `resolve`, for lookups that await Jira."""
+    cached = cls.get_cache().lookup(cls._key(email))
+    if cached is not MISSING:
+      return cached
+    return cls._store(email, await lookup(email))
+
+  @classmethod
+  def invalidate(cls, email: str):
+    if cls._cache is not None:
+      cls._cache.invalidate(cls._key(email))
+
+  @classmethod
+  def stats(cls) -> Dict[str, int]:
+    """Return hit/miss counters of the cache (empty before first use)."""
+    return cls._cache.stats() if cls._cache is not None else {}
+
+  @classmethod
+  def reset(cls):
+    """Drop the shared cache; the next lookup recreates it from the current config."""
+    with cls._lock:
+      cls._cache = None
@@ -0,0 +1,100 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+from typing import Any, Dict, Sequence
+
+from jira_agent.utils.run_context import run_cache
+
+from .async_rest import AsyncJiraRESTClient
+from .codec import decode_response
+from .rest import JiraRESTClient
+
+
+class IssueFetcher:
+  """
+  Fetch Jira issues restricted to the fields a caller actually reads.
+
+  Without a projection Jira returns every field (including all custom fields)
+  and a large rendered payload. Within a run scope the fields fetched for an
+  issue are kept as a snapshot, so later reads of fields already seen are
+  served without another request; writes must call `invalidate`.
+  """
+  ISSUE_PATH = "/rest/api/2/issue/{issue_key}"
+  SNAPSHOT_NAMESPACE = "issue_snapshots"
+
+  @classmethod
+  def _snapshot(cls, issue_key: str) -> Dict[str, Any] | None:
+    return run_cache(cls.SNAPSHOT_NAMESPACE).get(issue_key)
+
+  @classmethod
+  def _cached(cls, issue_key: str, fields: Sequence[str]) -> Dict[str, Any] | None:
+    snapshot = cls._snapshot(issue_key)
+    if snapshot is None or not all(field in snapshot['fields'] for field in fields):
+      return None
+    logging.info(f"Serving {issue_key} from the run snapshot")
+    return {'key': snapshot['key'], 'fields': {field: snapshot['fields'][field] for field in fields}}
+
+  @classmethod
+  def _remember(cls, issue_key: str, fields: Sequence[str], response) -> Dict[str, Any]:
+    response.raise_for_status()
+    issue = decode_response(response)
+    # Jira omits empty fields, so record every requested field as fetched
+    fetched = {field: issue.get('fields', {}).get(field) for field in fields}
+    snapshots = run_cache(cls.SNAPSHOT_NAMESPACE)
+    snapshot = snapshots.setdefault(issue_key, {'key': issue['key'], 'fields': {}})
+    snapshot['fields'].update(fetched)
+    return {'key': issue['key'], 'fields': fetched}
+
+  @staticmethod
+  def _params(fields: Sequence[str]) -> Dict[str, str]:
+    return {'fields': ','.join(fields)}
+
+  @classmethod
+  def get(cls, issue_key: str, fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    Return `{'key', 'fields'}` for an issue with only the requested fields.
+
+    Args:
+      issue_key (str): The key of the Jira issue.
+      fields (Sequence[str]): Issue fields to return.
+
+    Returns:
+      dict: The issue key and the requested fields (None when unset).
+
+    Raises:
+      httpx.HTTPStatusError | requests.HTTPError: If Jira rejects the request.
+    """
+    cached = cls._cached(issue_key, fields)
+    if cached is not None:
+      return cached
+    response = JiraRESTClient.request("GET", cls.ISSUE_PATH.format(issue_key=issue_key), params=cls._params(fields))
+    return cls._remember(issue_key, fields, response)
+
+  @classmethod
+  async def aget(cls, issue_key: str, fields: Sequence[str]) -> Dict[str, Any]:
+    """Async variant of `get`."""
+    cached = cls._cached(issue_key, fields)
+    if cached is not None:
+      return cached
+    response = await AsyncJiraRESTClient.request("GET", cls.ISSUE_PATH.format(issue_key=issue_key), params=cls._params(fields))
+    return cls._remember(issue_key, fields, response)
+
+  @classmethod
+  def invalidate(cls, issue_key: str):
+    """Drop the run snapshot of an issue after it was changed."""
+    run_cache(cls.SNAPSHOT_NAMESPACE).pop(issue_key, None)
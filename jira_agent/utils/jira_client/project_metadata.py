@@ -0,0 +1,195 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+from jira_agent.utils.cache import MISSING, TTLCache
+
+from .config import JiraConfig
+from .rest import JiraRESTClient
+
+
+@dataclass
+class ProjectMetadata:
+  """
+  Issue creation metadata of a Jira project, distilled from `createmeta`.
+
+  `fields` maps each issue type name to its field schemas keyed by field id,
+  with the field name, whether it is required, its JSON schema and, when
+  Jira provides them, the allowed values.
+  """
+  project_key: str
+  issue_types: List[str]
+  fields: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+  fetched_at: float = field(default_factory=time.monotonic)
+
+  @classmethod
+  def from_createmeta(cls, project_key: str, createmeta: dict) -> "ProjectMetadata":
+    issue_types = []
+    fields = {}
+    for project in createmeta.get('projects', []):
+      for issue_type in project.get('issuetypes', []):
+        issue_types.append(issue_type['name'])
+        fields[issue_type['name']] = {
+          field_id: {
+            'name': schema.get('name'),
+            'required': schema.get('required', False),
+            'schema': schema.get('schema', {}),
+            'allowedValues': [
+              value.get('name') or value.get('value') or value.get('id')
+              for value in schema.get('allowedValues', [])
+            ],
+          }
+          for field_id, schema in issue_type.get('fields', {}).items()
+        }
+    return cls(project_key=project_key, issue_types=issue_types, fields=fields)
+
+  def required_fields(self, issue_type: str) -> List[str]:
+    """Return the ids of the fields required to create an issue of `issue_type`."""
+    return [
+      field_id
+      for field_id, schema in self.fields.get(issue_type, {}).items()
+      if schema['required']
+    ]
+
+
+class ProjectMetadataCache:
+  """
+  Process-wide cache of project creation metadata keyed by project key.
+
+  `createmeta` with expanded fields is one of the heaviest Jira payloads and
+  rarely changes, so it is fetched once per TTL. Entries older than the
+  refresh interval are still served while a background refresh replaces
+  them, keeping the heavy round-trip off the request path.
+  """
+  _cache = None
+  _refresh_after = None
+  _refreshing: Set[str] = set()
+  _background: Set[asyncio.Task] = set()
+  _lock = threading.Lock()
+
+  @classmethod
+  def get_cache(cls, config: JiraConfig | None = None) -> TTLCache:
+    """Return the shared cache, creating it on first use."""
+    if cls._cache is None:
+      with cls._lock:
+        if cls._cache is None:
+          if config is None:
+            JiraRESTClient.get_auth_instance()
+            config = JiraRESTClient._config
+          cls._refresh_after = config.JIRA_PROJECT_METADATA_REFRESH_SECONDS
+          cls._cache = TTLCache(
+            maxsize=config.JIRA_PROJECT_METADATA_CACHE_MAXSIZE,
+            ttl=config.JIRA_PROJECT_METADATA_TTL_SECONDS,
+          )
+    return cls._cache
+
+  @staticmethod
+  def _key(project_key: str) -> str:
+    return project_key.strip().upper()
+
+  @classmethod
+  def _store(cls, project_key: str, createmeta: dict) -> ProjectMetadata:
+    metadata = ProjectMetadata.from_createmeta(project_key, createmeta)
+    cls.get_cache().set(cls._key(project_key), metadata)
+    return metadata
+
+  @classmethod
+  def _claim_refresh(cls, metadata: ProjectMetadata) -> bool:
+    """Return True if `metadata` is stale and no refresh is running for it yet."""
+    if time.monotonic() - metadata.fetched_at < cls._refresh_after:
+      return False
+    key = cls._key(metadata.project_key)
+    with cls._lock:
+      if key in cls._refreshing:
+        return False
+      cls._refreshing.add(key)
+      return True
+
+  @classmethod
+  def _refresh(cls, project_key: str, fetch: Callable[[str], dict]):
+    try:
+      cls._store(project_key, fetch(project_key))
+      logging.debug(f"Refreshed project metadata for {project_key}")
+    except Exception as e:
+      logging.warning(f"Background refresh of project metadata for {project_key} failed: {e}")
+    finally:
+      cls._refreshing.discard(cls._key(project_key))
+
+  @classmethod
+  async def _arefresh(cls, project_key: str, fetch: Callable[[str], Awaitable[dict]]):
+    try:
+      cls._store(project_key, await fetch(project_key))
+      logging.debug(f"Refreshed project metadata for {project_key}")
+    except Exception as e:
+      logging.warning(f"Background refresh of project metadata for {project_key} failed: {e}")
+    finally:
+      cls._refreshing.discard(cls._key(project_key))
+
+  @classmethod
+  def get(cls, project_key: str, fetch: Callable[[str], dict]) -> ProjectMetadata:
+    """
+    Return the metadata of a project, calling `fetch` only when it is not cached.
+
+    Args:
+      project_key (str): The Jira project key.
+      fetch (Callable[[str], dict]): Returns the raw createmeta response for a project.
+
+    Returns:
+      ProjectMetadata: The project metadata.
+    """
+    metadata = cls.get_cache().lookup(cls._key(project_key))
+    if metadata is MISSING:
+      return cls._store(project_key, fetch(project_key))
+    if cls._claim_refresh(metadata):
+      threading.Thread(target=cls._refresh, args=(project_key, fetch), daemon=True).start()
+    return metadata
+
+  @classmethod
+  async def aget(cls, project_key: str, fetch: Callable[[str], Awaitable[dict]]) -> ProjectMetadata:
+    """Async variant of `get`, for fetches that await Jira."""
+    metadata = cls.get_cache().lookup(cls._key(project_key))
+    if metadata is MISSING:
+      return cls._store(project_key, await fetch(project_key))
+    if cls._claim_refresh(metadata):
+      task = asyncio.create_task(cls._arefresh(project_key, fetch))
+      cls._background.add(task)
+      task.add_done_callback(cls._background.discard)
+    return metadata
+
+  @classmethod
+  def invalidate(cls, project_key: str):
+    """Drop the cached metadata of a project, e.g. after its configuration changed."""
+    if cls._cache is not None:
+      cls._cache.invalidate(cls._key(project_key))
+
+  @classmethod
+  def stats(cls) -> Dict[str, int]:
+    """Return hit/miss counters of the cache (empty before first use)."""
+    return cls._cache.stats() if cls._cache is not None else {}
+
+  @classmethod
+  def reset(cls):
+    """Drop the shared cache; the next lookup recreates it from the current config."""
+    with cls._lock:
+      cls._cache = None
+      cls._refreshing.clear()
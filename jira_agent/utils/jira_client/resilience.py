@@ -0,0 +1,285 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from typing import Dict, Literal, Optional, Tuple
+
+from .config import JiraConfig
+
+# Statuses Jira Cloud uses for throttling and transient overload
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Methods that can be replayed without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# "connect": the request never reached Jira; "transport": it may have been received
+TransportError = Literal["connect", "transport"]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+  """Return the delay in seconds requested by a `Retry-After` header (seconds or HTTP date)."""
+  if not value:
+    return None
+  try:
+    return max(0.0, float(value))
+  except ValueError:
+    pass
+  try:
+    retry_at = email.utils.parsedate_to_datetime(value)
+  except (TypeError, ValueError):
+    return None
+  return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+  """
+  Client-side rate limiter: `rate` requests per second with bursts up to `capacity`.
+
+  Callers reserve a token and sleep for the time it takes to become available,
+  so concurrent callers are spaced out instead of all retrying at once.
+  """
+
+  def __init__(self, rate: float, capacity: float):
+    self.rate = rate
+    self.capacity = max(1.0, capacity)
+    self._tokens = self.capacity
+    self._updated = time.monotonic()
+    self._lock = threading.Lock()
+
+  def reserve(self) -> float:
+    """Take a token and return how long to wait before using it."""
+    if self.rate <= 0:
+      return 0.0
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+      self._updated = now
+      self._tokens -= 1
+      return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+  def acquire(self) -> float:
+    wait = self.reserve()
+    if wait > 0:
+      time.sleep(wait)
+    return wait
+
+  async def aacquire(self) -> float:
+    wait = self.reserve()
+    if wait > 0:
+      await asyncio.sleep(wait)
+    return wait
+
+
+class RetryPolicy:
+  """
+  Decide whether a failed Jira request is retried and after how long.
+
+  Idempotent methods are retried on throttling, transient 5xx and transport
+  errors. Other methods (POST) are only retried when Jira cannot have acted on
+  the request: a 429, or a failure to connect at all.
+  """
+
+  def __init__(self, max_retries: int, backoff_base: float, backoff_max: float):
+    self.max_retries = max_retries
+    self.backoff_base = backoff_base
+    self.backoff_max = backoff_max
+
+  @classmethod
+  def from_config(cls, config: JiraConfig) -> "RetryPolicy":
+    return cls(config.JIRA_HTTP_MAX_RETRIES, config.JIRA_HTTP_BACKOFF_BASE_SECONDS, config.JIRA_HTTP_BACKOFF_MAX_SECONDS)
+
+  def _retryable(self, method: str, status_code: Optional[int], error: Optional[TransportError]) -> bool:
+    if error == "connect" or status_code == 429:
+      return True
+    if method.upper() not in IDEMPOTENT_METHODS:
+      return False
+    return error == "transport" or status_code in RETRYABLE_STATUS_CODES
+
+  def retry_delay(
+    self,
+    method: str,
+    attempt: int,
+    status_code: Optional[int] = None,
+    retry_after: Optional[str] = None,
+    error: Optional[TransportError] = None,
+  ) -> Optional[float]:
+    """
+    Return the delay before the next attempt, or None when the request must not be retried.
+
+    Args:
+      method (str): HTTP method of the request.
+      attempt (int): Number of retries already made.
+      status_code (Optional[int]): Response status, when a response was received.
+      retry_after (Optional[str]): The response's `Retry-After` header.
+      error (Optional[TransportError]): The kind of transport failure, when no response was received.
+
+    Returns:
+      Optional[float]: Seconds to wait; `Retry-After` is honoured when it fits within `backoff_max`.
+    """
+    if attempt >= self.max_retries or not self._retryable(method, status_code, error):
+      return None
+    requested = parse_retry_after(retry_after)
+    if requested is not None:
+      return requested if requested <= self.backoff_max else None
+    # Full jitter keeps concurrent clients from retrying in lockstep
+    return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class CircuitOpenError(Exception):
+  """Raised instead of sending a request to an endpoint class whose circuit is open."""
+
+
+def endpoint_class(url_path: str) -> str:
+  """Group a REST path by resource, e.g. `/rest/api/3/issue/KEY/transitions` -> `issue`."""
+  parts = [part for part in url_path.split("?")[0].split("/") if part]
+  if len(parts) > 3 and parts[0] == "rest":
+    return parts[3]
+  return parts[-1] if parts else "root"
+
+
+class CircuitBreaker:
+  """
+  Fail fast on an endpoint class after repeated server-side failures.
+
+  After `failure_threshold` consecutive failures the circuit opens and
+  requests are rejected immediately. Once `reset_timeout` has passed a single
+  probe is let through (half-open): its success closes the circuit, its
+  failure opens it again.
+  """
+  CLOSED = "closed"
+  OPEN = "open"
+  HALF_OPEN = "half_open"
+
+  def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+    self.name = name
+    self.failure_threshold = failure_threshold
+    self.reset_timeout = reset_timeout
+    self._state = self.CLOSED
+    self._failures = 0
+    self._opened_at = 0.0
+    self._lock = threading.Lock()
+
+  def allow(self):
+    """
+    Claim permission to send a request.
+
+    Raises:
+      CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+    """
+    with self._lock:
+      if self._state == self.CLOSED:
+        return
+      now = time.monotonic()
+      remaining = self._opened_at + self.reset_timeout - now
+      if remaining <= 0:
+        # A probe that never reports back does not hold the circuit half-open forever
+        logging.info(f"Circuit for Jira {self.name} endpoints is half-open; probing")
+        self._state = self.HALF_OPEN
+        self._opened_at = now
+        return
+      raise CircuitOpenError(
+        f"Jira {self.name} endpoints are failing; not sending requests for another {max(remaining, 0):.0f}s"
+      )
+
+  def record(self, status_code: Optional[int] = None, error: Optional[TransportError] = None):
+    """Record the outcome of an allowed request; transport errors and 5xx count as failures."""
+    failed = error is not None or (status_code is not None and status_code >= 500)
+    with self._lock:
+      if not failed:
+        if self._state != self.CLOSED:
+          logging.info(f"Circuit for Jira {self.name} endpoints closed")
+        self._state = self.CLOSED
+        self._failures = 0
+        return
+      self._failures += 1
+      if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+        if self._state != self.OPEN:
+          logging.warning(f"Circuit for Jira {self.name} endpoints opened after {self._failures} failures")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+  def snapshot(self) -> dict:
+    with self._lock:
+      return {"state": self._state, "consecutive_failures": self._failures}
+
+
+class JiraResilience:
+  """Registry of the retry policy, rate limiter and circuit breakers used for each Jira instance."""
+  _limiters: Dict[str, Tuple[RetryPolicy, TokenBucket]] = {}
+  _breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+  _stats = {"retries": 0, "throttled_seconds": 0.0}
+  _lock = threading.Lock()
+
+  @classmethod
+  def get(cls, config: JiraConfig) -> Tuple[RetryPolicy, TokenBucket]:
+    """Return the (policy, rate limiter) pair for the instance in `config`."""
+    limiter = cls._limiters.get(config.JIRA_INSTANCE)
+    if limiter is None:
+      with cls._lock:
+        limiter = cls._limiters.get(config.JIRA_INSTANCE)
+        if limiter is None:
+          limiter = (
+            RetryPolicy.from_config(config),
+            TokenBucket(config.JIRA_RATE_LIMIT_PER_SECOND, config.JIRA_RATE_LIMIT_BURST),
+          )
+          cls._limiters[config.JIRA_INSTANCE] = limiter
+    return limiter
+
+  @classmethod
+  def breaker(cls, config: JiraConfig, url_path: str) -> CircuitBreaker:
+    """Return the circuit breaker for the endpoint class of `url_path` on the instance in `config`."""
+    key = (config.JIRA_INSTANCE, endpoint_class(url_path))
+    breaker = cls._breakers.get(key)
+    if breaker is None:
+      with cls._lock:
+        breaker = cls._breakers.get(key)
+        if breaker is None:
+          breaker = CircuitBreaker(key[1], config.JIRA_CIRCUIT_FAILURE_THRESHOLD, config.JIRA_CIRCUIT_RESET_SECONDS)
+          cls._breakers[key] = breaker
+    return breaker
+
+  @classmethod
+  def record_retry(cls, method: str, url: str, delay: float, reason: str):
+    logging.warning(f"Retrying {method} {url} in {delay:.2f}s ({reason})")
+    with cls._lock:
+      cls._stats["retries"] += 1
+
+  @classmethod
+  def record_throttle(cls, wait: float):
+    if wait > 0:
+      with cls._lock:
+        cls._stats["throttled_seconds"] += wait
+
+  @classmethod
+  def stats(cls) -> dict:
+    with cls._lock:
+      breakers = dict(cls._breakers)
+      stats = {"retries": cls._stats["retries"], "throttled_seconds": round(cls._stats["throttled_seconds"], 3)}
+    stats["circuit_breakers"] = {name: breaker.snapshot() for (_, name), breaker in breakers.items()}
+    return stats
+
+  @classmethod
+  def reset(cls):
+    with cls._lock:
+      cls._limiters = {}
+      cls._breakers = {}
+      cls._stats = {"retries": 0, "throttled_seconds": 0.0}
@@ -14,12 +14,15 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from .codec import decode_response, encode_payload
 from .config import JiraConfig
+from .resilience import JiraResilience
+from .session import JiraSession
 from requests.auth import HTTPBasicAuth
-from typing import Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 import requests
-import json
 import logging
+import time
 import traceback
 
 class JiraRESTClient:
@@ -59,40 +62,95 @@ class JiraRESTClient:
       cls.initialize() # Automatically initialize with default JiraConfig
     return cls._config.JIRA_INSTANCE, cls._auth_instance, cls._jira_headers
 
-  @staticmethod
-  def _send_request(method: str, url_path: str, payload: Union[dict, str, None] = None) -> str:
-    try:
-      jira_instance, auth, headers = JiraRESTClient.get_auth_instance()
-      url = f"{jira_instance}{url_path}"
+  @classmethod
+  def request(
+    cls,
+    method: str,
+    url_path: str,
+    payload: Union[dict, str, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+  ) -> requests.Response:
+    """
+    Send a request to the Jira instance over the shared pooled session.
+
+    Args:
+      method (str): HTTP method.
+      url_path (str): Path relative to the Jira instance, e.g. `/rest/api/3/project`.
+      payload (Union[dict, str, None]): Request body; dicts are encoded with orjson.
+      params (Optional[Dict[str, Any]]): Query string parameters.
+
+    Throttled and transiently failed requests are retried according to the
+    instance's `RetryPolicy`, and every attempt goes through its rate limiter.
+
+    Returns:
+      requests.Response: The raw response; status handling is left to the caller.
+    """
+    jira_instance, auth, headers = cls.get_auth_instance()
+    url = f"{jira_instance}{url_path}"
+    policy, rate_limiter = JiraResilience.get(cls._config)
+    breaker = JiraResilience.breaker(cls._config, url_path)
+    data = encode_payload(payload)
+    attempt = 0
+    while True:
+      breaker.allow()
+      JiraResilience.record_throttle(rate_limiter.acquire())
       logging.info(f"Sending {method} request to: {url}")
+      try:
+        response = JiraSession.get_session(cls._config).request(
+          method,
+          url,
+          headers=headers,
+          auth=auth,
+          params=params,
+          data=data,
+          timeout=JiraSession.get_timeout(cls._config),
+        )
+      except (requests.ConnectionError, requests.Timeout) as e:
+        error = "connect" if isinstance(e, requests.ConnectTimeout) else "transport"
+        breaker.record(error=error)
+        delay = policy.retry_delay(method, attempt, error=error)
+        if delay is None:
+          raise
+        JiraResilience.record_retry(method, url, delay, str(e))
+      else:
+        breaker.record(response.status_code)
+        delay = policy.retry_delay(method, attempt, response.status_code, response.headers.get("Retry-After"))
+        if delay is None:
+          return response
+        JiraResilience.record_retry(method, url, delay, f"status {response.status_code}")
+      time.sleep(delay)
+      attempt += 1
 
-      response = requests.request(
-        method, url, headers=headers, auth=auth, data=payload
-      )
+  @staticmethod
+  def _send_request(method: str, url_path: str, payload: Union[dict, str, None] = None) -> Any:
+    """
+    Send a request and return the parsed JSON body.
+
+    Failures are returned as an `{"error", "exception", "stack_trace"}` dict
+    rather than raised, so callers can report them to the LLM.
+    """
+    try:
+      response = JiraRESTClient.request(method, url_path, payload)
       response.raise_for_status()
       logging.info(f"Received response: {response.status_code}")
 
-      return json.dumps(
-        json.loads(response.text), sort_keys=True, indent=4, separators=(",", ": ")
-      )
+      return decode_response(response)
 
     except Exception as e:
-      return json.dumps(
-        {
-          "error": "Unexpected failure",
-          "exception": str(e),
-          "stack_trace": traceback.format_exc(),
-        }
-      )
+      return {
+        "error": "Unexpected failure",
+        "exception": str(e),
+        "stack_trace": traceback.format_exc(),
+      }
 
   @classmethod
-  def jira_request_get(cls, url_path: str) -> str:
+  def jira_request_get(cls, url_path: str) -> Any:
     return cls._send_request("GET", url_path)
 
   @classmethod
-  def jira_request_post(cls, url_path: str, payload: Union[dict, str]) -> str:
+  def jira_request_post(cls, url_path: str, payload: Union[dict, str]) -> Any:
     return cls._send_request("POST", url_path, payload)
 
   @classmethod
-  def jira_request_put(cls, url_path: str, payload: Union[dict, str]) -> str:
+  def jira_request_put(cls, url_path: str, payload: Union[dict, str]) -> Any:
     return cls._send_request("PUT", url_path, payload)
\ No newline at end of file
@@ -0,0 +1,115 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence
+
+from .async_rest import AsyncJiraRESTClient
+from .codec import decode_response
+from .rest import JiraRESTClient
+
+# Only what the tools render; Jira always returns the issue key
+DEFAULT_SEARCH_FIELDS = ("summary",)
+
+
+class JiraIssueSearch:
+  """
+  Paginated JQL search that only pulls the fields callers use.
+
+  Results are produced page by page, so broad queries are never held in
+  memory at once, and stop at a hard cap (`JIRA_SEARCH_MAX_RESULTS`) no matter
+  how many issues match.
+  """
+  SEARCH_PATH = "/rest/api/2/search"
+
+  @staticmethod
+  def _limits(limit: Optional[int]) -> tuple[int, int]:
+    """Return the (page size, hard cap) to use for a search."""
+    JiraRESTClient.get_auth_instance()
+    config = JiraRESTClient._config
+    cap = config.JIRA_SEARCH_MAX_RESULTS
+    if limit is not None:
+      cap = min(cap, limit)
+    return min(config.JIRA_SEARCH_PAGE_SIZE, cap), cap
+
+  @staticmethod
+  def _params(jql: str, fields: Sequence[str], start_at: int, max_results: int) -> Dict[str, Any]:
+    return {
+      'jql': jql,
+      'fields': ','.join(fields),
+      'startAt': start_at,
+      'maxResults': max_results,
+    }
+
+  @staticmethod
+  def _page(response) -> Dict[str, Any]:
+    response.raise_for_status()
+    return decode_response(response)
+
+  @classmethod
+  def iter_pages(
+    cls,
+    jql: str,
+    fields: Sequence[str] = DEFAULT_SEARCH_FIELDS,
+    limit: Optional[int] = None,
+  ) -> Iterator[Dict[str, Any]]:
+    """
+    Yield search result pages until the results or the cap are exhausted.
+
+    Args:
+      jql (str): The JQL query.
+      fields (Sequence[str]): Issue fields to return.
+      limit (Optional[int]): Maximum number of issues, bounded by `JIRA_SEARCH_MAX_RESULTS`.
+
+    Yields:
+      dict: Raw Jira search pages (`issues`, `total`, `startAt`), trimmed to the cap.
+    """
+    page_size, cap = cls._limits(limit)
+    start_at = 0
+    while start_at < cap:
+      page = cls._page(JiraRESTClient.request(
+        "GET", cls.SEARCH_PATH, params=cls._params(jql, fields, start_at, min(page_size, cap - start_at))
+      ))
+      issues = page.get('issues', [])[:cap - start_at]
+      page['issues'] = issues
+      yield page
+      start_at += len(issues)
+      if not issues or start_at >= page.get('total', 0):
+        return
+    logging.info(f"Search capped at {cap} issues for JQL: {jql}")
+
+  @classmethod
+  async def aiter_pages(
+    cls,
+    jql: str,
+    fields: Sequence[str] = DEFAULT_SEARCH_FIELDS,
+    limit: Optional[int] = None,
+  ) -> AsyncIterator[Dict[str, Any]]:
+    """Async variant of `iter_pages`."""
+    page_size, cap = cls._limits(limit)
+    start_at = 0
+    while start_at < cap:
+      page = cls._page(await AsyncJiraRESTClient.request(
+        "GET", cls.SEARCH_PATH, params=cls._params(jql, fields, start_at, min(page_size, cap - start_at))
+      ))
+      issues = page.get('issues', [])[:cap - start_at]
+      page['issues'] = issues
+      yield page
+      start_at += len(issues)
+      if not issues or start_at >= page.get('total', 0):
+        return
+    logging.info(f"Search capped at {cap} issues for JQL: {jql}")
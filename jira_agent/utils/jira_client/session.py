@@ -0,0 +1,85 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import JiraConfig
+
+
+class JiraSession:
+  """
+  Process-wide pooled HTTP session for Jira REST calls.
+
+  A single `requests.Session` is shared by every thread so TCP and TLS
+  connections to the Jira instance are kept alive and reused between tool calls.
+  """
+  _session = None
+  _timeout = None
+  _lock = threading.Lock()
+
+  @staticmethod
+  def mount_pooled_adapter(session: requests.Session, config: JiraConfig) -> requests.Session:
+    """Mount a connection-pooling adapter sized from the JiraConfig on both schemes."""
+    adapter = HTTPAdapter(
+      pool_connections=config.JIRA_HTTP_POOL_CONNECTIONS,
+      pool_maxsize=config.JIRA_HTTP_POOL_MAXSIZE,
+      pool_block=config.JIRA_HTTP_POOL_BLOCK,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+  @staticmethod
+  def timeout_from_config(config: JiraConfig) -> Tuple[float, float]:
+    """Return the (connect, read) timeout tuple for a JiraConfig."""
+    return config.JIRA_HTTP_CONNECT_TIMEOUT, config.JIRA_HTTP_READ_TIMEOUT
+
+  @classmethod
+  def get_session(cls, config: JiraConfig | None = None) -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    if cls._session is None:
+      with cls._lock:
+        if cls._session is None:
+          config = config or JiraConfig()
+          logging.info(
+            f"Creating pooled Jira HTTP session (pool_connections={config.JIRA_HTTP_POOL_CONNECTIONS}, "
+            f"pool_maxsize={config.JIRA_HTTP_POOL_MAXSIZE})"
+          )
+          cls._timeout = cls.timeout_from_config(config)
+          cls._session = cls.mount_pooled_adapter(requests.Session(), config)
+    return cls._session
+
+  @classmethod
+  def get_timeout(cls, config: JiraConfig | None = None) -> Tuple[float, float]:
+    """Return the (connect, read) timeout used with the shared session."""
+    if cls._timeout is None:
+      cls.get_session(config)
+    return cls._timeout
+
+  @classmethod
+  def close(cls):
+    """Close the shared session and drop all pooled connections."""
+    with cls._lock:
+      if cls._session is not None:
+        cls._session.close()
+      cls._session = None
+      cls._timeout = None
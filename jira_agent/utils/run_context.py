@@ -0,0 +1,58 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+_run_state: contextvars.ContextVar[Dict[str, Dict[Any, Any]] | None] = contextvars.ContextVar(
+  "jira_agent_run_state", default=None
+)
+
+
+@contextmanager
+def run_scope() -> Iterator[Dict[str, Dict[Any, Any]]]:
+  """
+  Open a per-run scope for memoizing Jira lookups within a single graph run.
+
+  The scope is carried by a context variable, so tools executed by the graph
+  (in worker threads or asyncio tasks) see the same scope as the run that
+  started them. Nested scopes reuse the outer one.
+  """
+  state = _run_state.get()
+  if state is not None:
+    yield state
+    return
+
+  token = _run_state.set({})
+  try:
+    yield _run_state.get()
+  finally:
+    _run_state.reset(token)
+
+
+def run_cache(namespace: str) -> Dict[Any, Any]:
+  """
+  Return the per-run cache dictionary for `namespace`.
+
+  Outside of a run scope a fresh dictionary is returned, so callers can use
+  the result unconditionally and simply get no reuse.
+  """
+  state = _run_state.get()
+  if state is None:
+    return {}
+  return state.setdefault(namespace, {})
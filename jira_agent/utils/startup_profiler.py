@@ -0,0 +1,116 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+"""
+Startup profiler: reports where the time to import a module goes.
+
+Run it with `python -m jira_agent.utils.startup_profiler [module] [--top N]`,
+or start the server with `JIRA_AGENT_PROFILE_STARTUP=1` to log the report.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+DEFAULT_MODULE = "jira_agent.main"
+
+
+@dataclass
+class ImportEntry:
+  name: str
+  self_seconds: float
+  cumulative_seconds: float
+
+
+@dataclass
+class ImportProfile:
+  module: str
+  entries: List[ImportEntry] = field(default_factory=list)
+
+  @property
+  def total_seconds(self) -> float:
+    """Cumulative import time of the profiled module."""
+    return next((entry.cumulative_seconds for entry in self.entries if entry.name == self.module), 0.0)
+
+  @property
+  def modules(self) -> List[str]:
+    return [entry.name for entry in self.entries]
+
+  def by_package(self) -> Dict[str, float]:
+    """Self import time summed per top-level package, slowest first."""
+    totals: Dict[str, float] = defaultdict(float)
+    for entry in self.entries:
+      totals[entry.name.split(".")[0]] += entry.self_seconds
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+  def report(self, top: int = 15) -> str:
+    lines = [f"Importing {self.module} took {self.total_seconds:.3f}s", "Slowest packages (self time):"]
+    lines += [f"  {seconds:8.3f}s  {package}" for package, seconds in list(self.by_package().items())[:top]]
+    return "\n".join(lines)
+
+
+def parse_importtime(output: str, module: str) -> ImportProfile:
+  """Parse the stderr of `python -X importtime` into an ImportProfile."""
+  profile = ImportProfile(module=module)
+  for line in output.splitlines():
+    if not line.startswith("import time:") or "self [us]" in line:
+      continue
+    self_us, cumulative_us, name = line[len("import time:"):].split("|")
+    profile.entries.append(ImportEntry(name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+  return profile
+
+
+def profile_imports(module: str = DEFAULT_MODULE, env: Optional[Dict[str, str]] = None) -> ImportProfile:
+  """
+  Import `module` in a fresh interpreter and measure every import it triggers.
+
+  Args:
+    module (str): The module to import.
+    env (Optional[Dict[str, str]]): Environment of the interpreter; the current one by default.
+
+  Returns:
+    ImportProfile: Per-module import times.
+
+  Raises:
+    RuntimeError: If the module fails to import.
+  """
+  result = subprocess.run(
+    [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+    capture_output=True,
+    text=True,
+    env=env if env is not None else os.environ.copy(),
+  )
+  if result.returncode != 0:
+    raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+  return parse_importtime(result.stderr, module)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+  parser = argparse.ArgumentParser(description="Report the import-time breakdown of a module.")
+  parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+  parser.add_argument("--top", type=int, default=15, help="number of packages to list")
+  args = parser.parse_args(argv)
+  print(profile_imports(args.module).report(args.top))
+
+
+if __name__ == "__main__":
+  main()
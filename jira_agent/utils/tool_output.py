@@ -0,0 +1,179 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+# Fields each tool passes on to the model; everything else in the payload only inflates the conversation.
+# Tools without an entry keep all fields.
+TOOL_OUTPUT_FIELDS: Dict[str, Tuple[str, ...]] = {
+  "get_jira_issue_details": (
+    "key", "summary", "description", "status", "priority", "reporter", "assignee", "created", "updated",
+  ),
+  "get_jira_transitions": ("id", "name"),
+  "get_jira_project_by_name": ("id", "key", "name", "projectTypeKey", "self"),
+}
+
+# Same approximation as langchain_core's count_tokens_approximately
+CHARS_PER_TOKEN = 4
+
+
+def approximate_tokens(text: str) -> int:
+  return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def tool_output_max_tokens() -> int:
+  """
+  Return the token budget of a single tool output, from `JIRA_AGENT_TOOL_OUTPUT_MAX_TOKENS` (0 disables it).
+  """
+  return int(os.getenv("JIRA_AGENT_TOOL_OUTPUT_MAX_TOKENS", "2000"))
+
+
+def select_fields(tool: str, payload: Any) -> Any:
+  """
+  Keep only the whitelisted fields of a tool payload, dropping empty values.
+
+  Args:
+    tool str: The tool name, a key of `TOOL_OUTPUT_FIELDS`.
+    payload Any: A dict, or a list of dicts, as built by the tool.
+
+  Returns:
+    Any: The reduced payload; other values are returned as given.
+  """
+  if isinstance(payload, list):
+    return [select_fields(tool, item) for item in payload]
+  if not isinstance(payload, dict):
+    return payload
+  fields = TOOL_OUTPUT_FIELDS.get(tool, tuple(payload))
+  return {field: payload[field] for field in fields if payload.get(field) not in (None, "", [], {})}
+
+
+def _serialize(item: Any) -> str:
+  # Strings (e.g. Markdown issue links) go as is, documents as compact JSON
+  if isinstance(item, str):
+    return item
+  return orjson.dumps(item, default=str).decode()
+
+
+def _omitted_note(omitted: int) -> str:
+  return f"... {omitted} more results omitted."
+
+
+def _truncate_text(text: str, budget: int) -> Tuple[str, bool]:
+  max_chars = budget * CHARS_PER_TOKEN
+  if len(text) <= max_chars:
+    return text, False
+  return f"{text[:max_chars]} [... {len(text) - max_chars} characters omitted]", True
+
+
+def _truncate_lines(lines: List[str], budget: int) -> Tuple[List[str], bool]:
+  """Keep whole leading results within the budget, noting how many were left out."""
+  kept, used = [], 0
+  for index, line in enumerate(lines):
+    tokens = approximate_tokens(line) + 1
+    if kept and used + tokens > budget:
+      return kept + [_omitted_note(len(lines) - index)], True
+    if not kept and tokens > budget:
+      # The first result alone is over budget: keep the start of it
+      line, _ = _truncate_text(line, budget)
+      return [line] + ([_omitted_note(len(lines) - 1)] if len(lines) > 1 else []), True
+    kept.append(line)
+    used += tokens
+  return kept, False
+
+
+def encode_tool_output(
+  tool: str,
+  payload: Any,
+  prefix: str = "",
+  footer: Optional[str] = None,
+  max_tokens: Optional[int] = None,
+  baseline: Optional[str] = None,
+) -> str:
+  """
+  Encode a tool payload for the model: whitelisted fields, compact serialization and a token budget.
+
+  A list is encoded one result per line, and results past the budget are replaced by a
+  "N more results omitted" note; any other payload is cut by characters.
+
+  Args:
+    tool str: The tool name, used for the field whitelist and the savings accounting.
+    payload Any: A dict, a list of dicts or strings, or a string.
+    prefix str: Text put before the encoded payload, e.g. a one line summary.
+    footer Optional[str]: Text put after the encoded payload, outside the budget.
+    max_tokens Optional[int]: The token budget; defaults to `tool_output_max_tokens()`, 0 disables it.
+    baseline Optional[str]: The response the tool used to build for the same payload, to account the
+      tokens saved; without it the output is its own baseline.
+
+  Returns:
+    str: The tool response.
+  """
+  budget = tool_output_max_tokens() if max_tokens is None else max_tokens
+  reduced = select_fields(tool, payload)
+  truncated = False
+  if isinstance(reduced, list):
+    lines = [_serialize(item) for item in reduced]
+    if budget:
+      lines, truncated = _truncate_lines(lines, budget)
+    body = "\n".join(lines)
+  else:
+    body = _serialize(reduced)
+    if budget:
+      body, truncated = _truncate_text(body, budget)
+
+  parts = [part for part in (prefix, body, footer) if part]
+  output = "\n".join(parts) if isinstance(reduced, list) else " ".join(parts)
+  tokens_after = approximate_tokens(output)
+  tokens_before = approximate_tokens(baseline) if baseline is not None else tokens_after
+  ToolOutputEncoding.record(tool, tokens_before, tokens_after, truncated)
+  return output
+
+
+class ToolOutputEncoding:
+  """
+  Per-tool accounting of the tokens saved by `encode_tool_output`.
+  """
+  _stats: Dict[str, Dict[str, int]] = {}
+  _lock = threading.Lock()
+
+  @classmethod
+  def record(cls, tool: str, tokens_before: int, tokens_after: int, truncated: bool):
+    with cls._lock:
+      stats = cls._stats.setdefault(tool, {"calls": 0, "tokens_before": 0, "tokens_after": 0, "truncated": 0})
+      stats["calls"] += 1
+      stats["tokens_before"] += tokens_before
+      stats["tokens_after"] += tokens_after
+      stats["truncated"] += int(truncated)
+
+  @classmethod
+  def stats(cls) -> Dict[str, Dict[str, int]]:
+    """
+    Return, per tool, the calls, their approximate tokens as formerly rendered by the tool and as encoded,
+    and how many were truncated.
+    """
+    with cls._lock:
+      return {tool: dict(stats) for tool, stats in cls._stats.items()}
+
+  @classmethod
+  def reset(cls):
+    with cls._lock:
+      cls._stats = {}
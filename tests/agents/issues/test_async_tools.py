@@ -0,0 +1,363 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import os
+import unittest
+from unittest import mock
+
+import httpx
+
+from jira_agent.agents.issues_agent.tools.issues import (
+  ISSUE_DETAIL_FIELDS,
+  _aadd_new_label_to_issue,
+  _aget_account_id_from_email,
+  _aget_jira_issue_details,
+)
+from jira_agent.agents.issues_agent.tools import TOOLS, bulk
+from jira_agent.agents.issues_agent.tools.search import _asearch_jira_issues_using_jql
+from jira_agent.agents.issues_agent.tools.transitions import _aperform_jira_transition
+from jira_agent.agents.issues_agent.tools.workflow import TransitionResolver
+from jira_agent.utils.jira_client.async_rest import AsyncJiraRESTClient
+from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.jira_client.identity import IdentityCache
+from jira_agent.utils.jira_client.project_metadata import ProjectMetadataCache
+from jira_agent.utils.jira_client.resilience import JiraResilience
+from jira_agent.utils.jira_client.rest import JiraRESTClient
+from jira_agent.utils.run_context import run_scope
+
+JIRA_INSTANCE = "https://mock.jira.instance.test"
+
+
+def _bulk_result(output) -> dict:
+  """Parse a bulk tool response: the summary line, then one JSON outcome per line."""
+  summary, *results = output.response.splitlines()
+  return {"summary": summary, "results": [json.loads(result) for result in results]}
+
+
+def _mock_client(handler):
+  return httpx.AsyncClient(base_url=JIRA_INSTANCE, transport=httpx.MockTransport(handler))
+
+
+class TestAsyncIssueTools(unittest.TestCase):
+
+  def setUp(self):
+    patcher = mock.patch.dict(os.environ, {
+      "DRYRUN": "false",
+      "JIRA_INSTANCE": JIRA_INSTANCE,
+      "JIRA_USERNAME": "user@example.com",
+      "JIRA_API_TOKEN": "token",
+    })
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    IdentityCache.reset()
+    self.addCleanup(IdentityCache.reset)
+    TransitionResolver.reset()
+    self.addCleanup(TransitionResolver.reset)
+    ProjectMetadataCache.reset()
+    self.addCleanup(ProjectMetadataCache.reset)
+    JiraResilience.reset()
+    self.addCleanup(JiraResilience.reset)
+    self.requests = []
+
+  def _run(self, handler, coro_factory):
+    async def runner():
+      with mock.patch.object(AsyncJiraRESTClient, "_build_client", lambda: _mock_client(handler)):
+        try:
+          return await coro_factory()
+        finally:
+          await AsyncJiraRESTClient.aclose()
+    return asyncio.run(runner())
+
+  def test_account_id_from_email(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      return httpx.Response(200, json=[{"accountId": "abc-123"}])
+
+    account_id = self._run(handler, lambda: _aget_account_id_from_email("user@example.com"))
+    self.assertEqual(account_id, "abc-123")
+    self.assertEqual(self.requests[0].url.params["query"], "user@example.com")
+
+  def test_perform_transition(self):
+    issue = {
+      "fields": {"project": {"key": "TEST"}, "issuetype": {"id": "1"}, "status": {"id": "10"}},
+      "transitions": [
+        {"id": "31", "name": "Done", "to": {"id": "20"}, "fields": {"resolution": {"required": True}}},
+      ],
+    }
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.method == "GET":
+        return httpx.Response(200, json=issue)
+      return httpx.Response(204)
+
+    result = self._run(handler, lambda: _aperform_jira_transition("TEST-1", "10000", "done"))
+    self.assertIn("successfully", result)
+    self.assertEqual([r.method for r in self.requests], ["GET", "POST"])
+    self.assertEqual(self.requests[0].url.params["expand"], "transitions.fields")
+    post = self.requests[-1]
+    self.assertEqual(
+      json.loads(post.content),
+      {"transition": {"id": "31"}, "fields": {"resolution": {"id": "10000"}}},
+    )
+
+  def test_transitions_are_reused_within_a_run(self):
+    issue = {
+      "fields": {"project": {"key": "TEST"}, "issuetype": {"id": "1"}, "status": {"id": "10"}},
+      "transitions": [
+        {"id": "11", "name": "In Progress", "to": {"id": "10"}, "fields": {}},
+      ],
+    }
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.method == "GET":
+        return httpx.Response(200, json=issue)
+      return httpx.Response(204)
+
+    async def two_transitions():
+      with run_scope():
+        await _aperform_jira_transition("TEST-1", None, "In Progress")
+        return await _aperform_jira_transition("TEST-1", None, "In Progress")
+
+    result = self._run(handler, two_transitions)
+    self.assertIn("successfully", result)
+    self.assertEqual([r.method for r in self.requests], ["GET", "POST", "POST"])
+
+  def test_stale_cached_transition_is_retried(self):
+    issue = {
+      "fields": {"project": {"key": "TEST"}, "issuetype": {"id": "1"}, "status": {"id": "10"}},
+      "transitions": [{"id": "11", "name": "Start", "to": {"id": "10"}, "fields": {}}],
+    }
+    posts = iter([httpx.Response(204), httpx.Response(400, json={"errorMessages": ["invalid"]}), httpx.Response(204)])
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.method == "GET":
+        return httpx.Response(200, json=issue)
+      return next(posts)
+
+    async def two_transitions():
+      with run_scope():
+        await _aperform_jira_transition("TEST-1", None, "Start")
+        return await _aperform_jira_transition("TEST-1", None, "Start")
+
+    result = self._run(handler, two_transitions)
+    self.assertIn("successfully", result)
+    self.assertEqual([r.method for r in self.requests], ["GET", "POST", "POST", "GET", "POST"])
+
+  def test_search_is_paginated_projected_and_capped(self):
+    issues = [{"key": f"TEST-{i}", "fields": {"summary": f"Issue {i}"}} for i in range(10)]
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      start_at = int(request.url.params["startAt"])
+      max_results = int(request.url.params["maxResults"])
+      return httpx.Response(200, json={
+        "startAt": start_at,
+        "total": len(issues),
+        "issues": issues[start_at:start_at + max_results],
+      })
+
+    config = JiraConfig(
+      JIRA_INSTANCE=JIRA_INSTANCE,
+      JIRA_USERNAME="user@example.com",
+      JIRA_API_TOKEN="token",
+      JIRA_SEARCH_PAGE_SIZE=2,
+      JIRA_SEARCH_MAX_RESULTS=3,
+    )
+    with mock.patch.object(JiraRESTClient, "_config", config):
+      links = self._run(handler, lambda: _asearch_jira_issues_using_jql("project=TEST", "user@example.com"))
+
+    self.assertEqual(len(links), 4)
+    self.assertTrue(links[2].startswith("[TEST-2: Issue 2]"))
+    self.assertIn("7 more issues", links[3])
+    self.assertEqual([r.url.params["maxResults"] for r in self.requests], ["2", "1"])
+    self.assertEqual(self.requests[0].url.params["fields"], "summary")
+
+  def _tool(self, name):
+    return next(tool for tool in TOOLS if tool.name == name)
+
+  def test_bulk_create_reports_each_issue(self):
+    createmeta = {"projects": [{"issuetypes": [{"name": "Task", "fields": {}}]}]}
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.url.path.endswith("/createmeta"):
+        return httpx.Response(200, json=createmeta)
+      return httpx.Response(201, json={
+        "issues": [{"key": "TEST-2"}],
+        "errors": [{"failedElementNumber": 0, "elementErrors": {"errors": {"summary": "too long"}}}],
+      })
+
+    tool = self._tool("bulk_create_jira_issues")
+    issues = [
+      {"project_key": "TEST", "summary": "first", "description": "d"},
+      {"project_key": "TEST", "summary": "second", "description": "d"},
+      {"project_key": "TEST", "summary": "third", "description": "d", "issue_type": "Epic"},
+    ]
+    output = self._run(handler, lambda: tool.ainvoke({"issues": issues}))
+    result = _bulk_result(output)
+
+    self.assertEqual(result["summary"], "Create issues: 1 of 3 succeeded")
+    self.assertEqual([r["ok"] for r in result["results"]], [False, True, False])
+    self.assertIn("too long", result["results"][0]["error"])
+    self.assertTrue(result["results"][1]["result"].endswith("/browse/TEST-2"))
+    self.assertIn("Unsupported issue type", result["results"][2]["error"])
+    bulk = [r for r in self.requests if r.url.path.endswith("/issue/bulk")]
+    self.assertEqual(len(json.loads(bulk[0].content)["issueUpdates"]), 2)
+
+  def test_bulk_create_keeps_earlier_chunks_when_a_chunk_is_not_json(self):
+    createmeta = {"projects": [{"issuetypes": [{"name": "Task", "fields": {}}]}]}
+    chunks = iter([
+      httpx.Response(201, json={"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "errors": []}),
+      httpx.Response(502, text="<html>Bad Gateway</html>"),
+    ])
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.url.path.endswith("/createmeta"):
+        return httpx.Response(200, json=createmeta)
+      return next(chunks)
+
+    tool = self._tool("bulk_create_jira_issues")
+    issues = [{"project_key": "TEST", "summary": f"issue {i}", "description": "d"} for i in range(3)]
+    with mock.patch.object(bulk, "BULK_CREATE_CHUNK_SIZE", 2):
+      result = _bulk_result(self._run(handler, lambda: tool.ainvoke({"issues": issues})))
+
+    self.assertEqual(result["summary"], "Create issues: 2 of 3 succeeded")
+    self.assertEqual([r["ok"] for r in result["results"]], [True, True, False])
+    self.assertIn("Status code: 502", result["results"][2]["error"])
+    self.assertIn("Bad Gateway", result["results"][2]["error"])
+
+  def test_bulk_label_fans_out(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.url.path.endswith("TEST-2"):
+        return httpx.Response(404, json={"errorMessages": ["Issue does not exist"]})
+      return httpx.Response(204)
+
+    tool = self._tool("bulk_add_label_to_issues")
+    output = self._run(handler, lambda: tool.ainvoke({"issue_keys": ["TEST-1", "TEST-2", "TEST-3"], "label": "triaged"}))
+    result = _bulk_result(output)
+
+    self.assertEqual(result["summary"], "Add label 'triaged': 2 of 3 succeeded")
+    self.assertEqual(len(self.requests), 3)
+    self.assertEqual(json.loads(self.requests[0].content), {"update": {"labels": [{"add": "triaged"}]}})
+
+  def test_field_update_uses_update_verbs(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      return httpx.Response(204)
+
+    tool = self._tool("update_jira_issues_field")
+    output = self._run(handler, lambda: tool.ainvoke({
+      "issue_keys": ["TEST-1"], "field": "components", "add": ["API"], "remove": ["UI"],
+    }))
+    result = _bulk_result(output)
+
+    self.assertEqual(result["summary"], "Update components: 1 of 1 succeeded")
+    self.assertEqual([r.method for r in self.requests], ["PUT"])
+    self.assertEqual(
+      json.loads(self.requests[0].content),
+      {"update": {"components": [{"add": {"name": "API"}}, {"remove": {"name": "UI"}}]}},
+    )
+
+  def test_watchers_are_added_through_watchers_endpoint(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.url.path.endswith("/user/search"):
+        return httpx.Response(200, json=[{"accountId": "abc-123"}])
+      return httpx.Response(204)
+
+    tool = self._tool("update_jira_issues_field")
+    output = self._run(handler, lambda: tool.ainvoke({
+      "issue_keys": ["TEST-1", "TEST-2"], "field": "watchers", "add": ["user@example.com"],
+    }))
+    result = _bulk_result(output)
+
+    self.assertEqual(result["summary"], "Update watchers: 2 of 2 succeeded")
+    watchers = [r for r in self.requests if r.url.path.endswith("/watchers")]
+    self.assertEqual(len(watchers), 2)
+    self.assertEqual(json.loads(watchers[0].content), "abc-123")
+
+  def test_issue_details_are_projected_and_reused_within_a_run(self):
+    issue = {"key": "TEST-1", "fields": {
+      "summary": "Summary", "description": None, "status": {"name": "Open"}, "priority": {"name": "High"},
+      "reporter": {"displayName": "Reporter"}, "created": "2025-01-01", "updated": "2025-01-02",
+    }}
+
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if request.method == "GET":
+        return httpx.Response(200, json=issue)
+      return httpx.Response(204)
+
+    async def read_update_read():
+      with run_scope():
+        first = await _aget_jira_issue_details("TEST-1")
+        second = await _aget_jira_issue_details("TEST-1")
+        await _aadd_new_label_to_issue("TEST-1", "triaged")
+        third = await _aget_jira_issue_details("TEST-1")
+        return first, second, third
+
+    first, second, third = self._run(handler, read_update_read)
+    self.assertEqual(first, second)
+    self.assertEqual(first, third)
+    self.assertIsNone(first["assignee"])
+    self.assertEqual([r.method for r in self.requests], ["GET", "PUT", "GET"])
+    self.assertEqual(self.requests[0].url.params["fields"], ",".join(ISSUE_DETAIL_FIELDS))
+
+  def test_throttled_request_is_retried_after_retry_after(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      if len(self.requests) == 1:
+        return httpx.Response(429, headers={"Retry-After": "0"})
+      return httpx.Response(200, json=[{"accountId": "abc-123"}])
+
+    account_id = self._run(handler, lambda: _aget_account_id_from_email("user@example.com"))
+    self.assertEqual(account_id, "abc-123")
+    self.assertEqual(len(self.requests), 2)
+    self.assertEqual(JiraResilience.stats()["retries"], 1)
+
+
+  def test_failing_endpoint_fails_fast(self):
+    def handler(request: httpx.Request):
+      self.requests.append(request)
+      return httpx.Response(500)
+
+    async def transition_twice():
+      for _ in range(2):
+        try:
+          await _aperform_jira_transition("TEST-1", "", "Done")
+        except Exception as e:
+          last = e
+      return last
+
+    config = JiraConfig(
+      JIRA_INSTANCE=JIRA_INSTANCE,
+      JIRA_USERNAME="user@example.com",
+      JIRA_API_TOKEN="token",
+      JIRA_HTTP_MAX_RETRIES=0,
+      JIRA_CIRCUIT_FAILURE_THRESHOLD=1,
+    )
+    with mock.patch.object(JiraRESTClient, "_config", config):
+      error = self._run(handler, transition_twice)
+    self.assertEqual(len(self.requests), 1)
+    self.assertIn("failing", str(error))
+    self.assertEqual(JiraResilience.stats()["circuit_breakers"]["issue"]["state"], "open")
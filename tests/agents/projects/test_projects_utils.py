@@ -16,7 +16,13 @@
 
 import unittest
 
-from jira_agent.agents.projects_agent.tools.utils import is_valid_email
+from jira_agent.agents.projects_agent.models import GetJiraProjectByNameInput
+from jira_agent.agents.projects_agent.tools.utils import (
+    _get_jira_project_by_name_response,
+    _parse_account_id_from_groupuserpicker,
+    _project_url_response,
+    is_valid_email,
+)
 
 
 class TestProjectsUtils(unittest.TestCase):
@@ -32,3 +38,27 @@ class TestProjectsUtils(unittest.TestCase):
         self.assertFalse(is_valid_email("username@.com"))
         self.assertFalse(is_valid_email("username@.com."))
         self.assertFalse(is_valid_email("username@com"))
+
+    def test_project_by_name_response_uses_parsed_body(self):
+        body = {"total": 1, "values": [{"key": "TEST", "self": "https://jira/rest/api/3/project/1"}]}
+        output = _get_jira_project_by_name_response(GetJiraProjectByNameInput(name="Test"), body)
+        self.assertTrue(output.response.startswith("https://jira/rest/api/3/project/1, {"))
+
+    def test_project_by_name_response_only_keeps_project_summary(self):
+        body = {"total": 1, "values": [{
+            "key": "TEST", "name": "Test", "self": "https://jira/rest/api/3/project/1",
+            "avatarUrls": {"48x48": "https://jira/avatar"}, "insight": {"totalIssueCount": 3},
+        }]}
+        output = _get_jira_project_by_name_response(GetJiraProjectByNameInput(name="Test"), body)
+        self.assertIn('"key":"TEST"', output.response)
+        self.assertNotIn("avatar", output.response)
+
+    def test_error_body_is_reported(self):
+        output = _project_url_response({"error": "Unexpected failure", "exception": "boom"})
+        self.assertIn("boom", output.response)
+
+    def test_groupuserpicker_parsing(self):
+        body = {"users": {"total": 1, "users": [{"accountId": "abc-123"}]}}
+        self.assertEqual(_parse_account_id_from_groupuserpicker("user@example.com", body), "abc-123")
+        with self.assertRaises(Exception):
+            _parse_account_id_from_groupuserpicker("user@example.com", {"error": "x", "exception": "boom"})
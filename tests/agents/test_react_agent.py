@@ -0,0 +1,108 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+
+from jira_agent.agents.issues_agent.models import LLMResponseOutput
+from jira_agent.common.react_agent import (
+  FINAL_ANSWER_TOOL,
+  create_jira_react_agent,
+  structured_response_from_messages,
+)
+
+
+class _FakeToolModel(FakeMessagesListChatModel):
+  calls: int = 0
+
+  def bind_tools(self, tools, **kwargs):
+    return self
+
+  def _generate(self, *args, **kwargs):
+    self.calls += 1
+    return super()._generate(*args, **kwargs)
+
+  def with_structured_output(self, schema, **kwargs):
+    raise AssertionError("The structured response should not need an LLM call")
+
+
+@tool
+def get_issue(issue_key: str) -> LLMResponseOutput:
+  """Get a Jira issue."""
+  return LLMResponseOutput(response=f"{issue_key} is open")
+
+
+class TestStructuredResponse(unittest.TestCase):
+
+  def test_final_answer_fills_a_text_schema(self):
+    response = structured_response_from_messages([HumanMessage("hi"), AIMessage("PROJ-1 is open")], LLMResponseOutput)
+    self.assertEqual(response, LLMResponseOutput(response="PROJ-1 is open"))
+
+  def test_tool_output_is_reused(self):
+    messages = [ToolMessage("PROJ-1 is open", name=FINAL_ANSWER_TOOL, tool_call_id="1")]
+    self.assertEqual(structured_response_from_messages(messages, LLMResponseOutput).response, "PROJ-1 is open")
+
+  def test_pending_tool_calls_need_the_model(self):
+    messages = [AIMessage("", tool_calls=[{"name": "get_issue", "args": {}, "id": "1"}])]
+    self.assertIsNone(structured_response_from_messages(messages, LLMResponseOutput))
+
+
+class TestCreateJiraReactAgent(unittest.TestCase):
+
+  def _agent(self, mode, answer=AIMessage("PROJ-1 is open")):
+    model = _FakeToolModel(responses=[
+      AIMessage("", tool_calls=[{"name": "get_issue", "args": {"issue_key": "PROJ-1"}, "id": "1"}]),
+      answer,
+    ])
+    env = {"JIRA_AGENT_RESPONSE_FINALIZATION": mode, "JIRA_AGENT_SUPERVISOR_ROUTING": "direct"}
+    with mock.patch.dict(os.environ, env), \
+        mock.patch("jira_agent.common.react_agent.get_llm", return_value=model):
+      return model, create_jira_react_agent("jira_issues_agent", [get_issue], "prompt", LLMResponseOutput)
+
+  def test_auto_mode_skips_the_structured_output_call(self):
+    model, agent = self._agent("auto")
+    result = asyncio.run(agent.ainvoke({"messages": [HumanMessage("status of PROJ-1?")]}))
+
+    self.assertEqual(agent.name, "jira_issues_agent")
+    self.assertEqual(result["structured_response"], LLMResponseOutput(response="PROJ-1 is open"))
+    self.assertEqual(result["messages"][-1].content, "PROJ-1 is open")
+    self.assertEqual(model.calls, 2)
+
+  def test_final_answer_tool_output_is_reused(self):
+    answer = AIMessage("", tool_calls=[{"name": FINAL_ANSWER_TOOL, "args": {"answer": "PROJ-1 is open"}, "id": "2"}])
+    model, agent = self._agent("auto", answer)
+    result = asyncio.run(agent.ainvoke({"messages": [HumanMessage("status of PROJ-1?")]}))
+
+    # The tool node ran both tools; the run ended on the final answer tool
+    self.assertEqual([m.name for m in result["messages"] if isinstance(m, ToolMessage)], ["get_issue", FINAL_ANSWER_TOOL])
+    self.assertEqual(result["structured_response"], LLMResponseOutput(response="PROJ-1 is open"))
+    self.assertEqual(model.calls, 2)
+
+  def test_none_mode_has_no_structured_response(self):
+    _, agent = self._agent("none")
+    result = agent.invoke({"messages": [HumanMessage("status of PROJ-1?")]})
+    self.assertNotIn("structured_response", result)
+
+  def test_unknown_mode(self):
+    with self.assertRaises(ValueError):
+      self._agent("sometimes")
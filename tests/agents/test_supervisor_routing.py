@@ -0,0 +1,99 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from jira_agent.agents.issues_agent.models import LLMResponseOutput
+from jira_agent.agents.supervisor_agent.supervisor_agent import SupervisorAgent
+from jira_agent.common.react_agent import FINAL_ANSWER_TOOL, create_jira_react_agent
+
+
+class _FakeToolModel(FakeMessagesListChatModel):
+  calls: int = 0
+
+  def bind_tools(self, tools, **kwargs):
+    return self
+
+  def _generate(self, *args, **kwargs):
+    self.calls += 1
+    return super()._generate(*args, **kwargs)
+
+
+def _tool_call(name: str, **args) -> AIMessage:
+  return AIMessage("", tool_calls=[{"name": name, "args": args, "id": f"call-{name}"}])
+
+
+@tool
+def get_issue(issue_key: str) -> LLMResponseOutput:
+  """Get a Jira issue."""
+  return LLMResponseOutput(response=f"{issue_key} is open")
+
+
+class TestDirectReturnRouting(unittest.TestCase):
+
+  def _run(self, agent_responses, intent_routing="none"):
+    supervisor_model = _FakeToolModel(responses=[
+      _tool_call("transfer_to_jira_issues_agent"),
+      AIMessage("PROJ-1 is open, as the issues agent said"),
+    ])
+    agent_model = _FakeToolModel(responses=agent_responses)
+    with mock.patch.dict(os.environ, {"JIRA_AGENT_SUPERVISOR_ROUTING": "direct", "JIRA_AGENT_INTENT_ROUTING": intent_routing}), \
+        mock.patch("jira_agent.common.react_agent.get_llm", return_value=agent_model), \
+        mock.patch("jira_agent.agents.supervisor_agent.supervisor_agent.get_llm", return_value=supervisor_model):
+      supervisor = object.__new__(SupervisorAgent)
+      supervisor.name, supervisor.prompt = "jira_supervisor", "prompt"
+      supervisor.agents = [create_jira_react_agent("jira_issues_agent", [get_issue], "prompt", LLMResponseOutput)]
+      graph = supervisor.agent().compile()
+    result = asyncio.run(graph.ainvoke({"messages": [HumanMessage("status of PROJ-1?")]}))
+    return result["messages"], supervisor_model.calls
+
+  def test_final_answers_skip_the_supervisor(self):
+    messages, supervisor_calls = self._run([
+      _tool_call("get_issue", issue_key="PROJ-1"),
+      _tool_call(FINAL_ANSWER_TOOL, answer="PROJ-1 is open"),
+    ])
+
+    self.assertEqual(supervisor_calls, 1)
+    self.assertEqual(messages[-1].content, "PROJ-1 is open")
+    self.assertEqual(messages[-1].name, "jira_issues_agent")
+
+  def test_other_answers_go_back_to_the_supervisor(self):
+    messages, supervisor_calls = self._run([
+      _tool_call("get_issue", issue_key="PROJ-1"),
+      AIMessage("PROJ-1 is open"),
+    ])
+
+    self.assertEqual(supervisor_calls, 2)
+    self.assertEqual(messages[-1].content, "PROJ-1 is open, as the issues agent said")
+
+  def test_obvious_requests_skip_the_supervisor_entirely(self):
+    messages, supervisor_calls = self._run([
+      _tool_call("get_issue", issue_key="PROJ-1"),
+      _tool_call(FINAL_ANSWER_TOOL, answer="PROJ-1 is open"),
+    ], intent_routing="rules")
+
+    self.assertEqual(supervisor_calls, 0)
+    self.assertEqual(messages[1].tool_calls[0]["name"], "transfer_to_jira_issues_agent")
+    self.assertEqual(messages[2].content, "Successfully transferred to jira_issues_agent")
+    self.assertEqual(messages[-1].content, "PROJ-1 is open")
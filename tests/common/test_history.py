@@ -0,0 +1,88 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from jira_agent.common.history import HistoryCompaction, compact_messages, compacting_prompt
+
+
+def _tool_call(name: str, call_id: str) -> AIMessage:
+  return AIMessage("", tool_calls=[{"name": name, "args": {}, "id": call_id}])
+
+
+def _conversation() -> list:
+  return [
+    HumanMessage("find project Alpha and create a bug in it"),
+    _tool_call("transfer_to_jira_projects_agent", "h1"),
+    ToolMessage("Successfully transferred to jira_projects_agent", name="transfer_to_jira_projects_agent", tool_call_id="h1"),
+    _tool_call("get_jira_project_by_name", "t1"),
+    ToolMessage("x" * 2000, name="get_jira_project_by_name", tool_call_id="t1"),
+    AIMessage("Alpha has the key ALPHA"),
+    _tool_call("transfer_to_jira_issues_agent", "h2"),
+    ToolMessage("Successfully transferred to jira_issues_agent", name="transfer_to_jira_issues_agent", tool_call_id="h2"),
+    _tool_call("create_jira_issue", "t2"),
+    ToolMessage("y" * 2000, name="create_jira_issue", tool_call_id="t2"),
+  ]
+
+
+class TestCompactMessages(unittest.TestCase):
+
+  def test_last_message_keeps_user_messages_and_answers(self):
+    messages = _conversation()
+    compacted = compact_messages(messages, "last_message")
+    # The issues agent's running tool loop is left as is
+    self.assertEqual(compacted, [messages[0], messages[5]] + messages[8:])
+
+  def test_summarize_cuts_earlier_tool_results_only(self):
+    messages = _conversation()
+    compacted = compact_messages(messages, "summarize", summary_chars=100)
+
+    self.assertEqual(len(compacted), len(messages))
+    self.assertIn("[... 1900 characters omitted]", compacted[4].content)
+    self.assertEqual(compacted[-1].content, "y" * 2000)
+
+  def test_budget_drops_whole_tool_exchanges(self):
+    messages = _conversation()
+    compacted = compact_messages(messages, "budget", token_budget=700, summary_chars=2000, keep_current_turn=False)
+
+    self.assertIn(messages[0], compacted)
+    self.assertNotIn(messages[4], compacted)
+    # No tool result is left without the call that produced it
+    for index, message in enumerate(compacted):
+      if isinstance(message, ToolMessage):
+        self.assertTrue(isinstance(compacted[index - 1], (AIMessage, ToolMessage)))
+
+  def test_supervisor_compacts_everything(self):
+    compacted = compact_messages(_conversation(), "last_message", keep_current_turn=False)
+    self.assertEqual([m.content for m in compacted], ["find project Alpha and create a bug in it", "Alpha has the key ALPHA"])
+
+
+class TestCompactingPrompt(unittest.TestCase):
+
+  def setUp(self):
+    HistoryCompaction.reset()
+
+  def test_prompt_records_tokens_per_mode(self):
+    prompt = compacting_prompt("You are a Jira agent.", keep_current_turn=False)
+    model_input = prompt({"messages": _conversation()})
+
+    self.assertIsInstance(model_input[0], SystemMessage)
+    stats = HistoryCompaction.stats()["summarize"]
+    self.assertEqual(stats["calls"], 1)
+    self.assertLess(stats["tokens_after"], stats["tokens_before"])
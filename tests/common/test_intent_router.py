@@ -0,0 +1,101 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from jira_agent.common.intent_router import (
+  ISSUES_AGENT,
+  PROJECTS_AGENT,
+  IntentRouting,
+  TfidfClassifier,
+  build_intent_router,
+  load_dataset,
+  rule_route,
+  training_examples,
+  trajectory_agents,
+)
+
+STRICT_MATCH_DATASET = Path(__file__).resolve().parents[2] / "eval" / "strict_match" / "strict_match_dataset.yaml"
+
+
+class TestIntentRouter(unittest.TestCase):
+  def setUp(self):
+    IntentRouting.reset()
+
+  def test_rules(self):
+    self.assertEqual(rule_route("transition ABC-123 to Done")[0], ISSUES_AGENT)
+    self.assertEqual(rule_route("process this JQL: project = MOT")[0], ISSUES_AGENT)
+    self.assertEqual(rule_route("update lead for project Foo to user a@b.com")[0], PROJECTS_AGENT)
+    self.assertEqual(rule_route("create a new project for my venture Foo")[0], PROJECTS_AGENT)
+    self.assertEqual(rule_route("create a bug in project MOT")[0], ISSUES_AGENT)
+
+  def test_requests_for_both_agents_are_left_to_the_supervisor(self):
+    self.assertEqual(rule_route("create a project Foo and then open a bug in it"), (None, 0.0))
+    router = build_intent_router("rules")
+    self.assertIsNone(router.route("create a project Foo and then open a bug in it"))
+    self.assertEqual(IntentRouting.stats(), {"supervisor": {"jira_supervisor": 1}})
+
+  def test_trajectory_agents(self):
+    self.assertEqual(trajectory_agents("__start__;jira_supervisor;jira_issues_agent:agent"), [ISSUES_AGENT])
+    self.assertEqual(
+      trajectory_agents("jira_issues_agent;jira_projects_agent:__start__"), [ISSUES_AGENT, PROJECTS_AGENT]
+    )
+
+  def test_dataset_is_labelled(self):
+    examples = load_dataset(STRICT_MATCH_DATASET)
+    self.assertTrue(examples)
+    self.assertTrue(all(agents for _, agents in examples))
+
+  def test_classifier_is_trained_on_the_seed_prompts_only(self):
+    texts, labels = training_examples()
+    self.assertEqual(set(labels), {ISSUES_AGENT, PROJECTS_AGENT})
+    # The evaluation prompts stay out of the shipped training set
+    self.assertFalse(set(texts) & {prompt for prompt, _ in load_dataset(STRICT_MATCH_DATASET)})
+
+    with_dataset, _ = training_examples(STRICT_MATCH_DATASET)
+    self.assertGreater(len(with_dataset), len(texts))
+
+  def test_classifier_separates_the_agents(self):
+    classifier = TfidfClassifier().fit(
+      ["list my open tickets", "show the bugs assigned to me", "update the project lead", "describe the project"],
+      [ISSUES_AGENT, ISSUES_AGENT, PROJECTS_AGENT, PROJECTS_AGENT],
+    )
+    self.assertEqual(classifier.predict("list the bugs")[0], ISSUES_AGENT)
+    self.assertEqual(classifier.predict("who is the project lead")[0], PROJECTS_AGENT)
+
+  def test_hybrid_routes_with_the_classifier_above_the_threshold(self):
+    with mock.patch.dict(os.environ, {"JIRA_AGENT_INTENT_ROUTING_THRESHOLD": "0.5"}):
+      router = build_intent_router("hybrid")
+    self.assertIsNotNone(router.classifier)
+    self.assertEqual(router.decide("show open work for me in MOT"), (ISSUES_AGENT, "classifier"))
+
+  def test_none_disables_routing(self):
+    self.assertIsNone(build_intent_router("none"))
+    with mock.patch.dict(os.environ):
+      os.environ.pop("JIRA_AGENT_INTENT_ROUTING", None)
+      self.assertIsNone(build_intent_router())
+    with mock.patch.dict(os.environ, {"JIRA_AGENT_INTENT_ROUTING": "always"}):
+      with self.assertRaises(ValueError):
+        build_intent_router()
+
+
+if __name__ == "__main__":
+  unittest.main()
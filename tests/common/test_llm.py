@@ -0,0 +1,111 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+import openai
+
+from jira_agent.common import llm
+from jira_agent.common.llm import LoopPooledAsyncClient
+
+COMPLETION = {
+  "id": "chatcmpl-1",
+  "object": "chat.completion",
+  "created": 0,
+  "model": "gpt-4o",
+  "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+}
+
+
+class TestLLMRegistry(unittest.TestCase):
+
+  def setUp(self):
+    patcher = mock.patch.dict(llm._llms, clear=True)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_llm_is_built_once_per_provider(self):
+    factories = []
+
+    def factory(provider):
+      factories.append(mock.Mock(provider=provider, get_llm=mock.Mock(side_effect=lambda **kwargs: object())))
+      return factories[-1]
+
+    models = []
+    with mock.patch.object(llm, "LLMFactory", factory), mock.patch.dict(os.environ, {"LLM_PROVIDER": "openai"}):
+      threads = [threading.Thread(target=lambda: models.append(llm.get_llm())) for _ in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+      anthropic = llm._build_llm("anthropic")
+
+    self.assertEqual(len({id(model) for model in models}), 1)
+    self.assertIsNot(anthropic, models[0])
+    self.assertEqual([factory.provider for factory in factories], ["openai", "anthropic"])
+    # Only the providers built on httpx get the pooled clients
+    self.assertEqual(set(factories[0].get_llm.call_args.kwargs), {"http_client", "http_async_client"})
+    self.assertEqual(factories[1].get_llm.call_args.kwargs, {})
+
+  def test_httpx_providers_get_pooled_clients(self):
+    with mock.patch.dict(os.environ, {"LLM_HTTP_POOL_MAXSIZE": "4"}):
+      kwargs = llm._http_client_kwargs("openai")
+    self.assertIsInstance(kwargs["http_client"], httpx.Client)
+    self.assertIsInstance(kwargs["http_async_client"], LoopPooledAsyncClient)
+    self.assertEqual(kwargs["http_async_client"]._client_kwargs["limits"].max_connections, 4)
+    self.assertEqual(llm._http_client_kwargs("anthropic"), {})
+
+
+class TestLoopPooledAsyncClient(unittest.TestCase):
+
+  def test_each_event_loop_gets_its_own_pool(self):
+    requests = []
+
+    def handler(request: httpx.Request):
+      requests.append(request)
+      return httpx.Response(200, json=COMPLETION)
+
+    http_client = LoopPooledAsyncClient(transport=httpx.MockTransport(handler))
+    sdk = openai.AsyncOpenAI(api_key="key", base_url="http://llm.test/v1", http_client=http_client)
+
+    async def complete():
+      first = await sdk.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "hello"}])
+      second = await sdk.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "again"}])
+      client = http_client.get_client()
+      await http_client.aclose()
+      return first.choices[0].message.content, second.choices[0].message.content, client
+
+    # The same SDK client serves several event loops, e.g. one per asyncio.run
+    first_loop = asyncio.run(complete())
+    second_loop = asyncio.run(complete())
+
+    self.assertEqual(first_loop[:2], ("hi", "hi"))
+    self.assertEqual(second_loop[:2], ("hi", "hi"))
+    self.assertIsNot(first_loop[2], second_loop[2])
+    self.assertTrue(first_loop[2].is_closed)
+    self.assertEqual(len(requests), 4)
+    self.assertEqual(len(http_client._clients), 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
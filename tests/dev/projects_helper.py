@@ -14,24 +14,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import requests
 import json
 
 from jira_agent.utils.jira_client.rest import JiraRESTClient
 
 
 def get_project_by_key(project_key: str):
-    jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
-    url = f"{jira_server_url}/rest/api/3/project/{project_key}"
-    response = requests.get(url, headers=headers, auth=auth)
-    return response
+    return JiraRESTClient.request("GET", f"/rest/api/3/project/{project_key}")
 
 
 def project_update_description(project_key: str, description: str):
-    jira_server_url, auth, headers = JiraRESTClient.get_auth_instance()
-    url = f"{jira_server_url}/rest/api/3/project/{project_key}"
     payload = json.dumps({
         "description": description,
     })
-    response = requests.put(url=url, data=payload, headers=headers, auth=auth)
-    return response
+    return JiraRESTClient.request("PUT", f"/rest/api/3/project/{project_key}", payload)
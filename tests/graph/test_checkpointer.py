@@ -0,0 +1,118 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import operator
+import unittest
+from typing import Annotated, List, TypedDict
+
+from langgraph.graph import END, START, StateGraph
+
+from jira_agent.graph.checkpointer import BoundedMemorySaver, SQLiteSaver, build_checkpointer, checkpointer_stats
+
+
+class _State(TypedDict):
+  messages: Annotated[List[str], operator.add]
+
+
+def _echo(state: _State) -> dict:
+  return {"messages": [f"echo {state['messages'][-1]}"]}
+
+
+def _compile(checkpointer):
+  builder = StateGraph(_State)
+  builder.add_node("echo", _echo)
+  builder.add_edge(START, "echo")
+  builder.add_edge("echo", END)
+  return builder.compile(checkpointer=checkpointer)
+
+
+def _thread(thread_id: str) -> dict:
+  return {"configurable": {"thread_id": thread_id}}
+
+
+class TestBoundedMemorySaver(unittest.TestCase):
+
+  def test_least_recently_used_threads_are_evicted(self):
+    saver = BoundedMemorySaver(max_threads=2)
+    graph = _compile(saver)
+    for thread_id in ("a", "b"):
+      graph.invoke({"messages": ["hi"]}, _thread(thread_id))
+    # Reading "a" makes "b" the least recently used thread
+    graph.get_state(_thread("a"))
+    graph.invoke({"messages": ["hi"]}, _thread("c"))
+
+    self.assertEqual(set(saver.storage), {"a", "c"})
+    self.assertFalse(any(key[0] == "b" for key in saver.blobs))
+    self.assertFalse(any(key[0] == "b" for key in saver.writes))
+    stats = saver.stats()
+    self.assertEqual((stats["threads"], stats["evictions"]), (2, 1))
+    self.assertGreater(stats["resident_bytes"], 0)
+
+  def test_idle_threads_expire(self):
+    saver = BoundedMemorySaver(max_threads=10, ttl_seconds=0)
+    graph = _compile(saver)
+    graph.invoke({"messages": ["hi"]}, _thread("a"))
+    graph.invoke({"messages": ["hi"]}, _thread("b"))
+
+    self.assertNotIn("a", saver.storage)
+
+  def test_deleted_threads_release_their_bytes(self):
+    saver = BoundedMemorySaver()
+    asyncio.run(_compile(saver).ainvoke({"messages": ["hi"]}, _thread("a")))
+    saver.delete_thread("a")
+
+    self.assertEqual((saver.stats()["threads"], saver.stats()["resident_bytes"]), (0, 0))
+    self.assertEqual((len(saver.blobs), len(saver.writes)), (0, 0))
+
+
+class TestSQLiteSaver(unittest.TestCase):
+
+  def test_threads_resume_from_the_database(self):
+    saver = SQLiteSaver(":memory:")
+    graph = _compile(saver)
+    graph.invoke({"messages": ["one"]}, _thread("a"))
+    result = asyncio.run(graph.ainvoke({"messages": ["two"]}, _thread("a")))
+
+    self.assertEqual(result["messages"], ["one", "echo one", "two", "echo two"])
+    self.assertEqual(len(list(graph.get_state_history(_thread("a")))), len(list(saver.list(_thread("a")))))
+    self.assertEqual(len(list(saver.list(_thread("a"), limit=2))), 2)
+    self.assertEqual(saver.stats()["threads"], 1)
+
+    saver.delete_thread("a")
+    self.assertIsNone(saver.get_tuple(_thread("a")))
+
+
+  def test_writes_are_batched_until_flushed_or_read(self):
+    saver = SQLiteSaver(":memory:", batch_size=1000)
+    _compile(saver).invoke({"messages": ["one"]}, _thread("a"))
+
+    self.assertTrue(saver._pending_checkpoints)
+    self.assertEqual(saver._conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0], 0)
+    self.assertIsNotNone(saver.get_tuple(_thread("a")))
+    self.assertEqual(saver._pending_checkpoints, [])
+
+
+class TestBuildCheckpointer(unittest.TestCase):
+
+  def test_modes(self):
+    self.assertIsNone(build_checkpointer("none"))
+    self.assertEqual(checkpointer_stats(None)["mode"], "none")
+    self.assertIsInstance(build_checkpointer("memory", max_threads=4), BoundedMemorySaver)
+    self.assertIsInstance(build_checkpointer("sqlite", sqlite_path=":memory:"), SQLiteSaver)
+    with self.assertRaises(ValueError):
+      build_checkpointer("redis")
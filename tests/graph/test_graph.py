@@ -0,0 +1,52 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import threading
+import unittest
+from unittest import mock
+
+from jira_agent.graph import graph as graph_module
+from jira_agent.graph.graph import JiraGraph
+
+
+class TestJiraGraphInstance(unittest.TestCase):
+
+  def test_graph_is_built_once_per_process(self):
+    builds = []
+    instances = []
+
+    def build_graph(graph):
+      builds.append(graph)
+      return object()
+
+    with mock.patch.object(JiraGraph, "_instance", None), \
+        mock.patch.object(JiraGraph, "build_graph", build_graph), \
+        mock.patch.object(graph_module, "_init_jira_config", return_value=None):
+      threads = [threading.Thread(target=lambda: instances.append(JiraGraph.get_instance())) for _ in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+
+    self.assertEqual(len(builds), 1)
+    self.assertEqual({id(instance) for instance in instances}, {id(builds[0])})
+    self.assertIs(instances[0].get_graph(), instances[-1].graph)
+
+
+if __name__ == "__main__":
+  unittest.main()
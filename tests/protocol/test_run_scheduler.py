@@ -0,0 +1,191 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import unittest
+
+from jira_agent.models.models import MultitaskStrategy, Status
+from jira_agent.protocol.ap.api.scheduler import (
+  RunNotFound,
+  RunQueueFull,
+  RunRecord,
+  RunScheduler,
+  ThreadBusy,
+)
+
+
+class TestRunScheduler(unittest.TestCase):
+
+  def _run(self, scenario, workers=1, max_queued=4, history_size=100):
+    async def runner():
+      self.started = []
+      self.release = asyncio.Event()
+
+      async def executor(query):
+        self.started.append(query)
+        await self.release.wait()
+        return query.upper()
+
+      scheduler = RunScheduler(executor, workers=workers, max_queued=max_queued, history_size=history_size)
+      try:
+        return await scenario(scheduler)
+      finally:
+        await scheduler.stop()
+    return asyncio.run(runner())
+
+  def test_run_completes(self):
+    async def scenario(scheduler):
+      record = scheduler.submit(RunRecord(query="list issues", thread_id="t1"))
+      self.release.set()
+      finished = await scheduler.wait(record.run_id)
+      return finished
+
+    record = self._run(scenario)
+    self.assertEqual(record.status, Status.success)
+    self.assertEqual(record.output, "LIST ISSUES")
+    self.assertEqual(record.to_dict()["status"], "success")
+
+  def test_reject_busy_thread(self):
+    async def scenario(scheduler):
+      scheduler.submit(RunRecord(query="a", thread_id="t1"))
+      with self.assertRaises(ThreadBusy):
+        scheduler.submit(RunRecord(query="b", thread_id="t1"))
+      # Other threads are unaffected
+      scheduler.submit(RunRecord(query="c", thread_id="t2"))
+
+    self._run(scenario)
+
+  def test_enqueue_runs_in_order(self):
+    async def scenario(scheduler):
+      first = scheduler.submit(RunRecord(query="a", thread_id="t1"))
+      second = scheduler.submit(
+        RunRecord(query="b", thread_id="t1", multitask_strategy=MultitaskStrategy.enqueue)
+      )
+      await asyncio.sleep(0.01)
+      self.assertEqual(self.started, ["a"])
+      self.release.set()
+      await scheduler.wait(second.run_id)
+      return first, second
+
+    first, second = self._run(scenario, workers=2)
+    self.assertEqual(self.started, ["a", "b"])
+    self.assertEqual(first.status, Status.success)
+    self.assertEqual(second.status, Status.success)
+
+  def test_interrupt_cancels_active_run(self):
+    async def scenario(scheduler):
+      first = scheduler.submit(RunRecord(query="a", thread_id="t1"))
+      await asyncio.sleep(0.01)
+      second = scheduler.submit(
+        RunRecord(query="b", thread_id="t1", multitask_strategy=MultitaskStrategy.interrupt)
+      )
+      self.release.set()
+      await scheduler.wait(second.run_id)
+      return first, second
+
+    first, second = self._run(scenario)
+    self.assertEqual(first.status, Status.interrupted)
+    self.assertEqual(second.status, Status.success)
+
+  def test_rollback_undoes_the_interrupted_run_before_the_next_starts(self):
+    async def scenario(scheduler):
+      events = []
+
+      async def rollback():
+        events.append(("rollback", list(self.started)))
+
+      first = scheduler.submit(RunRecord(query="a", thread_id="t1", rollback=rollback))
+      await asyncio.sleep(0.01)
+      second = scheduler.submit(
+        RunRecord(query="b", thread_id="t1", multitask_strategy=MultitaskStrategy.rollback)
+      )
+      self.release.set()
+      await scheduler.wait(second.run_id)
+      return first, second, events, scheduler
+
+    first, second, events, scheduler = self._run(scenario)
+    self.assertEqual(first.status, Status.interrupted)
+    self.assertEqual(second.status, Status.success)
+    # The rollback ran once, after the first run started and before the second
+    self.assertEqual(events, [("rollback", ["a"])])
+    self.assertEqual(self.started, ["a", "b"])
+    with self.assertRaises(RunNotFound):
+      scheduler.get(first.run_id)
+
+  def test_interrupted_runs_call_their_webhook(self):
+    async def scenario(scheduler):
+      called = []
+
+      async def call_webhook(record):
+        called.append((record.query, record.status))
+
+      scheduler._call_webhook = call_webhook
+      hook = "http://example.com/hook"
+      scheduler.submit(RunRecord(query="a", thread_id="t1", webhook=hook))
+      await asyncio.sleep(0.01)
+      queued = scheduler.submit(
+        RunRecord(query="b", thread_id="t1", webhook=hook, multitask_strategy=MultitaskStrategy.enqueue)
+      )
+      scheduler.cancel(queued.run_id)
+      last = scheduler.submit(
+        RunRecord(query="c", thread_id="t1", webhook=hook, multitask_strategy=MultitaskStrategy.interrupt)
+      )
+      await asyncio.sleep(0.01)
+      # Stopping the scheduler interrupts the last run without calling back
+      await scheduler.stop()
+      return called, last
+
+    called, last = self._run(scenario)
+    self.assertCountEqual(called, [("a", Status.interrupted), ("b", Status.interrupted)])
+    self.assertEqual(last.status, Status.interrupted)
+
+  def test_stop_cancels_workers_with_an_active_run(self):
+    async def scenario(scheduler):
+      record = scheduler.submit(RunRecord(query="a", thread_id="t1"))
+      await asyncio.sleep(0.01)
+      await asyncio.wait_for(scheduler.stop(), timeout=1)
+      return record, scheduler
+
+    record, scheduler = self._run(scenario)
+    self.assertEqual(record.status, Status.interrupted)
+    self.assertEqual(scheduler.stats()["workers"], 0)
+
+  def test_queue_is_bounded(self):
+    async def scenario(scheduler):
+      for i in range(3):
+        scheduler.submit(RunRecord(query=str(i), thread_id=f"t{i}"))
+      with self.assertRaises(RunQueueFull):
+        scheduler.submit(RunRecord(query="overflow", thread_id="t9"))
+
+    self._run(scenario, workers=1, max_queued=2)
+
+  def test_cancel_pending_run(self):
+    async def scenario(scheduler):
+      scheduler.submit(RunRecord(query="a", thread_id="t1"))
+      queued = scheduler.submit(RunRecord(query="b", thread_id="t2"))
+      scheduler.cancel(queued.run_id)
+      self.release.set()
+      await asyncio.sleep(0.01)
+      return queued
+
+    record = self._run(scenario)
+    self.assertEqual(record.status, Status.interrupted)
+    self.assertNotIn("b", self.started)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,195 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+import orjson
+from fastapi import HTTPException
+from sse_starlette.sse import AppStatus
+
+from jira_agent.graph.graph import JiraGraph
+from jira_agent.main import create_app
+from jira_agent.models.models import RunCreateStateless, Status
+from jira_agent.protocol.ap.api.routes import stateless_runs
+
+
+class _FakeGraph:
+  """Stands in for the Jira graph: answers in upper case, optionally held back by a gate."""
+
+  def __init__(self, chunks=(), error=None, gate=None):
+    self.chunks = chunks
+    self.error = error
+    self.gate = gate
+    self.running = self.max_running = 0
+    self.cancelled = False
+
+  async def aserve(self, query, thread_id=None):
+    self.running += 1
+    self.max_running = max(self.max_running, self.running)
+    try:
+      if self.gate is not None:
+        await self.gate.wait()
+      return query.upper(), {}
+    except asyncio.CancelledError:
+      self.cancelled = True
+      raise
+    finally:
+      self.running -= 1
+
+  async def astream(self, query, stream_mode, subgraphs=False, thread_id=None):
+    try:
+      for chunk in self.chunks:
+        yield chunk
+      if self.gate is not None:
+        await self.gate.wait()
+    except asyncio.CancelledError:
+      self.cancelled = True
+      raise
+    if self.error is not None:
+      raise self.error
+
+
+def _events(body: str) -> list:
+  """Parse an SSE body into (event, data) pairs."""
+  events = []
+  for block in body.replace("\r\n", "\n").strip().split("\n\n"):
+    fields = dict(line.split(": ", 1) if ": " in line else (line.rstrip(":"), "") for line in block.split("\n"))
+    events.append((fields.get("event"), fields.get("data", "")))
+  return events
+
+
+def _body(query: str = "list issues", **kwargs) -> dict:
+  return {"agent_id": "jira", "input": {"query": query}, **kwargs}
+
+
+class TestStatelessRunRoutes(unittest.TestCase):
+
+  def _run(self, fake, scenario, max_concurrent_runs=2):
+    # Each test runs on its own event loop; sse-starlette keeps a module-level event bound to the first one
+    async def runner():
+      app = create_app()
+      with mock.patch.object(JiraGraph, "get_instance", return_value=fake), \
+          mock.patch.object(stateless_runs, "run_slots", asyncio.Semaphore(max_concurrent_runs)), \
+          mock.patch.object(stateless_runs.settings, "JIRA_AGENT_DISCONNECT_POLL_SECONDS", 0.01), \
+          mock.patch.object(AppStatus, "should_exit_event", None):
+        try:
+          async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await scenario(client)
+        finally:
+          await stateless_runs.scheduler.stop()
+    return asyncio.run(runner())
+
+  def test_wait_returns_the_output(self):
+    async def scenario(client):
+      return await client.post("/api/v1/runs/wait", json=_body())
+
+    response = self._run(_FakeGraph(), scenario)
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(response.json()["output"], "LIST ISSUES")
+
+  def test_run_slots_bound_concurrent_runs(self):
+    fake = _FakeGraph(gate=asyncio.Event())
+
+    async def scenario(client):
+      requests = [asyncio.ensure_future(client.post("/api/v1/runs/wait", json=_body(f"q{i}"))) for i in range(3)]
+      await asyncio.sleep(0.05)
+      running = fake.running
+      fake.gate.set()
+      return running, await asyncio.gather(*requests)
+
+    running, responses = self._run(fake, scenario, max_concurrent_runs=1)
+    self.assertEqual(running, 1)
+    self.assertEqual(fake.max_running, 1)
+    self.assertEqual([response.json()["output"] for response in responses], ["Q0", "Q1", "Q2"])
+
+  def test_client_disconnect_cancels_the_run(self):
+    fake = _FakeGraph(gate=asyncio.Event())
+
+    async def scenario(client):
+      request = mock.Mock(is_disconnected=mock.AsyncMock(return_value=True))
+      record = stateless_runs.submit_run(RunCreateStateless(**_body()))
+      with self.assertRaises(HTTPException) as raised:
+        await stateless_runs.wait_for_run(request, record, None)
+      await asyncio.sleep(0)
+      return raised.exception, record
+
+    error, record = self._run(fake, scenario)
+    self.assertEqual(error.status_code, stateless_runs.HTTP_499_CLIENT_CLOSED_REQUEST)
+    self.assertEqual(record.status, Status.interrupted)
+    self.assertTrue(fake.cancelled)
+
+  def test_stream_frames_events_and_ends(self):
+    fake = _FakeGraph(chunks=[
+      ((), "values", {"messages": []}),
+      (("jira_issues_agent:1",), "updates", {"agent": {"messages": []}}),
+    ])
+
+    async def scenario(client):
+      return await client.post("/api/v1/runs/stream", json=_body(stream_mode=["values", "updates"]))
+
+    response = self._run(fake, scenario)
+    self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+    events = _events(response.text)
+    self.assertEqual([event for event, _ in events], ["metadata", "values", "updates|jira_issues_agent:1", "end"])
+    self.assertIn("run_id", orjson.loads(events[0][1]))
+    self.assertEqual(orjson.loads(events[1][1]), {"messages": []})
+
+  def test_stream_failure_ends_with_an_error_event(self):
+    fake = _FakeGraph(chunks=[((), "values", {"messages": []})], error=RuntimeError("boom"))
+
+    async def scenario(client):
+      return await client.post("/api/v1/runs/stream", json=_body())
+
+    events = _events(self._run(fake, scenario).text)
+    self.assertEqual([event for event, _ in events], ["metadata", "values", "error"])
+    self.assertEqual(orjson.loads(events[-1][1])["error"], "InternalError")
+    self.assertNotIn("boom", events[-1][1])
+
+  def test_unsupported_stream_mode_is_rejected(self):
+    async def scenario(client):
+      return await client.post("/api/v1/runs/stream", json=_body(stream_mode="events"))
+
+    self.assertEqual(self._run(_FakeGraph(), scenario).status_code, 422)
+
+  def test_cancelled_stream_releases_its_run_slot(self):
+    fake = _FakeGraph(chunks=[((), "values", {})], gate=asyncio.Event())
+
+    async def scenario(client):
+      events = []
+
+      async def consume():
+        async for event in stateless_runs.stream_run_events("list issues", ["values"]):
+          events.append(event["event"])
+
+      task = asyncio.create_task(consume())
+      await asyncio.sleep(0.01)
+      task.cancel()
+      with self.assertRaises(asyncio.CancelledError):
+        await task
+      return events, stateless_runs.run_slots.locked()
+
+    events, locked = self._run(fake, scenario, max_concurrent_runs=1)
+    self.assertEqual(events, ["metadata", "values"])
+    self.assertTrue(fake.cancelled)
+    self.assertFalse(locked)
+
+
+if __name__ == "__main__":
+  unittest.main()
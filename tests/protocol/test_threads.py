@@ -0,0 +1,247 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+from fastapi import HTTPException
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from jira_agent.graph.graph import JiraGraph
+from jira_agent.main import create_app
+from jira_agent.models.models import MultitaskStrategy, RunCreateStateful, Status
+from jira_agent.models.models import Status1 as ThreadStatus
+from jira_agent.protocol.ap.api.routes import stateless_runs
+from jira_agent.protocol.ap.api.routes import threads as threads_routes
+from jira_agent.protocol.ap.api.scheduler import RunRecord, RunScheduler
+from jira_agent.protocol.ap.api.threads import ThreadExists, ThreadNotFound, ThreadStore
+
+
+def _count_messages(state: MessagesState) -> dict:
+  return {"messages": [AIMessage(content=f"seen {len(state['messages'])}")]}
+
+
+class TestThreadStore(unittest.TestCase):
+
+  def setUp(self):
+    self.store = ThreadStore(":memory:")
+
+  def test_create_get_and_delete(self):
+    thread = self.store.create(metadata={"team": "infra"})
+    self.assertEqual(self.store.get(thread["thread_id"]), thread)
+    self.assertEqual(thread["status"], ThreadStatus.idle.value)
+
+    with self.assertRaises(ThreadExists):
+      self.store.create(thread["thread_id"])
+    self.assertEqual(self.store.create(thread["thread_id"], if_exists="do_nothing"), thread)
+
+    self.store.delete(thread["thread_id"])
+    with self.assertRaises(ThreadNotFound):
+      self.store.get(thread["thread_id"])
+
+  def test_search_filters_on_metadata_and_status(self):
+    infra = self.store.create(metadata={"team": "infra"})
+    self.store.create(metadata={"team": "web"})
+    self.store.set_status(infra["thread_id"], ThreadStatus.busy)
+
+    self.assertEqual([t["thread_id"] for t in self.store.search(metadata={"team": "infra"})], [infra["thread_id"]])
+    self.assertEqual(len(self.store.search(status=ThreadStatus.busy.value)), 1)
+    self.assertEqual(len(self.store.search(limit=1)), 1)
+
+  def test_mark_busy_only_claims_threads_without_a_run(self):
+    thread = self.store.create()["thread_id"]
+
+    self.assertTrue(self.store.mark_busy(thread))
+    self.assertFalse(self.store.mark_busy(thread))
+    self.assertEqual(self.store.get(thread)["status"], ThreadStatus.busy.value)
+    self.assertFalse(self.store.mark_busy("unknown"))
+
+
+class TestThreadRoutes(unittest.TestCase):
+
+  def setUp(self):
+    self.store = ThreadStore(":memory:")
+    self.thread = self.store.create()["thread_id"]
+
+  def _request(self, method, path, **kwargs):
+    async def runner():
+      async with httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app()), base_url="http://test") as client:
+        return await client.request(method, f"/api/v1/threads/{self.thread}{path}", **kwargs)
+
+    with mock.patch.object(threads_routes, "get_thread_store", return_value=self.store), \
+        mock.patch.object(JiraGraph, "get_instance") as get_instance:
+      get_instance.return_value.adelete_thread = mock.AsyncMock()
+      try:
+        return asyncio.run(runner())
+      finally:
+        asyncio.run(stateless_runs.scheduler.stop())
+
+  def test_streamed_run_blocks_delete_and_scheduled_runs(self):
+    # A streamed run only marks its thread busy, the scheduler does not know about it
+    self.store.set_status(self.thread, ThreadStatus.busy)
+    body = {"input": {"query": "list issues"}, "multitask_strategy": "interrupt"}
+
+    self.assertEqual(self._request("DELETE", "").status_code, 409)
+    self.assertEqual(self._request("POST", "/runs/wait", json=body).status_code, 409)
+    self.assertEqual(self._request("POST", "/runs", json=body).status_code, 409)
+
+    self.store.set_status(self.thread, ThreadStatus.idle)
+    self.assertEqual(self._request("DELETE", "").status_code, 204)
+    with self.assertRaises(ThreadNotFound):
+      self.store.get(self.thread)
+
+  def test_streamed_run_claims_the_thread_before_streaming(self):
+    body = RunCreateStateful.model_validate({"agent_id": "jira", "input": {"query": "list issues"}})
+
+    async def runner():
+      response = await threads_routes.stream_run_threads_thread_id_runs_stream_post(self.thread, body)
+      # The stream has not started, yet a concurrent request is already turned away
+      self.assertEqual(self.store.get(self.thread)["status"], ThreadStatus.busy.value)
+      with self.assertRaises(HTTPException) as raised:
+        await threads_routes.stream_run_threads_thread_id_runs_stream_post(self.thread, body)
+      self.assertEqual(raised.exception.status_code, 409)
+      await response.body_iterator.aclose()
+
+    with mock.patch.object(threads_routes, "get_thread_store", return_value=self.store):
+      asyncio.run(runner())
+
+  def test_failed_stream_marks_the_thread_in_error(self):
+    async def stream_run_events(query, stream_modes, thread_id=None):
+      yield {"event": "values", "data": "{}"}
+      raise RuntimeError("connection reset")
+
+    async def runner():
+      return [event async for event in threads_routes.stream_thread_run_events(self.thread, "list issues", ["values"])]
+
+    self.store.mark_busy(self.thread)
+    with mock.patch.object(threads_routes, "get_thread_store", return_value=self.store), \
+        mock.patch.object(threads_routes, "stream_run_events", stream_run_events):
+      with self.assertRaises(RuntimeError):
+        asyncio.run(runner())
+
+    self.assertEqual(self.store.get(self.thread)["status"], ThreadStatus.error.value)
+
+  def test_thread_deleted_during_a_run_keeps_the_result(self):
+    async def aserve(query, thread_id=None):
+      self.store.delete(thread_id)
+      return query.upper(), {}
+
+    with mock.patch.object(threads_routes, "get_thread_store", return_value=self.store), \
+        mock.patch.object(JiraGraph, "get_instance") as get_instance:
+      get_instance.return_value.aserve = aserve
+      result = asyncio.run(threads_routes.execute_thread_run(self.thread, "list issues"))
+
+    self.assertEqual(result, "LIST ISSUES")
+
+
+class TestThreadRuns(unittest.TestCase):
+
+  def setUp(self):
+    directory = tempfile.TemporaryDirectory()
+    self.addCleanup(directory.cleanup)
+    patcher = mock.patch.dict(os.environ, {"JIRA_AGENT_CHECKPOINT_SQLITE_PATH": os.path.join(directory.name, "t.sqlite")})
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+    self.gate = None
+    builder = StateGraph(MessagesState)
+    builder.add_node("agent", _count_messages)
+    builder.add_node("hold", self._hold)
+    builder.add_edge(START, "agent")
+    builder.add_edge("agent", "hold")
+    builder.add_edge("hold", END)
+    # A JiraGraph around a stub workflow, without building the agents
+    self.graph = object.__new__(JiraGraph)
+    self.graph.workflow, self.graph.checkpointer, self.graph.graph = builder, None, builder.compile()
+    self.graph.thread_checkpointer, self.graph._thread_graph, self.graph._thread_lock = None, None, threading.Lock()
+    self.addCleanup(lambda: self.graph.thread_checkpointer and self.graph.thread_checkpointer.close())
+
+  async def _hold(self, state: MessagesState) -> dict:
+    # Lets a test keep a run going after its first step has been checkpointed
+    if self.gate is not None:
+      self.holding.set()
+      await self.gate.wait()
+    return {}
+
+  def test_follow_up_runs_see_the_conversation(self):
+    async def scenario():
+      first, _ = await self.graph.aserve("create a bug", thread_id="t1")
+      follow_up, _ = await self.graph.aserve("now assign it to Bob", thread_id="t1")
+      stateless, _ = await self.graph.aserve("now assign it to Bob")
+      history = await self.graph.aget_thread_history("t1")
+      return first, follow_up, stateless, history
+
+    first, follow_up, stateless, history = asyncio.run(scenario())
+    self.assertEqual((first, follow_up, stateless), ("seen 1", "seen 3", "seen 1"))
+    self.assertGreater(len(history), 2)
+    # The run flushed its checkpoints, nothing is left buffered
+    self.assertEqual(self.graph.thread_checkpointer._pending_checkpoints, [])
+
+  def test_deleted_threads_start_over(self):
+    async def scenario():
+      await self.graph.aserve("create a bug", thread_id="t1")
+      await self.graph.adelete_thread("t1")
+      return await self.graph.aserve("create a bug", thread_id="t1")
+
+    self.assertEqual(asyncio.run(scenario())[0], "seen 1")
+
+  def test_rollback_restores_the_thread(self):
+    store = ThreadStore(":memory:")
+    store.create("t1")
+
+    async def submit(scheduler, query, strategy=MultitaskStrategy.reject):
+      executor, rollback = threads_routes.thread_run_callbacks("t1")
+      return scheduler.submit(
+        RunRecord(query=query, thread_id="t1", multitask_strategy=strategy, executor=executor, rollback=rollback)
+      )
+
+    async def scenario():
+      scheduler = RunScheduler(None, workers=1, max_queued=4, history_size=10)
+      try:
+        await scheduler.wait((await submit(scheduler, "create a bug")).run_id)
+        before = await self.graph.aget_thread_state("t1")
+
+        self.gate, self.holding = asyncio.Event(), asyncio.Event()
+        interrupted = await submit(scheduler, "close it")
+        await self.holding.wait()
+        rollback = await submit(scheduler, "reopen it", MultitaskStrategy.rollback)
+        self.gate.set()
+        await scheduler.wait(rollback.run_id)
+        return before, interrupted, rollback, await self.graph.aget_thread_history("t1", limit=100)
+      finally:
+        await scheduler.stop()
+
+    with mock.patch.object(threads_routes, "get_thread_store", return_value=store), \
+        mock.patch.object(JiraGraph, "get_instance", return_value=self.graph):
+      before, interrupted, rollback, history = asyncio.run(scenario())
+
+    self.assertEqual(interrupted.status, Status.interrupted)
+    # The interrupted run left nothing behind: the next run continues from the first one
+    self.assertEqual(rollback.output, "seen 3")
+    self.assertEqual(
+      [message.content for message in history[0].values["messages"]],
+      ["create a bug", "seen 1", "reopen it", "seen 3"],
+    )
+    self.assertNotIn("close it", [m.content for state in history for m in state.values.get("messages", [])])
+    self.assertIn(before.config["configurable"]["checkpoint_id"], [state.config["configurable"]["checkpoint_id"] for state in history])
+    self.assertEqual(store.get("t1")["status"], ThreadStatus.idle.value)
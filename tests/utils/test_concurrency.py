@@ -0,0 +1,68 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import contextvars
+import time
+import unittest
+
+from jira_agent.utils.concurrency import agather_calls, amap_calls, gather_calls, map_calls
+
+_marker = contextvars.ContextVar("marker", default=None)
+
+
+def _fail():
+  raise ValueError("boom")
+
+
+class TestConcurrency(unittest.TestCase):
+
+  def test_results_keep_order_and_capture_errors(self):
+    results = gather_calls(lambda: 1, _fail, lambda: 3)
+    self.assertEqual([result.ok for result in results], [True, False, True])
+    self.assertEqual(results[2].unwrap(), 3)
+    with self.assertRaisesRegex(ValueError, "boom"):
+      results[1].unwrap()
+
+  def test_calls_overlap(self):
+    start = time.monotonic()
+    results = map_calls(lambda delay: time.sleep(delay) or delay, [0.2, 0.2, 0.2])
+    self.assertLess(time.monotonic() - start, 0.5)
+    self.assertEqual([result.value for result in results], [0.2, 0.2, 0.2])
+
+  def test_context_is_propagated_to_workers(self):
+    _marker.set("run-1")
+    self.assertEqual([result.value for result in gather_calls(_marker.get, _marker.get)], ["run-1", "run-1"])
+
+  def test_async_calls_overlap_and_capture_errors(self):
+    async def slow(delay):
+      await asyncio.sleep(delay)
+      return delay
+
+    async def failing():
+      raise ValueError("boom")
+
+    async def run():
+      start = time.monotonic()
+      results = await amap_calls(slow, [0.2, 0.2, 0.2])
+      elapsed = time.monotonic() - start
+      return results, elapsed, await agather_calls(failing, lambda: slow(0))
+
+    results, elapsed, mixed = asyncio.run(run())
+    self.assertLess(elapsed, 0.5)
+    self.assertEqual([result.value for result in results], [0.2, 0.2, 0.2])
+    self.assertEqual([result.ok for result in mixed], [False, True])
@@ -0,0 +1,91 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+from unittest import mock
+
+from jira_agent.utils.cache import MISSING, TTLCache
+from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.jira_client.identity import IdentityCache
+
+
+def _test_config(**overrides) -> JiraConfig:
+  values = {
+    "JIRA_INSTANCE": "https://mock.jira.instance.test",
+    "JIRA_USERNAME": "user@example.com",
+    "JIRA_API_TOKEN": "token",
+  }
+  values.update(overrides)
+  return JiraConfig(**values)
+
+
+class TestTTLCache(unittest.TestCase):
+
+  def test_entries_expire(self):
+    cache = TTLCache(maxsize=10, ttl=60)
+    with mock.patch("jira_agent.utils.cache.time.monotonic", return_value=100.0):
+      cache.set("a", 1)
+      cache.set("b", None, ttl=5)
+      self.assertEqual(cache.lookup("a"), 1)
+      self.assertIsNone(cache.lookup("b"))
+    with mock.patch("jira_agent.utils.cache.time.monotonic", return_value=110.0):
+      self.assertEqual(cache.lookup("a"), 1)
+      self.assertIs(cache.lookup("b"), MISSING)
+    self.assertEqual(cache.stats(), {"hits": 3, "misses": 1, "evictions": 0, "expirations": 1, "size": 1})
+
+  def test_least_recently_used_is_evicted(self):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.lookup("a")
+    cache.set("c", 3)
+    self.assertIs(cache.lookup("b"), MISSING)
+    self.assertEqual(cache.lookup("a"), 1)
+    self.assertEqual(cache.stats()["evictions"], 1)
+
+
+class TestIdentityCache(unittest.TestCase):
+
+  def setUp(self):
+    IdentityCache.reset()
+    IdentityCache.get_cache(_test_config())
+
+  def tearDown(self):
+    IdentityCache.reset()
+
+  def test_resolution_is_cached_per_email(self):
+    lookup = mock.Mock(return_value="abc-123")
+    self.assertEqual(IdentityCache.resolve("User@Example.com", lookup), "abc-123")
+    self.assertEqual(IdentityCache.resolve("user@example.com ", lookup), "abc-123")
+    lookup.assert_called_once()
+    self.assertEqual(IdentityCache.stats()["hits"], 1)
+
+  def test_unknown_user_is_cached(self):
+    lookup = mock.Mock(return_value="")
+    self.assertIsNone(IdentityCache.resolve("ghost@example.com", lookup))
+    self.assertIsNone(IdentityCache.resolve("ghost@example.com", lookup))
+    lookup.assert_called_once()
+
+  def test_errors_are_not_cached(self):
+    lookup = mock.Mock(side_effect=[Exception("503"), "abc-123"])
+    with self.assertRaises(Exception):
+      IdentityCache.resolve("user@example.com", lookup)
+    self.assertEqual(IdentityCache.resolve("user@example.com", lookup), "abc-123")
+
+
+if __name__ == "__main__":
+  unittest.main()
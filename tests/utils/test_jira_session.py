@@ -0,0 +1,52 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.jira_client.session import JiraSession
+
+
+def _test_config(**overrides) -> JiraConfig:
+  values = {
+    "JIRA_INSTANCE": "https://mock.jira.instance.test",
+    "JIRA_USERNAME": "user@example.com",
+    "JIRA_API_TOKEN": "token",
+  }
+  values.update(overrides)
+  return JiraConfig(**values)
+
+
+class TestJiraSession(unittest.TestCase):
+
+  def tearDown(self):
+    JiraSession.close()
+
+  def test_session_is_shared(self):
+    config = _test_config()
+    self.assertIs(JiraSession.get_session(config), JiraSession.get_session(config))
+
+  def test_pool_and_timeouts_follow_config(self):
+    config = _test_config(JIRA_HTTP_POOL_MAXSIZE=7, JIRA_HTTP_CONNECT_TIMEOUT=1.5, JIRA_HTTP_READ_TIMEOUT=9)
+    session = JiraSession.get_session(config)
+    adapter = session.get_adapter("https://mock.jira.instance.test/rest/api/3/project")
+    self.assertEqual(adapter._pool_maxsize, 7)
+    self.assertEqual(JiraSession.get_timeout(), (1.5, 9.0))
+
+  def test_close_drops_session(self):
+    first = JiraSession.get_session(_test_config())
+    JiraSession.close()
+    self.assertIsNot(first, JiraSession.get_session(_test_config()))
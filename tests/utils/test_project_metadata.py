@@ -0,0 +1,105 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import asyncio
+import unittest
+from unittest import mock
+
+from jira_agent.utils.jira_client.config import JiraConfig
+from jira_agent.utils.jira_client.project_metadata import ProjectMetadata, ProjectMetadataCache
+
+CREATEMETA = {
+  "projects": [{
+    "key": "PROJ",
+    "issuetypes": [
+      {
+        "name": "Bug",
+        "fields": {
+          "summary": {"name": "Summary", "required": True, "schema": {"type": "string"}},
+          "priority": {
+            "name": "Priority",
+            "required": False,
+            "schema": {"type": "priority"},
+            "allowedValues": [{"name": "High", "id": "1"}, {"name": "Low", "id": "2"}],
+          },
+        },
+      },
+      {"name": "Task", "fields": {}},
+    ],
+  }]
+}
+
+
+def _test_config(**overrides) -> JiraConfig:
+  values = {
+    "JIRA_INSTANCE": "https://mock.jira.instance.test",
+    "JIRA_USERNAME": "user@example.com",
+    "JIRA_API_TOKEN": "token",
+  }
+  values.update(overrides)
+  return JiraConfig(**values)
+
+
+class TestProjectMetadataCache(unittest.TestCase):
+
+  def setUp(self):
+    ProjectMetadataCache.reset()
+    ProjectMetadataCache.get_cache(_test_config())
+
+  def tearDown(self):
+    ProjectMetadataCache.reset()
+
+  def test_createmeta_is_parsed(self):
+    metadata = ProjectMetadata.from_createmeta("PROJ", CREATEMETA)
+    self.assertEqual(metadata.issue_types, ["Bug", "Task"])
+    self.assertEqual(metadata.required_fields("Bug"), ["summary"])
+    self.assertEqual(metadata.fields["Bug"]["priority"]["allowedValues"], ["High", "Low"])
+
+  def test_metadata_is_fetched_once(self):
+    fetch = mock.Mock(return_value=CREATEMETA)
+    ProjectMetadataCache.get("PROJ", fetch)
+    metadata = ProjectMetadataCache.get("proj", fetch)
+    fetch.assert_called_once_with("PROJ")
+    self.assertEqual(metadata.issue_types, ["Bug", "Task"])
+
+  def test_invalidate_forces_fetch(self):
+    fetch = mock.Mock(return_value=CREATEMETA)
+    ProjectMetadataCache.get("PROJ", fetch)
+    ProjectMetadataCache.invalidate("PROJ")
+    ProjectMetadataCache.get("PROJ", fetch)
+    self.assertEqual(fetch.call_count, 2)
+
+  def test_stale_metadata_is_served_while_refreshing(self):
+    ProjectMetadataCache.reset()
+    ProjectMetadataCache.get_cache(_test_config(JIRA_PROJECT_METADATA_REFRESH_SECONDS=0))
+    refreshed = {"projects": [{"issuetypes": [{"name": "Story", "fields": {}}]}]}
+    fetch = mock.AsyncMock(side_effect=[CREATEMETA, refreshed])
+
+    async def scenario():
+      await ProjectMetadataCache.aget("PROJ", fetch)
+      stale = await ProjectMetadataCache.aget("PROJ", fetch)
+      await asyncio.gather(*ProjectMetadataCache._background)
+      fresh = await ProjectMetadataCache.aget("PROJ", fetch)
+      return stale, fresh
+
+    stale, fresh = asyncio.run(scenario())
+    self.assertEqual(stale.issue_types, ["Bug", "Task"])
+    self.assertEqual(fresh.issue_types, ["Story"])
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,116 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import unittest
+from unittest import mock
+
+from jira_agent.utils.jira_client.resilience import (
+  CircuitBreaker,
+  CircuitOpenError,
+  RetryPolicy,
+  TokenBucket,
+  endpoint_class,
+  parse_retry_after,
+)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+  def setUp(self):
+    self.policy = RetryPolicy(max_retries=3, backoff_base=0.5, backoff_max=30.0)
+
+  def test_gets_are_retried_on_transient_failures(self):
+    for status_code in (429, 502, 503, 504):
+      self.assertIsNotNone(self.policy.retry_delay("GET", 0, status_code))
+    self.assertIsNotNone(self.policy.retry_delay("GET", 0, error="transport"))
+    self.assertIsNone(self.policy.retry_delay("GET", 0, 404))
+
+  def test_posts_are_only_retried_when_unprocessed(self):
+    self.assertIsNotNone(self.policy.retry_delay("POST", 0, 429))
+    self.assertIsNotNone(self.policy.retry_delay("POST", 0, error="connect"))
+    self.assertIsNone(self.policy.retry_delay("POST", 0, 503))
+    self.assertIsNone(self.policy.retry_delay("POST", 0, error="transport"))
+
+  def test_retries_are_bounded(self):
+    self.assertIsNone(self.policy.retry_delay("GET", 3, 503))
+
+  def test_backoff_is_jittered_and_capped(self):
+    with mock.patch("random.uniform", side_effect=lambda low, high: high):
+      self.assertEqual(self.policy.retry_delay("GET", 0, 503), 0.5)
+      self.assertEqual(self.policy.retry_delay("GET", 2, 503), 2.0)
+      self.assertEqual(RetryPolicy(10, 0.5, 30.0).retry_delay("GET", 9, 503), 30.0)
+
+  def test_retry_after_is_honoured(self):
+    self.assertEqual(self.policy.retry_delay("GET", 0, 429, "7"), 7.0)
+    self.assertIsNone(self.policy.retry_delay("GET", 0, 429, "120"))
+    self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+    self.assertIsNone(parse_retry_after("soon"))
+
+
+class TestTokenBucket(unittest.TestCase):
+
+  def test_burst_then_wait(self):
+    bucket = TokenBucket(rate=10, capacity=2)
+    with mock.patch("time.monotonic", return_value=100.0):
+      bucket._updated = 100.0
+      self.assertEqual(bucket.reserve(), 0.0)
+      self.assertEqual(bucket.reserve(), 0.0)
+      self.assertAlmostEqual(bucket.reserve(), 0.1)
+      self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+  def test_disabled_bucket_never_waits(self):
+    bucket = TokenBucket(rate=0, capacity=1)
+    self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+  def setUp(self):
+    self.now = 100.0
+    patcher = mock.patch("time.monotonic", side_effect=lambda: self.now)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    self.breaker = CircuitBreaker("issue", failure_threshold=2, reset_timeout=30)
+
+  def test_opens_after_consecutive_failures(self):
+    self.breaker.record(503)
+    self.breaker.record(404)
+    self.breaker.record(error="transport")
+    self.breaker.allow()
+    self.breaker.record(502)
+    with self.assertRaises(CircuitOpenError):
+      self.breaker.allow()
+
+  def test_half_open_probe(self):
+    self.breaker.record(503)
+    self.breaker.record(503)
+    self.now += 31
+    self.breaker.allow()
+    with self.assertRaises(CircuitOpenError):
+      self.breaker.allow()
+    self.breaker.record(503)
+    self.assertEqual(self.breaker.snapshot()["state"], CircuitBreaker.OPEN)
+
+    self.now += 31
+    self.breaker.allow()
+    self.breaker.record(200)
+    self.assertEqual(self.breaker.snapshot(), {"state": CircuitBreaker.CLOSED, "consecutive_failures": 0})
+
+  def test_endpoint_class(self):
+    self.assertEqual(endpoint_class("/rest/api/3/issue/TEST-1/transitions"), "issue")
+    self.assertEqual(endpoint_class("/rest/api/3/project/search?query=x"), "project")
+    self.assertEqual(endpoint_class("/rest/api/2/search"), "search")
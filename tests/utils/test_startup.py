@@ -0,0 +1,51 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+import os
+import unittest
+from pathlib import Path
+
+from jira_agent.utils.startup_profiler import parse_importtime, profile_imports
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+# Generous enough for slow CI machines; importing used to take several seconds
+STARTUP_BUDGET_SECONDS = float(os.getenv("JIRA_AGENT_STARTUP_BUDGET_SECONDS", "2.0"))
+# Only needed once the graph is built, never to start serving
+DEFERRED_MODULES = ("langgraph_supervisor", "langchain_openai", "langchain_anthropic")
+
+
+class TestStartup(unittest.TestCase):
+
+  def test_parse_importtime(self):
+    profile = parse_importtime(
+      "import time: self [us] | cumulative | imported package\n"
+      "import time:       100 |        100 |   orjson\n"
+      "import time:       200 |        300 | jira_agent.main\n",
+      "jira_agent.main",
+    )
+    self.assertEqual(profile.modules, ["orjson", "jira_agent.main"])
+    self.assertAlmostEqual(profile.total_seconds, 0.0003)
+    self.assertEqual(list(profile.by_package()), ["jira_agent", "orjson"])
+
+  def test_main_imports_within_budget(self):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT), str(REPO_ROOT / "jira_agent")])
+    profile = profile_imports("jira_agent.main", env=env)
+
+    loaded = [module for module in DEFERRED_MODULES if module in profile.modules]
+    self.assertEqual(loaded, [], f"Heavy modules imported at startup:\n{profile.report()}")
+    self.assertLess(profile.total_seconds, STARTUP_BUDGET_SECONDS, profile.report())
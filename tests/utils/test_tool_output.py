@@ -0,0 +1,80 @@
+# Copyright 2025 Cisco Systems, Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+
+
+import unittest
+
+from jira_agent.utils.tool_output import ToolOutputEncoding, approximate_tokens, encode_tool_output
+
+
+def _project(index: int) -> dict:
+  return {
+    "id": str(index), "key": f"P{index}", "name": f"Project {index}", "self": f"https://jira/rest/api/3/project/{index}",
+    "avatarUrls": {"48x48": "https://jira/avatar"}, "insight": {"totalIssueCount": 3},
+  }
+
+
+class TestToolOutput(unittest.TestCase):
+  def setUp(self):
+    ToolOutputEncoding.reset()
+
+  def test_whitelisted_fields_as_compact_json(self):
+    output = encode_tool_output("get_jira_project_by_name", _project(1), max_tokens=0)
+    self.assertEqual(
+      output, '{"id":"1","key":"P1","name":"Project 1","self":"https://jira/rest/api/3/project/1"}'
+    )
+
+  def test_empty_values_are_dropped(self):
+    output = encode_tool_output(
+      "get_jira_issue_details", {"key": "A-1", "assignee": None, "description": ""}, prefix="Jira Issue Details:"
+    )
+    self.assertEqual(output, 'Jira Issue Details: {"key":"A-1"}')
+
+  def test_list_is_truncated_with_omitted_note(self):
+    output = encode_tool_output("get_jira_project_by_name", [_project(i) for i in range(50)], max_tokens=100)
+    lines = output.splitlines()
+    self.assertLess(len(lines), 50)
+    self.assertEqual(lines[-1], f"... {50 - (len(lines) - 1)} more results omitted.")
+
+  def test_footer_and_prefix_are_kept(self):
+    links = [f"[A-{i}: summary](https://jira/browse/A-{i})" for i in range(20)]
+    output = encode_tool_output("search_jira_issues_using_jql", links, prefix="Issues:", footer="... and 5 more", max_tokens=30)
+    self.assertTrue(output.startswith("Issues:\n[A-0"))
+    self.assertTrue(output.endswith("more results omitted.\n... and 5 more"))
+
+  def test_large_single_result_is_cut(self):
+    output = encode_tool_output("get_jira_issue_details", {"key": "A-1", "description": "x" * 1000}, max_tokens=50)
+    self.assertIn("characters omitted]", output)
+    self.assertLess(len(output), 300)
+
+  def test_saved_tokens_are_recorded_against_the_baseline(self):
+    projects = [_project(i) for i in range(5)]
+    output = encode_tool_output("get_jira_project_by_name", projects, max_tokens=0, baseline=str(projects))
+    stats = ToolOutputEncoding.stats()["get_jira_project_by_name"]
+    self.assertEqual(stats["calls"], 1)
+    self.assertEqual(stats["truncated"], 0)
+    self.assertEqual(stats["tokens_before"], approximate_tokens(str(projects)))
+    self.assertEqual(stats["tokens_after"], approximate_tokens(output))
+
+  def test_without_a_baseline_nothing_is_saved(self):
+    encode_tool_output("get_jira_transitions", [{"id": "1", "name": "Done"}])
+    stats = ToolOutputEncoding.stats()["get_jira_transitions"]
+    self.assertEqual(stats["tokens_before"], stats["tokens_after"])
+
+
+if __name__ == "__main__":
+  unittest.main()